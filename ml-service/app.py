@@ -3,21 +3,156 @@ Resume Analyzer ML Service
 Main Flask application for resume parsing and analysis
 """
 
-from flask import Flask, request, jsonify
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+
+import numpy as np
+from flask import Flask, Response, request, jsonify, stream_with_context
 from flask_cors import CORS
 
 # Import our custom modules
 from parsers import PDFParser
 from extractors import InformationExtractor
+from pipeline import (
+    BatchParser, InvalidPDFError, parse_resume_cached, is_cacheable,
+    UploadRequest, upload_bytes, upload_source,
+    FieldSelection, compress_response, configure_json,
+    extract_skills_document, stream_skill_extraction, Readiness
+)
+from cache import ParseCache
+from jobs import JobQueue, JobWorkerPool, make_parse_handler
+from matching import HashingTextEncoder, JobIndex, JobIndexSync, JobStore, VectorStore
+from matching.ingest import JobIngestor, build_record
+from config import settings
+from monitoring import REGISTRY, PDF_BYTES, PDF_DOCUMENTS, time_stage
 
 # Initialize Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for Next.js frontend
 
+# Stream uploads to memory/temp files with a per-file size limit, and cap
+# the whole request body (a full batch of maximum-size files)
+app.request_class = UploadRequest
+app.config['MAX_CONTENT_LENGTH'] = settings.UPLOAD_MAX_BYTES * settings.BATCH_MAX_FILES
+
+# Compact JSON (orjson when installed); responses are compressed in after_request
+json_encoder = configure_json(app)
+
 # Initialize parser and extractor
 pdf_parser = PDFParser()
 info_extractor = InformationExtractor()
 
+# Warm-up runs in the background of each serving process; /readyz reports it
+readiness = Readiness(enabled=settings.WEB_WARMUP)
+
+# Process pool for /parse-resumes, started on the first batch request
+batch_parser = BatchParser(
+    max_workers=settings.BATCH_MAX_WORKERS,
+    start_method=settings.BATCH_START_METHOD
+)
+
+# Parse results keyed by PDF content + skills database version
+parse_cache = ParseCache(
+    memory_items=settings.PARSE_CACHE_MEMORY_ITEMS,
+    disk_path=settings.PARSE_CACHE_PATH,
+    disk_max_bytes=settings.PARSE_CACHE_MAX_BYTES
+) if settings.PARSE_CACHE_ENABLED else None
+
+
+# Durable queue and background workers for asynchronous parsing
+job_queue = JobQueue(
+    settings.JOB_QUEUE_PATH,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS
+)
+job_workers = JobWorkerPool(
+    job_queue,
+    make_parse_handler(pdf_parser, info_extractor, parse_cache),
+    workers=settings.JOB_WORKERS,
+    poll_interval=settings.JOB_POLL_INTERVAL,
+    retention_seconds=settings.JOB_RETENTION_SECONDS
+)
+
+
+# Job text vectors for /similar-jobs, memory-mapped and shared by all workers
+text_encoder = HashingTextEncoder(dim=settings.VECTOR_DIM)
+job_vectors = VectorStore(
+    settings.VECTOR_STORE_PATH, dim=settings.VECTOR_DIM
+) if settings.VECTOR_STORE_ENABLED else None
+
+# Job postings are stored durably; each worker process ranks them for
+# /recommend with its own in-memory index, replaying changes from the store
+job_store = JobStore(settings.JOB_STORE_PATH)
+job_index = JobIndex(k1=settings.JOB_INDEX_BM25_K1, b=settings.JOB_INDEX_BM25_B)
+job_index_sync = JobIndexSync(job_store, job_index, interval=settings.JOB_INDEX_SYNC_INTERVAL)
+
+# Bulk NDJSON feeds (/job-postings/ingest), ingested on background threads
+job_ingestor = JobIngestor(
+    job_store,
+    vector_store=job_vectors,
+    workers=settings.INGEST_WORKERS,
+    batch_size=settings.INGEST_BATCH_SIZE,
+    near_duplicate_distance=settings.INGEST_NEAR_DUPLICATE_BITS,
+    start_method=settings.BATCH_START_METHOD
+)
+active_ingests = set()
+active_ingests_lock = threading.Lock()
+
+
+@app.before_request
+def start_background_threads():
+    """Start job workers, the skills watcher and the warm-up lazily in each
+    serving process (threads don't survive fork)"""
+    job_workers.ensure_started()
+    info_extractor.skill_registry.ensure_watching()
+    readiness.ensure_started(pdf_parser, info_extractor, job_index_sync)
+
+
+@app.after_request
+def compress(response):
+    """Compress JSON responses with zstd or gzip when the client accepts it"""
+    return compress_response(response, request.accept_encodings)
+
+
+def cached_parse(pdf, digest=None):
+    """
+    Parse a resume, serving byte-identical repeats from the parse cache
+    
+    Args:
+        pdf: Binary content of PDF file, or path of a spooled upload
+        digest: SHA-256 hex digest of the content, if already known
+        
+    Returns:
+        tuple: (resume data: dict, cache hit: bool)
+    """
+    return parse_resume_cached(
+        pdf, pdf_parser, info_extractor, parse_cache, digest=digest
+    )
+
+
+def run_ingest(ingest_id, path):
+    """
+    Ingest an uploaded feed, then drop the file and refresh the job index
+    
+    Args:
+        ingest_id: Source name of the run
+        path: Uploaded NDJSON file (kept if the run fails, for resuming)
+    """
+    try:
+        with open(path, 'rb') as stream:
+            job_ingestor.run(stream, ingest_id)
+        os.remove(path)
+    except Exception as e:
+        app.logger.error(f"Ingestion of {ingest_id} failed: {str(e)}")
+    finally:
+        with active_ingests_lock:
+            active_ingests.discard(ingest_id)
+        job_index_sync.sync(force=True)
+
 
 @app.route('/', methods=['GET'])
 def home():
@@ -28,7 +163,19 @@ def home():
         "version": "1.0.0",
         "endpoints": {
             "health": "/health",
+            "liveness": "/livez",
+            "readiness": "/readyz",
             "parse_resume": "/parse-resume (POST)",
+            "parse_resumes": "/parse-resumes (POST)",
+            "cache_stats": "/cache/stats",
+            "job_status": "/jobs/<job_id>",
+            "metrics": "/metrics",
+            "job_postings": "/job-postings (POST)",
+            "ingest_job_postings": "/job-postings/ingest (POST)",
+            "recommend": "/recommend (POST)",
+            "similar_jobs": "/similar-jobs (POST)",
+            "match": "/match (POST)",
+            "extract_skills_batch": "/extract-skills/batch (POST)",
         }
     })
 
@@ -42,10 +189,29 @@ def health():
         "modules": {
             "pdf_parser": "active",
             "info_extractor": "active"
-        }
+        },
+        "skills_version": info_extractor.skills_version
     })
 
 
+@app.route('/livez', methods=['GET'])
+def livez():
+    """Liveness probe: the process is up and serving requests"""
+    return jsonify({"status": "alive"})
+
+
+@app.route('/readyz', methods=['GET'])
+def readyz():
+    """
+    Readiness probe: 200 once this process has loaded the stored job
+    postings and finished its warm-up (PyMuPDF and OCR modules loaded,
+    Tesseract probed, extractors run), 503 while it is still warming up
+    """
+    status = readiness.status()
+    status['status'] = 'ready' if status['ready'] else 'warming_up'
+    return jsonify(status), 200 if status['ready'] else 503
+
+
 @app.route('/parse-resume', methods=['POST'])
 def parse_resume():
     """
@@ -53,24 +219,52 @@ def parse_resume():
     
     Request:
         - file: PDF file (multipart/form-data)
+        - async: optional query flag; when true the resume is queued and
+                 the response (202) carries a job_id to poll at /jobs/<job_id>
+        - fields: optional comma-separated list of data fields to return
+        - include_text: optional query flag (default true); false leaves
+                        raw_text/full_text out of the response
     
     Response:
         - success: bool
-        - data: dict with extracted information
+        - data: dict with extracted information (selected fields only)
+        - cached: bool, whether the result came from the parse cache
+        - truncated: bool, whether pages were left out because the PDF
+                     exceeded the page, pixel or time budget (data.truncation
+                     lists the reasons and pages)
         - message: str
     """
     
-    print(f"🔍 Parse Resume Request - Files: {list(request.files.keys())}")
+    # Reject oversized uploads before reading the body
+    if request.content_length and request.content_length > settings.UPLOAD_MAX_BYTES + 64 * 1024:
+        return jsonify({
+            'success': False,
+            'error': f'File too large (max {settings.UPLOAD_MAX_BYTES} bytes)'
+        }), 413
+    
+    # Multipart parsing streams the upload to memory or a temp file
+    with time_stage('upload_read'):
+        uploaded_files = request.files
+    
+    print(f"🔍 Parse Resume Request - Files: {list(uploaded_files.keys())}")
+    
+    try:
+        selection = FieldSelection.from_args(request.args)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
     
     # Validate request
-    if 'file' not in request.files:
+    if 'file' not in uploaded_files:
         print("❌ No file in request")
         return jsonify({
             'success': False,
             'error': 'No file provided'
         }), 400
     
-    file = request.files['file']
+    file = uploaded_files['file']
     print(f"📄 File received: {file.filename}, size: {file.content_length}")
     
     # Check if file is empty
@@ -90,67 +284,53 @@ def parse_resume():
         }), 400
     
     try:
-        # Read PDF bytes
-        pdf_bytes = file.read()
-        print(f"📊 PDF bytes read: {len(pdf_bytes)} bytes")
+        # Upload was streamed to memory or a temp file while the form was parsed
+        pdf_source, pdf_size, pdf_digest = upload_source(file)
+        print(f"📊 PDF bytes received: {pdf_size} bytes")
+        PDF_BYTES.inc(pdf_size, endpoint='parse_resume')
+        PDF_DOCUMENTS.inc(endpoint='parse_resume')
         
-        # Validate PDF
-        print("🔍 Validating PDF...")
-        is_valid, validation_message = pdf_parser.validate_pdf(pdf_bytes)
-        if not is_valid:
-            print(f"❌ PDF validation failed: {validation_message}")
+        # Async mode: queue the job and return immediately
+        if request.args.get('async', '').lower() in ('1', 'true', 'yes'):
+            if not pdf_size:
+                return jsonify({
+                    'success': False,
+                    'error': 'PDF validation failed: Empty file'
+                }), 400
+            
+            job_id = job_queue.submit(file.filename, upload_bytes(file))
+            job_workers.notify()
+            print(f"📥 Queued parse job {job_id}")
+            
             return jsonify({
-                'success': False,
-                'error': f'PDF validation failed: {validation_message}'
-            }), 400
+                'success': True,
+                'job_id': job_id,
+                'status': 'queued',
+                'status_url': f'/jobs/{job_id}',
+                'message': 'Resume queued for parsing'
+            }), 202
         
-        print("✅ PDF validation passed")
+        # Validate, extract text and structured information
+        response_data, cached = cached_parse(pdf_source, pdf_digest)
         
-        # Extract text from PDF
-        print("📝 Extracting text from PDF...")
-        full_text = pdf_parser.extract_text(pdf_bytes)
-        print(f"📄 Extracted text length: {len(full_text)} characters")
-        
-        # Extract structured information
-        extracted_info = info_extractor.extract_all(full_text)
-        
-        # Prepare response with all extracted data
-        response_data = {
-            'raw_text': full_text[:2000],  # First 2000 chars for preview
-            'full_text': full_text,  # Complete text
-            'text_length': len(full_text),
-            'word_count': len(full_text.split()),
-            
-            # Personal Information
-            'name': extracted_info['name'],
-            'email': extracted_info['email'],
-            'phone': extracted_info['phone'],
-            'location': extracted_info['location'],
-            
-            # Skills
-            'skills': extracted_info['skills'],
-            'total_skills': len(extracted_info['skills']),
-            
-            # Education
-            'education': extracted_info['education'],
-            
-            # Experience
-            'experience': extracted_info['experience'],
-            'years_of_experience': extracted_info['years_of_experience'],
-            
-            # Certifications
-            'certifications': extracted_info['certifications'],
-            
-            # URLs/Links
-            'urls': extracted_info['urls'],
-        }
+        truncation = response_data.get('truncation')
         
         return jsonify({
             'success': True,
-            'data': response_data,
-            'message': 'Resume parsed successfully'
+            'data': selection.apply(response_data),
+            'cached': cached,
+            'truncated': truncation is not None,
+            'message': 'Resume parsed successfully' if truncation is None else
+                       f"Resume parsed partially ({', '.join(truncation['reasons'])}): "
+                       f"pages {truncation['skipped_pages']} were not read"
         }), 200
         
+    except InvalidPDFError as e:
+        return jsonify({
+            'success': False,
+            'error': f'PDF validation failed: {str(e)}'
+        }), 400
+        
     except Exception as e:
         error_msg = f"Error parsing resume: {str(e)}"
         print(f"❌ {error_msg}")
@@ -161,6 +341,125 @@ def parse_resume():
         }), 500
 
 
+@app.route('/parse-resumes', methods=['POST'])
+def parse_resumes():
+    """
+    Batch endpoint: Parse many resumes in parallel worker processes
+    
+    Request:
+        - files: PDF files (multipart/form-data, repeated 'files' field)
+        - fields / include_text: optional field selection (as /parse-resume)
+    
+    Response:
+        - success: bool
+        - results: list of per-file results in upload order
+                   ({filename, success, data} or {filename, success, error})
+        - total / succeeded / failed: counts
+    """
+    with time_stage('upload_read'):
+        files = request.files.getlist('files')
+    print(f"🔍 Batch Parse Request - {len(files)} files")
+    
+    try:
+        selection = FieldSelection.from_args(request.args)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    if not files:
+        return jsonify({
+            'success': False,
+            'error': 'No files provided'
+        }), 400
+    
+    if len(files) > settings.BATCH_MAX_FILES:
+        return jsonify({
+            'success': False,
+            'error': f'Too many files: {len(files)} (max {settings.BATCH_MAX_FILES})'
+        }), 400
+    
+    results = [None] * len(files)
+    skills_version = info_extractor.skills_version
+    documents = []
+    positions = []
+    cache_keys = []
+    
+    for position, file in enumerate(files):
+        if file.filename == '':
+            results[position] = {
+                'filename': file.filename,
+                'success': False,
+                'error': 'Empty filename'
+            }
+        elif not file.filename.lower().endswith('.pdf'):
+            results[position] = {
+                'filename': file.filename,
+                'success': False,
+                'error': f'Only PDF files are supported. Received: {file.filename}'
+            }
+        else:
+            pdf_source, pdf_size, pdf_digest = upload_source(file)
+            PDF_BYTES.inc(pdf_size, endpoint='parse_resumes')
+            PDF_DOCUMENTS.inc(endpoint='parse_resumes')
+            
+            # Byte-identical repeats are answered from the parse cache
+            if parse_cache is not None:
+                if pdf_digest is None:
+                    cache_key = ParseCache.make_key(pdf_source, skills_version)
+                else:
+                    cache_key = ParseCache.key_for_digest(pdf_digest, skills_version)
+                cached_data = parse_cache.get(cache_key)
+                if cached_data is not None:
+                    results[position] = {
+                        'filename': file.filename,
+                        'success': True,
+                        'data': cached_data,
+                        'cached': True
+                    }
+                    continue
+                cache_keys.append(cache_key)
+            
+            documents.append((file.filename, pdf_source))
+            positions.append(position)
+    
+    try:
+        parsed = batch_parser.parse_many(documents) if documents else []
+    except Exception as e:
+        error_msg = f"Error parsing resume batch: {str(e)}"
+        print(f"❌ {error_msg}")
+        app.logger.error(error_msg)
+        return jsonify({
+            'success': False,
+            'error': f'Failed to parse resumes: {str(e)}'
+        }), 500
+    
+    for index, (position, result) in enumerate(zip(positions, parsed)):
+        if result['success']:
+            result['cached'] = False
+            # Pool workers reload on their own schedule; only cache results
+            # parsed with the vocabulary the key was built for
+            if parse_cache is not None and is_cacheable(result['data'], skills_version):
+                parse_cache.put(cache_keys[index], result['data'])
+        results[position] = result
+    
+    succeeded = sum(1 for result in results if result['success'])
+    print(f"✅ Batch parsed: {succeeded}/{len(results)} succeeded")
+    
+    for result in results:
+        if result['success']:
+            result['data'] = selection.apply(result['data'])
+    
+    return jsonify({
+        'success': True,
+        'results': results,
+        'total': len(results),
+        'succeeded': succeeded,
+        'failed': len(results) - succeeded
+    }), 200
+
+
 @app.route('/extract-skills', methods=['POST'])
 def extract_skills_only():
     """
@@ -168,9 +467,11 @@ def extract_skills_only():
     
     Request:
         - text: Resume text content (JSON)
+        - fuzzy: optional bool; also match OCR-style misspellings
     
     Response:
-        - skills: list of found skills
+        - skills: list of found canonical skills (aliases resolved)
+        - categories: dict of category -> skills
     """
     try:
         data = request.get_json()
@@ -181,22 +482,578 @@ def extract_skills_only():
                 'error': 'No text provided'
             }), 400
         
-        text = data['text']
-        skills = info_extractor.extract_skills(text)
+        response = {
+            'success': True,
+            **extract_skills_document(
+                info_extractor, data['text'], fuzzy=bool(data.get('fuzzy'))
+            )
+        }
+        return jsonify(response), 200
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+
+@app.route('/extract-skills/batch', methods=['POST'])
+def extract_skills_batch():
+    """
+    Extract skills from a stream of documents
+    
+    Request:
+        - body: NDJSON, one document per line: {"text": ..., "id": ...,
+                "fuzzy": ...} (id and fuzzy optional) or a JSON string
+        - fuzzy: optional query parameter, default for documents without
+                 a fuzzy field
+    
+    Response (application/x-ndjson, streamed):
+        - one line per document, in order: line (input line number), id
+          when given, and the /extract-skills fields (skills, count,
+          categories, fuzzy_skills), or line and error for an unreadable
+          document
+    
+    Documents are read and results written back one chunk at a time, so
+    backfills can send millions of documents in a single request.
+    """
+    fuzzy = request.args.get('fuzzy', 'false').lower() in ('1', 'true', 'yes')
+    
+    results = stream_skill_extraction(
+        request.stream,
+        info_extractor,
+        chunk_size=settings.EXTRACT_SKILLS_CHUNK_SIZE,
+        max_line_bytes=settings.EXTRACT_SKILLS_MAX_LINE_BYTES,
+        fuzzy=fuzzy,
+        loads=app.json.loads,
+        dumps=app.json.dumps
+    )
+    return Response(stream_with_context(results), mimetype='application/x-ndjson')
+
+
+@app.route('/job-postings', methods=['POST'])
+def add_job_postings():
+    """
+    Store and index job postings for /recommend and /similar-jobs
+    
+    Request (JSON):
+        - jobs: list of postings, each with id and description plus any
+                other fields (title, company, location, url, ...) to be
+                returned with recommendations; an existing id is replaced
+    
+    Response:
+        - indexed: number of postings indexed
+        - total_jobs: postings in the index
+    
+    Postings are stored as given; bulk feeds go to /job-postings/ingest,
+    which also drops duplicates.
+    """
+    data = request.get_json(silent=True)
+    postings = data.get('jobs') if isinstance(data, dict) else None
+    
+    if not isinstance(postings, list) or not postings:
+        return jsonify({
+            'success': False,
+            'error': 'No jobs provided'
+        }), 400
+    
+    if len(postings) > settings.JOB_POSTINGS_MAX_BATCH:
+        return jsonify({
+            'success': False,
+            'error': f'Too many jobs (max {settings.JOB_POSTINGS_MAX_BATCH} per request)'
+        }), 400
+    
+    records = []
+    for position, posting in enumerate(postings):
+        try:
+            records.append(build_record(posting, info_extractor))
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': f'Job {position}: {str(e)}'
+            }), 400
+    
+    def add_vectors(accepted):
+        # Last posting wins when an id repeats within the request
+        texts = {record['id']: record['text'] for record in accepted}
+        job_vectors.add(list(texts), text_encoder.encode(list(texts.values())))
+    
+    try:
+        job_store.write_batch(
+            records, before_commit=add_vectors if job_vectors is not None else None
+        )
+        job_index_sync.sync(force=True)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Failed to index jobs: {str(e)}'
+        }), 500
+    
+    print(f"🗂️ Indexed {len(postings)} job postings ({len(job_index)} total)")
+    
+    return jsonify({
+        'success': True,
+        'indexed': len(postings),
+        'total_jobs': len(job_index)
+    }), 200
+
+
+@app.route('/job-postings/ingest', methods=['POST'])
+def ingest_job_postings():
+    """
+    Bulk-load an NDJSON feed of job postings in the background
+    
+    Request:
+        - body: one JSON posting per line (fields as /job-postings), streamed
+                to disk without being held in memory
+        - source: optional query parameter naming the feed; posting the
+                  same feed under the same source resumes a run that was
+                  interrupted, and a completed source is not ingested again
+    
+    Response (202):
+        - ingest_id: source name of the run
+        - status_url: where to poll progress and counters
+    
+    Exact and near-duplicate postings (by content hash and SimHash) are dropped.
+    """
+    ingest_id = request.args.get('source') or uuid.uuid4().hex
+    if not re.fullmatch(r'[\w.-]{1,128}', ingest_id):
+        return jsonify({
+            'success': False,
+            'error': 'source may only contain letters, digits, ".", "_" and "-"'
+        }), 400
+    
+    with active_ingests_lock:
+        if ingest_id in active_ingests:
+            return jsonify({
+                'success': False,
+                'error': f'Feed {ingest_id} is already being ingested'
+            }), 409
+        active_ingests.add(ingest_id)
+    
+    try:
+        os.makedirs(settings.INGEST_UPLOAD_DIR, exist_ok=True)
+        path = os.path.join(settings.INGEST_UPLOAD_DIR, f'{ingest_id}.ndjson')
+        with open(f'{path}.part', 'wb') as handle:
+            shutil.copyfileobj(request.stream, handle, 1024 * 1024)
+        os.replace(f'{path}.part', path)
+    except Exception as e:
+        with active_ingests_lock:
+            active_ingests.discard(ingest_id)
+        return jsonify({
+            'success': False,
+            'error': f'Failed to receive feed: {str(e)}'
+        }), 500
+    
+    threading.Thread(
+        target=run_ingest, args=(ingest_id, path), name=f'ingest-{ingest_id}', daemon=True
+    ).start()
+    print(f"📥 Ingesting job feed {ingest_id}")
+    
+    return jsonify({
+        'success': True,
+        'ingest_id': ingest_id,
+        'status': 'running',
+        'status_url': f'/job-postings/ingest/{ingest_id}'
+    }), 202
+
+
+@app.route('/job-postings/ingest/<ingest_id>', methods=['GET'])
+def ingest_status(ingest_id):
+    """
+    Progress of a feed ingestion
+    
+    Response:
+        - ingest: source, status (running/completed/failed), lines and byte
+                  offset committed so far, stats (inserted, updated,
+                  unchanged, duplicate, near_duplicate, invalid, errors)
+    """
+    run = job_store.get_run(ingest_id)
+    if run is None:
+        return jsonify({
+            'success': False,
+            'error': 'Ingestion not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'ingest': run
+    }), 200
+
+
+@app.route('/job-postings/<job_id>', methods=['DELETE'])
+def remove_job_posting(job_id):
+    """Remove a job posting from the store and both indexes"""
+    removed = job_store.remove(job_id)
+    if job_vectors is not None:
+        removed = job_vectors.remove(job_id) or removed
+    job_index_sync.sync(force=True)
+    
+    if not removed:
+        return jsonify({
+            'success': False,
+            'error': 'Job posting not found'
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'total_jobs': len(job_index)
+    }), 200
+
+
+@app.route('/recommend', methods=['POST'])
+def recommend_jobs():
+    """
+    Recommend indexed job postings for a resume
+    
+    Request, one of:
+        - JSON with skills (list of skills) or text (resume text)
+        - file: PDF resume (multipart/form-data), parsed as /parse-resume
+    and optionally top_k (JSON field or query parameter)
+    
+    Response:
+        - skills: resume skills used for matching
+        - recommendations: best postings first, each with score (BM25 over
+          skills), coverage, matched_skills and missing_skills
+        - total_jobs: postings in the index
+    """
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        top_k = int(data.get('top_k') or request.args.get('top_k')
+                    or settings.RECOMMEND_DEFAULT_TOP_K)
+    except (TypeError, ValueError):
+        return jsonify({
+            'success': False,
+            'error': 'top_k must be an integer'
+        }), 400
+    top_k = max(1, min(top_k, settings.RECOMMEND_MAX_TOP_K))
+    
+    try:
+        if 'file' in request.files:
+            pdf_source, _, pdf_digest = upload_source(request.files['file'])
+            response_data, _ = cached_parse(pdf_source, pdf_digest)
+            skills = sorted(set(response_data['skills']) | set(response_data['fuzzy_skills']))
+        elif isinstance(data.get('skills'), list):
+            taxonomy = info_extractor.taxonomy
+            skills = sorted({
+                taxonomy.canonical(skill) for skill in data['skills']
+                if isinstance(skill, str) and taxonomy.canonical(skill)
+            })
+        elif isinstance(data.get('text'), str):
+            skills = info_extractor.extract_skills(data['text'])
+        else:
+            return jsonify({
+                'success': False,
+                'error': 'Provide a resume file, skills or text'
+            }), 400
+        
+        job_index_sync.sync()
+        with time_stage('recommend'):
+            recommendations = job_index.search(skills, top_k=top_k)
         
         return jsonify({
             'success': True,
             'skills': skills,
-            'count': len(skills)
+            'recommendations': recommendations,
+            'total_jobs': len(job_index)
         }), 200
         
+    except InvalidPDFError as e:
+        return jsonify({
+            'success': False,
+            'error': f'PDF validation failed: {str(e)}'
+        }), 400
+        
     except Exception as e:
         return jsonify({
             'success': False,
-            'error': str(e)
+            'error': f'Failed to recommend jobs: {str(e)}'
+        }), 500
+
+
+@app.route('/match', methods=['POST'])
+def match_jobs():
+    """
+    Score one resume against a batch of job descriptions by skill overlap
+    
+    Request, one of:
+        - JSON with skills (list of skills) or text (resume text), and jobs
+        - file: PDF resume (multipart/form-data), parsed as /parse-resume,
+          with jobs as a JSON-encoded form field
+    jobs is a list of job descriptions, each a string or an object with
+    description (or skills, a list of skills) and any other fields (id,
+    title, ...) to return with the result. Optional: top_k (JSON field or
+    query parameter), sort_by ('coverage', the default, or 'jaccard').
+    
+    Response:
+        - skills: resume skills used for matching
+        - matches: best jobs first, each with index (position in jobs), the
+          job's fields, coverage (share of the job's skills the resume has),
+          jaccard, matched_skills and missing_skills
+        - total_jobs: jobs scored
+    """
+    data = request.get_json(silent=True) or {}
+    jobs = data.get('jobs')
+    if jobs is None and 'jobs' in request.form:
+        try:
+            jobs = json.loads(request.form['jobs'])
+        except ValueError:
+            jobs = None
+    
+    if not isinstance(jobs, list) or not jobs:
+        return jsonify({
+            'success': False,
+            'error': 'Provide jobs (a list of job descriptions)'
+        }), 400
+    
+    if len(jobs) > settings.MATCH_MAX_JOBS:
+        return jsonify({
+            'success': False,
+            'error': f'Too many jobs (max {settings.MATCH_MAX_JOBS} per request)'
+        }), 400
+    
+    try:
+        top_k = int(data.get('top_k') or request.args.get('top_k')
+                    or settings.RECOMMEND_DEFAULT_TOP_K)
+    except (TypeError, ValueError):
+        return jsonify({
+            'success': False,
+            'error': 'top_k must be an integer'
+        }), 400
+    top_k = max(1, min(top_k, settings.RECOMMEND_MAX_TOP_K))
+    
+    sort_by = data.get('sort_by') or request.args.get('sort_by') or 'coverage'
+    if sort_by not in ('coverage', 'jaccard'):
+        return jsonify({
+            'success': False,
+            'error': "sort_by must be 'coverage' or 'jaccard'"
+        }), 400
+    
+    try:
+        # One vocabulary for the resume and every job, even if a reload lands mid-way
+        vocabulary = info_extractor.vocabulary
+        
+        if 'file' in request.files:
+            pdf_source, _, pdf_digest = upload_source(request.files['file'])
+            response_data, _ = cached_parse(pdf_source, pdf_digest)
+            skills = sorted(set(response_data['skills']) | set(response_data['fuzzy_skills']))
+        elif isinstance(data.get('skills'), list):
+            skills = sorted({
+                vocabulary.taxonomy.canonical(skill) for skill in data['skills']
+                if isinstance(skill, str) and vocabulary.taxonomy.canonical(skill)
+            })
+        elif isinstance(data.get('text'), str):
+            skills = info_extractor.extract_skills(data['text'], vocabulary)
+        else:
+            return jsonify({
+                'success': False,
+                'error': 'Provide a resume file, skills or text'
+            }), 400
+        
+        with time_stage('match'):
+            job_skills = []
+            for job in jobs:
+                if isinstance(job, dict) and isinstance(job.get('skills'), list):
+                    job_skills.append({
+                        vocabulary.taxonomy.canonical(skill) for skill in job['skills']
+                        if isinstance(skill, str) and vocabulary.taxonomy.canonical(skill)
+                    })
+                else:
+                    description = job.get('description') if isinstance(job, dict) else job
+                    job_skills.append(info_extractor.extract_skill_hits(
+                        description if isinstance(description, str) else '', vocabulary
+                    ))
+            
+            bitset = vocabulary.bitset
+            resume_bits = bitset.encode(skills)
+            job_bits = bitset.encode_many(job_skills)
+            scores = bitset.overlap(resume_bits, job_bits)
+            
+            secondary = 'jaccard' if sort_by == 'coverage' else 'coverage'
+            order = np.lexsort((-scores[secondary], -scores[sort_by]))[:top_k]
+            
+            matches = []
+            for row in order:
+                job = jobs[row]
+                fields = {
+                    key: value for key, value in job.items()
+                    if key not in ('description', 'skills')
+                } if isinstance(job, dict) else {}
+                matches.append({
+                    **fields,
+                    'index': int(row),
+                    'coverage': round(float(scores['coverage'][row]), 4),
+                    'jaccard': round(float(scores['jaccard'][row]), 4),
+                    'matched_skills': bitset.decode(job_bits[row] & resume_bits),
+                    'missing_skills': bitset.decode(job_bits[row] & ~resume_bits),
+                })
+        
+        return jsonify({
+            'success': True,
+            'skills': skills,
+            'matches': matches,
+            'total_jobs': len(jobs),
+            'skills_version': vocabulary.version
+        }), 200
+        
+    except InvalidPDFError as e:
+        return jsonify({
+            'success': False,
+            'error': f'PDF validation failed: {str(e)}'
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Failed to match jobs: {str(e)}'
         }), 500
 
 
+@app.route('/similar-jobs', methods=['POST'])
+def similar_jobs():
+    """
+    Find job postings whose text is most similar to a resume
+    
+    Request, one of:
+        - JSON with text (resume text) or texts (list of texts, scored as one batch)
+        - file: PDF resume (multipart/form-data), parsed as /parse-resume
+    and optionally top_k (JSON field or query parameter)
+    
+    Response:
+        - results: best postings first, each with id, similarity (cosine of
+          hashed text vectors) and the posting fields when indexed in this
+          worker; a list of such lists when texts was given
+    """
+    if job_vectors is None:
+        return jsonify({
+            'success': False,
+            'error': 'Vector store is disabled'
+        }), 503
+    
+    data = request.get_json(silent=True) or {}
+    
+    try:
+        top_k = int(data.get('top_k') or request.args.get('top_k')
+                    or settings.RECOMMEND_DEFAULT_TOP_K)
+    except (TypeError, ValueError):
+        return jsonify({
+            'success': False,
+            'error': 'top_k must be an integer'
+        }), 400
+    top_k = max(1, min(top_k, settings.RECOMMEND_MAX_TOP_K))
+    
+    try:
+        batch = False
+        if 'file' in request.files:
+            pdf_source, _, pdf_digest = upload_source(request.files['file'])
+            response_data, _ = cached_parse(pdf_source, pdf_digest)
+            texts = [response_data['full_text']]
+        elif isinstance(data.get('texts'), list) and data['texts']:
+            if len(data['texts']) > settings.JOB_POSTINGS_MAX_BATCH:
+                return jsonify({
+                    'success': False,
+                    'error': f'Too many texts (max {settings.JOB_POSTINGS_MAX_BATCH} per request)'
+                }), 400
+            texts = [text if isinstance(text, str) else '' for text in data['texts']]
+            batch = True
+        elif isinstance(data.get('text'), str):
+            texts = [data['text']]
+        else:
+            return jsonify({
+                'success': False,
+                'error': 'Provide a resume file, text or texts'
+            }), 400
+        
+        job_index_sync.sync()
+        with time_stage('similar_jobs'):
+            matches = job_vectors.search(text_encoder.encode(texts), top_k=top_k)
+        
+        results = [
+            [
+                {**job_index.get(job_id, {'id': job_id}), 'similarity': similarity}
+                for job_id, similarity in ranked
+            ]
+            for ranked in matches
+        ]
+        
+        return jsonify({
+            'success': True,
+            'results': results if batch else results[0],
+            'total_jobs': len(job_vectors)
+        }), 200
+        
+    except InvalidPDFError as e:
+        return jsonify({
+            'success': False,
+            'error': f'PDF validation failed: {str(e)}'
+        }), 400
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': f'Failed to find similar jobs: {str(e)}'
+        }), 500
+
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """
+    Status of an asynchronous parse job
+    
+    Response:
+        - success: bool
+        - job: id, status (queued/running/succeeded/failed), timestamps,
+               result ({data, cached}) when succeeded, error when failed
+    
+    Query parameters fields / include_text select the result data fields
+    (as /parse-resume).
+    """
+    try:
+        selection = FieldSelection.from_args(request.args)
+    except ValueError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'error': 'Job not found'
+        }), 404
+    
+    if 'result' in job:
+        job['result']['data'] = selection.apply(job['result']['data'])
+    
+    return jsonify({
+        'success': True,
+        'job': job
+    }), 200
+
+
+@app.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """Parse cache hit/miss counters for this worker process"""
+    if parse_cache is None:
+        return jsonify({
+            'enabled': False
+        }), 200
+    
+    return jsonify({
+        'enabled': True,
+        'skills_version': info_extractor.skills_version,
+        **parse_cache.stats()
+    }), 200
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """Stage latency histograms and counters in the Prometheus text format"""
+    return Response(REGISTRY.render(), mimetype='text/plain; version=0.0.4')
+
+
 @app.route('/validate-pdf', methods=['POST'])
 def validate_pdf_endpoint():
     """
@@ -216,9 +1073,9 @@ def validate_pdf_endpoint():
         }), 400
     
     file = request.files['file']
-    pdf_bytes = file.read()
+    pdf_source, _, _ = upload_source(file)
     
-    is_valid, message = pdf_parser.validate_pdf(pdf_bytes)
+    is_valid, message = pdf_parser.validate_pdf(pdf_source)
     
     return jsonify({
         'valid': is_valid,
@@ -235,6 +1092,14 @@ def not_found(error):
     }), 404
 
 
+@app.errorhandler(413)
+def too_large(error):
+    return jsonify({
+        'success': False,
+        'error': f'File too large (max {settings.UPLOAD_MAX_BYTES} bytes per file)'
+    }), 413
+
+
 @app.errorhandler(500)
 def internal_error(error):
     return jsonify({
@@ -250,11 +1115,24 @@ if __name__ == '__main__':
     print("=" * 60)
     print("📍 Home:         http://localhost:5000/")
     print("📍 Health Check: http://localhost:5000/health")
+    print("💓 Probes:       http://localhost:5000/livez, http://localhost:5000/readyz")
     print("📄 Parse Resume: http://localhost:5000/parse-resume (POST)")
+    print("📚 Parse Batch:  http://localhost:5000/parse-resumes (POST)")
+    print("⏳ Job Status:   http://localhost:5000/jobs/<job_id>")
+    print("📈 Metrics:      http://localhost:5000/metrics")
     print("🏷️  Extract Skills: http://localhost:5000/extract-skills (POST)")
+    print("🌊 Skills Stream: http://localhost:5000/extract-skills/batch (POST, NDJSON)")
+    print("🗂️  Job Postings: http://localhost:5000/job-postings (POST)")
+    print("📥 Ingest Feed:  http://localhost:5000/job-postings/ingest (POST)")
+    print("🎯 Recommend:    http://localhost:5000/recommend (POST)")
+    print("🧭 Similar Jobs: http://localhost:5000/similar-jobs (POST)")
+    print("⚖️  Match Jobs:   http://localhost:5000/match (POST)")
     print("✅ Validate PDF: http://localhost:5000/validate-pdf (POST)")
     print("=" * 60)
     print("✨ Modules loaded: PDFParser, InformationExtractor")
+    print("⚠️ Development server - for production run:")
+    print("   gunicorn -c gunicorn.conf.py wsgi:app")
+    print(f"🧾 JSON encoder: {json_encoder}")
     print("=" * 60)
     
     app.run(
@@ -0,0 +1,6 @@
+"""
+Benchmarks Module
+Standalone performance benchmarks for the ML service
+
+Run from the ml-service directory, e.g. ``python -m benchmarks.bench_patterns``
+"""
@@ -0,0 +1,114 @@
+"""
+Pattern Registry Microbenchmark
+Compares precompiled patterns against passing pattern strings to the re module
+
+Three variants are timed for every pattern in extractors.patterns.PATTERNS:
+    compiled  - pattern.findall(text) on the precompiled object
+    re-cache  - re.findall(string, text, flags), served from the re cache
+    re-cold   - same, but the re cache is purged before each call, which is
+                what happens under load once more distinct patterns are in
+                use than the cache can hold
+
+Usage:
+    python -m benchmarks.bench_patterns [--number 2000]
+"""
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extractors import InformationExtractor  # noqa: E402
+from extractors.patterns import PATTERNS  # noqa: E402
+
+
+SAMPLE_RESUME = """John Smith
+john.smith@gmail.com | +91 9876543210 | Bangalore, Karnataka
+linkedin.com/in/johnsmith github.com/jsmith https://johnsmith.dev/portfolio
+
+Summary
+5 years of experience building web apps with Python, Django, React and AWS.
+
+Work Experience
+Senior Software Engineer at Infosys Technologies Ltd
+Jan 2020 - Present
+Built microservices with Node.js, Docker, Kubernetes, and CI/CD pipelines.
+Software Developer at Tata Consultancy Services
+2017 - 2019
+
+Education
+B.Tech in Computer Science
+Indian Institute Of Technology Delhi
+2013 - 2017
+
+Certifications
+AWS Certified Solutions Architect
+
+Skills
+Python, JavaScript, TypeScript, Next.js, MongoDB, PostgreSQL, Git
+"""
+
+
+def _per_call_us(func, number):
+    """Best-of-three time per call in microseconds"""
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def bench_patterns(text, number):
+    """
+    Time every registry pattern in the three variants
+
+    Args:
+        text: Text to scan
+        number: Calls per timing run
+
+    Returns:
+        list: (name, compiled_us, cached_us, cold_us) tuples
+    """
+    results = []
+
+    for name, pattern in PATTERNS.items():
+        source, flags = pattern.pattern, pattern.flags
+
+        def cold(source=source, flags=flags):
+            re.purge()
+            re.findall(source, text, flags)
+
+        results.append((
+            name,
+            _per_call_us(lambda: pattern.findall(text), number),
+            _per_call_us(lambda: re.findall(source, text, flags), number),
+            _per_call_us(cold, max(number // 10, 1)),
+        ))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--number', type=int, default=2000,
+                        help='calls per timing run (default: 2000)')
+    args = parser.parse_args()
+
+    print(f"{'pattern':<24}{'compiled':>12}{'re-cache':>12}{'re-cold':>12}   (µs/call)")
+    print('-' * 72)
+
+    totals = [0.0, 0.0, 0.0]
+    for name, *timings in bench_patterns(SAMPLE_RESUME, args.number):
+        totals = [total + timing for total, timing in zip(totals, timings)]
+        print(f"{name:<24}" + ''.join(f"{timing:>12.2f}" for timing in timings))
+
+    print('-' * 72)
+    print(f"{'total':<24}" + ''.join(f"{total:>12.2f}" for total in totals))
+
+    extractor = InformationExtractor()
+    extract_all_us = _per_call_us(lambda: extractor.extract_all(SAMPLE_RESUME),
+                                  max(args.number // 10, 1))
+    print(f"\nextract_all on sample resume: {extract_all_us:.1f} µs/call")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+"""
+Synthetic Resume Corpus
+Deterministic generator of resume texts and PDFs for benchmarks
+
+Every document is derived from a seeded random generator and the fixed
+word lists below (not from config.skills_database), so the corpus is the
+same across runs and across changes to the skills database.
+
+Document kinds:
+    text         - one-page text-based PDF
+    scanned      - a resume page rendered to an image, no text layer
+    multi_page   - several resumes worth of pages
+    long         - very long text-based PDF
+    adversarial  - inputs that stress the extractor regexes (long runs of
+                   digits, dots, '@', unterminated URLs, no line breaks)
+
+Usage:
+    python -m benchmarks.corpus --output /tmp/resume-corpus
+"""
+
+import argparse
+import os
+import random
+
+
+FIRST_NAMES = ['Aarav', 'Priya', 'Rahul', 'Ananya', 'Vikram', 'Sneha', 'Arjun', 'Kavya',
+               'John', 'Emily', 'Michael', 'Sarah', 'David', 'Laura']
+LAST_NAMES = ['Sharma', 'Patel', 'Iyer', 'Reddy', 'Gupta', 'Nair', 'Singh', 'Mehta',
+              'Smith', 'Johnson', 'Brown', 'Miller', 'Wilson', 'Clark']
+CITIES = [('Bangalore', 'Karnataka'), ('Mumbai', 'Maharashtra'), ('Pune', 'Maharashtra'),
+          ('Hyderabad', 'Telangana'), ('Chennai', 'Tamil Nadu'), ('Delhi', 'Delhi'),
+          ('Kolkata', 'West Bengal'), ('Noida', 'Uttar Pradesh')]
+COMPANIES = ['Infosys Technologies Ltd', 'Tata Consultancy Services', 'Wipro Limited',
+             'Acme Software Pvt Ltd', 'Globex Solutions Inc', 'Initech Systems LLC']
+TITLES = ['Software Engineer', 'Senior Software Engineer', 'Data Scientist',
+          'Backend Developer', 'Full Stack Developer', 'DevOps Engineer']
+DEGREES = ['B.Tech in Computer Science', 'M.Tech in Information Technology',
+           'Bachelor of Engineering in Electronics', 'MBA in Business Analytics',
+           'B.Sc in Mathematics', 'Master of Science in Data Science']
+INSTITUTIONS = ['Indian Institute Of Technology Delhi', 'National Institute Of Technology Trichy',
+                'Anna University', 'University Of Mumbai', 'Birla Institute Of Technology']
+CERTIFICATIONS = ['AWS Certified Solutions Architect', 'Google Cloud Professional Data Engineer',
+                  'Certified Kubernetes Administrator', 'Oracle Certified Java Programmer']
+SKILLS = ['Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'Go', 'SQL', 'React',
+          'Node.js', 'Django', 'Flask', 'Spring Boot', 'Docker', 'Kubernetes', 'AWS', 'Azure',
+          'MongoDB', 'PostgreSQL', 'Redis', 'Kafka', 'TensorFlow', 'PyTorch', 'Pandas',
+          'Git', 'CI/CD', 'Machine Learning', 'Microservices', 'REST API', 'GraphQL']
+FILLER = ['designed', 'built', 'scaled', 'migrated', 'optimized', 'maintained', 'services',
+          'pipelines', 'dashboards', 'latency', 'throughput', 'customers', 'reliability',
+          'platform', 'features', 'teams', 'production', 'systems', 'data', 'reports']
+
+DOCUMENT_KINDS = ('text', 'scanned', 'multi_page', 'long', 'adversarial')
+
+
+def generate_resume_text(rng, experience_entries=3, bullet_lines=3):
+    """
+    Generate one plausible resume
+
+    Args:
+        rng: random.Random instance
+        experience_entries: Number of jobs in the experience section
+        bullet_lines: Description lines per job
+
+    Returns:
+        str: Resume text
+    """
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    city, region = rng.choice(CITIES)
+    skills = rng.sample(SKILLS, 10)
+
+    lines = [
+        f'{first} {last}',
+        f'{first.lower()}.{last.lower()}@example.com | +91 {rng.randint(6000000000, 9999999999)}'
+        f' | {city}, {region}',
+        f'linkedin.com/in/{first.lower()}{last.lower()} github.com/{first.lower()}{rng.randint(1, 99)}',
+        '',
+        'Summary',
+        f'{rng.randint(2, 15)} years of experience building software with '
+        f'{", ".join(skills[:3])} and {skills[3]}.',
+        '',
+        'Work Experience',
+    ]
+
+    year = 2024
+    for _ in range(experience_entries):
+        start = year - rng.randint(1, 4)
+        lines.append(f'{rng.choice(TITLES)} at {rng.choice(COMPANIES)}')
+        lines.append(f'Jan {start} - Dec {year}')
+        for _ in range(bullet_lines):
+            words = rng.sample(FILLER, 6) + [rng.choice(skills)]
+            lines.append('- ' + ' '.join(words).capitalize() + '.')
+        year = start
+
+    lines += [
+        '',
+        'Education',
+        rng.choice(DEGREES),
+        rng.choice(INSTITUTIONS),
+        f'{year - 4} - {year}',
+        '',
+        'Certifications',
+        rng.choice(CERTIFICATIONS),
+        '',
+        'Skills',
+        ', '.join(skills),
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def generate_adversarial_text(rng, size=64 * 1024):
+    """
+    Generate text built to trigger worst-case regex behaviour
+
+    Args:
+        rng: random.Random instance
+        size: Approximate length in characters
+
+    Returns:
+        str: Adversarial resume text
+    """
+    chunk = max(size // 8, 1)
+    parts = [
+        generate_resume_text(rng),
+        # Long local part with no domain: email candidates that never match
+        'a' * chunk + '@',
+        # Digit runs and separators: phone patterns backtrack over these
+        ' '.join('9' * rng.randint(8, 14) for _ in range(chunk // 12)),
+        '+91 ' * (chunk // 4),
+        # Unterminated URLs and dotted words
+        'https://' + 'a/' * (chunk // 2),
+        'x.' * (chunk // 2),
+        # Date-like and year-like fragments without closing ranges
+        'Jan 2020 - ' * (chunk // 11),
+        # Skill-dense text with no line breaks
+        ' '.join(rng.choice(SKILLS) for _ in range(chunk // 8)),
+    ]
+    return '\n'.join(parts)
+
+
+def make_text_pdf(pages):
+    """
+    Render text pages into a text-based PDF
+
+    Args:
+        pages: List of page texts (one PDF page each)
+
+    Returns:
+        bytes: PDF content
+    """
+    import fitz
+
+    document = fitz.open()
+    try:
+        for text in pages:
+            page = document.new_page()
+            page.insert_textbox(page.rect + (36, 36, -36, -36), text, fontsize=8)
+        return document.tobytes(no_new_id=True)
+    finally:
+        document.close()
+
+
+def make_scanned_pdf(text, zoom=2.0):
+    """
+    Render a page to an image and wrap it in a PDF without a text layer
+
+    Args:
+        text: Page text
+        zoom: Render scale (2.0 ~ 144 DPI)
+
+    Returns:
+        bytes: PDF content
+    """
+    import fitz
+
+    source = fitz.open('pdf', make_text_pdf([text]))
+    scanned = fitz.open()
+    try:
+        pixmap = source[0].get_pixmap(matrix=fitz.Matrix(zoom, zoom))
+        page = scanned.new_page(width=source[0].rect.width, height=source[0].rect.height)
+        page.insert_image(page.rect, stream=pixmap.tobytes('png'))
+        return scanned.tobytes(deflate=True, no_new_id=True)
+    finally:
+        source.close()
+        scanned.close()
+
+
+def build_corpus(seed=42, long_pages=40, multi_pages=5):
+    """
+    Build the benchmark corpus
+
+    Args:
+        seed: Random seed
+        long_pages: Page count of the long document
+        multi_pages: Page count of the multi-page document
+
+    Returns:
+        list: Documents as {'name', 'kind', 'text', 'pdf'} dicts
+    """
+    rng = random.Random(seed)
+    corpus = []
+
+    text = generate_resume_text(rng)
+    corpus.append({'name': 'text', 'kind': 'text', 'text': text,
+                   'pdf': make_text_pdf([text])})
+
+    text = generate_resume_text(rng)
+    corpus.append({'name': 'scanned', 'kind': 'scanned', 'text': text,
+                   'pdf': make_scanned_pdf(text)})
+
+    pages = [generate_resume_text(rng) for _ in range(multi_pages)]
+    corpus.append({'name': 'multi_page', 'kind': 'multi_page', 'text': '\n'.join(pages),
+                   'pdf': make_text_pdf(pages)})
+
+    pages = [generate_resume_text(rng, experience_entries=5, bullet_lines=8)
+             for _ in range(long_pages)]
+    corpus.append({'name': 'long', 'kind': 'long', 'text': '\n'.join(pages),
+                   'pdf': make_text_pdf(pages)})
+
+    text = generate_adversarial_text(rng)
+    corpus.append({'name': 'adversarial', 'kind': 'adversarial', 'text': text,
+                   'pdf': make_text_pdf([text[i:i + 4000] for i in range(0, len(text), 4000)])})
+
+    return corpus
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--output', required=True, help='directory to write the corpus to')
+    parser.add_argument('--seed', type=int, default=42, help='random seed (default: 42)')
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    for document in build_corpus(args.seed):
+        base = os.path.join(args.output, document['name'])
+        with open(base + '.pdf', 'wb') as handle:
+            handle.write(document['pdf'])
+        with open(base + '.txt', 'w', encoding='utf-8') as handle:
+            handle.write(document['text'])
+        print(f"📄 {document['name']:<12} {len(document['pdf']):>9} bytes PDF, "
+              f"{len(document['text']):>7} chars text")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,242 @@
+"""
+Benchmark Suite
+Throughput of PDF text extraction and every InformationExtractor method
+on the synthetic corpus, compared against a saved baseline
+
+Benchmarks are named <target>/<document>, e.g. extract_text/long or
+extract_email/adversarial, and reported in calls per second (best of
+several rounds). OCR benchmarks are skipped when Tesseract is missing.
+
+Usage:
+    # Record a baseline on this machine
+    python -m benchmarks.run_benchmarks --save-baseline
+
+    # Compare against it; exits with status 1 if any benchmark's
+    # throughput dropped by more than the threshold
+    python -m benchmarks.run_benchmarks --threshold 0.15
+
+Baselines are machine-specific: compare runs on the same hardware.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import re
+import sys
+import time
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.corpus import build_corpus  # noqa: E402
+from extractors import InformationExtractor  # noqa: E402
+from parsers import PDFParser  # noqa: E402
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# InformationExtractor methods benchmarked on every document's text
+EXTRACTOR_METHODS = (
+    'extract_name', 'extract_email', 'extract_phone', 'extract_location',
+    'extract_skills', 'extract_skill_categories', 'extract_fuzzy_skills',
+    'extract_urls', 'extract_years_of_experience',
+    'extract_education', 'extract_experience', 'extract_certifications',
+    'extract_all',
+)
+
+
+def measure(func, min_time=0.2, rounds=5):
+    """
+    Measure the throughput of a callable
+
+    Args:
+        func: Zero-argument callable
+        min_time: Minimum duration of one round in seconds
+        rounds: Rounds to run; the fastest is reported
+
+    Returns:
+        float: Calls per second
+    """
+    func()  # warm caches and lazy initialization
+
+    timer = timeit.Timer(func)
+    number, elapsed = timer.autorange()
+    if elapsed < min_time:
+        number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+
+    best = min(timer.repeat(repeat=rounds, number=number))
+    return number / best
+
+
+def collect_benchmarks(corpus, pdf_parser, info_extractor, include_ocr=True):
+    """
+    Build the named benchmark callables for a corpus
+
+    Args:
+        corpus: Documents from build_corpus
+        pdf_parser: PDFParser instance
+        info_extractor: InformationExtractor instance
+        include_ocr: Whether to benchmark extract_text_with_ocr
+
+    Returns:
+        dict: Benchmark name -> zero-argument callable
+    """
+    benchmarks = {}
+
+    for document in corpus:
+        name, pdf, text = document['name'], document['pdf'], document['text']
+
+        if document['kind'] != 'scanned' or (include_ocr and pdf_parser.ocr_enabled):
+            benchmarks[f'extract_text/{name}'] = (
+                lambda pdf=pdf: pdf_parser.extract_text(pdf)
+            )
+        if document['kind'] == 'scanned' and include_ocr and pdf_parser.ocr_enabled:
+            benchmarks[f'extract_text_with_ocr/{name}'] = (
+                lambda pdf=pdf: pdf_parser.extract_text_with_ocr(pdf)
+            )
+
+        for method_name in EXTRACTOR_METHODS:
+            method = getattr(info_extractor, method_name)
+            benchmarks[f'{method_name}/{name}'] = lambda method=method, text=text: method(text)
+
+    return benchmarks
+
+
+def run(benchmarks, min_time, rounds, only=None):
+    """
+    Run benchmarks and print their throughput
+
+    Args:
+        benchmarks: Benchmark name -> callable
+        min_time: Minimum duration of one round in seconds
+        rounds: Rounds per benchmark
+        only: Regex selecting benchmark names to run (None runs all)
+
+    Returns:
+        dict: Benchmark name -> calls per second
+    """
+    selected = re.compile(only) if only else None
+    results = {}
+
+    for name, func in benchmarks.items():
+        if selected is not None and not selected.search(name):
+            continue
+        # Keep the pipeline's progress prints out of the report
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            results[name] = measure(func, min_time=min_time, rounds=rounds)
+        print(f"  {name:<48}{results[name]:>14.1f} ops/s")
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Compare results with a baseline
+
+    Args:
+        results: Benchmark name -> calls per second
+        baseline: Baseline results in the same shape
+        threshold: Allowed relative throughput drop (0.15 = 15%)
+
+    Returns:
+        list: (name, baseline ops/s, current ops/s, change) of regressions
+    """
+    regressions = []
+
+    print(f"\n{'benchmark':<48}{'baseline':>12}{'current':>12}{'change':>9}")
+    print('-' * 81)
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            print(f"{name:<48}{'-':>12}{current:>12.1f}{'new':>9}")
+            continue
+
+        change = current / previous - 1
+        flag = ''
+        if change < -threshold:
+            regressions.append((name, previous, current, change))
+            flag = '  ❌'
+        print(f"{name:<48}{previous:>12.1f}{current:>12.1f}{change:>+8.1%}{flag}")
+
+    return regressions
+
+
+def load_baseline(path):
+    """Read the results of a saved baseline file"""
+    with open(path, encoding='utf-8') as handle:
+        return json.load(handle)['results']
+
+
+def save_results(path, results, seed):
+    """Write results with enough context to judge whether they are comparable"""
+    payload = {
+        'created_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'seed': seed,
+        'results': results,
+    }
+    with open(path, 'w', encoding='utf-8') as handle:
+        json.dump(payload, handle, indent=2, sort_keys=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE,
+                        help='baseline file (default: benchmarks/baseline.json)')
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='write the results to the baseline file instead of comparing')
+    parser.add_argument('--output', help='also write the results to this file')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='allowed throughput drop before failing (default: 0.15)')
+    parser.add_argument('--only', help='regex selecting the benchmarks to run')
+    parser.add_argument('--seed', type=int, default=42, help='corpus seed (default: 42)')
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help='minimum seconds per round (default: 0.2)')
+    parser.add_argument('--rounds', type=int, default=5, help='rounds per benchmark (default: 5)')
+    parser.add_argument('--no-ocr', action='store_true', help='skip OCR benchmarks')
+    args = parser.parse_args()
+
+    print("📚 Building synthetic corpus...")
+    corpus = build_corpus(args.seed)
+
+    pdf_parser = PDFParser()
+    info_extractor = InformationExtractor()
+    if not pdf_parser.ocr_enabled:
+        print("⚠️ Tesseract not available, OCR benchmarks are skipped")
+
+    benchmarks = collect_benchmarks(
+        corpus, pdf_parser, info_extractor, include_ocr=not args.no_ocr
+    )
+
+    print(f"⏱️ Running {len(benchmarks)} benchmarks...")
+    results = run(benchmarks, args.min_time, args.rounds, only=args.only)
+
+    if args.output:
+        save_results(args.output, results, args.seed)
+
+    if args.save_baseline:
+        save_results(args.baseline, results, args.seed)
+        print(f"\n💾 Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"\n⚠️ No baseline at {args.baseline}; run with --save-baseline first")
+        return 0
+
+    regressions = compare(results, load_baseline(args.baseline), args.threshold)
+    if regressions:
+        print(f"\n❌ {len(regressions)} benchmarks slowed down by more than {args.threshold:.0%}")
+        return 1
+
+    print(f"\n✅ No benchmark slowed down by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,8 @@
+"""
+Cache Module
+Caching of expensive parse results
+"""
+
+from .parse_cache import ParseCache
+
+__all__ = ['ParseCache']
@@ -0,0 +1,253 @@
+"""
+Parse Cache Module
+Content-addressed cache of parse results with memory and disk tiers
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+
+# Bump when the shape of cached parse results changes
+CACHE_SCHEMA_VERSION = 5
+
+
+class ParseCache:
+    """
+    Two-tier cache for resume parse results
+
+    Keys are derived from the PDF bytes and the skills database version,
+    so a byte-identical upload is served from the cache until the skill
+    vocabulary changes. The memory tier is a bounded LRU; the disk tier is
+    a SQLite file shared by every worker process on the host, evicting the
+    least recently used entries once it grows past its size budget. Its
+    total size is kept in a one-row table that triggers update on every
+    insert and delete, so checking the budget does not scan the cache.
+    """
+
+    def __init__(self, memory_items=256, disk_path=None, disk_max_bytes=512 * 1024 * 1024):
+        """
+        Args:
+            memory_items: Maximum entries in the in-memory LRU (0 disables it)
+            disk_path: SQLite file for the persistent tier (None disables it)
+            disk_max_bytes: Size budget of the persistent tier
+        """
+        self.memory_items = max(0, memory_items)
+        self.disk_path = disk_path or None
+        self.disk_max_bytes = disk_max_bytes
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            'memory_hits': 0,
+            'disk_hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+        }
+
+        # SQLite connections must not cross a fork, so each process opens its own
+        self._conn = None
+        self._conn_pid = None
+        if self.disk_path:
+            directory = os.path.dirname(self.disk_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            db = self._connect()
+            db.execute('BEGIN IMMEDIATE')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS parse_cache ('
+                ' key TEXT PRIMARY KEY,'
+                ' value BLOB NOT NULL,'
+                ' size INTEGER NOT NULL,'
+                ' last_access REAL NOT NULL)'
+            )
+            db.execute(
+                'CREATE INDEX IF NOT EXISTS parse_cache_last_access'
+                ' ON parse_cache (last_access)'
+            )
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS parse_cache_size ('
+                ' id INTEGER PRIMARY KEY CHECK (id = 0),'
+                ' total INTEGER NOT NULL)'
+            )
+            # Summed once, when the size table is first created for this file
+            db.execute(
+                'INSERT OR IGNORE INTO parse_cache_size (id, total)'
+                ' SELECT 0, COALESCE(SUM(size), 0) FROM parse_cache'
+            )
+            db.execute(
+                'CREATE TRIGGER IF NOT EXISTS parse_cache_size_insert'
+                ' AFTER INSERT ON parse_cache BEGIN'
+                ' UPDATE parse_cache_size SET total = total + NEW.size WHERE id = 0;'
+                ' END'
+            )
+            db.execute(
+                'CREATE TRIGGER IF NOT EXISTS parse_cache_size_delete'
+                ' AFTER DELETE ON parse_cache BEGIN'
+                ' UPDATE parse_cache_size SET total = total - OLD.size WHERE id = 0;'
+                ' END'
+            )
+            db.commit()
+
+    @property
+    def _db(self):
+        """SQLite connection of the current process, None if the disk tier is off"""
+        if not self.disk_path:
+            return None
+        return self._connect()
+
+    def _connect(self):
+        """Open (or reopen after a fork) the SQLite connection"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(self.disk_path, timeout=30, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def make_key(pdf_bytes, skills_version):
+        """
+        Build the cache key for an upload
+
+        Args:
+            pdf_bytes: Binary content of PDF file
+            skills_version: Version of the skills database used for extraction
+
+        Returns:
+            str: Cache key
+        """
+        return ParseCache.key_for_digest(hashlib.sha256(pdf_bytes).hexdigest(), skills_version)
+
+    @staticmethod
+    def key_for_digest(digest, skills_version):
+        """
+        Build the cache key from a precomputed SHA-256 of the upload
+
+        Args:
+            digest: SHA-256 hex digest of the PDF content
+            skills_version: Version of the skills database used for extraction
+
+        Returns:
+            str: Cache key
+        """
+        return f'v{CACHE_SCHEMA_VERSION}:{skills_version}:{digest}'
+
+    def get(self, key):
+        """
+        Look up a parse result
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            dict or None: Cached parse result
+        """
+        with self._lock:
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self._stats['memory_hits'] += 1
+                return value
+
+            if self._db is not None:
+                row = self._db.execute(
+                    'SELECT value FROM parse_cache WHERE key = ?', (key,)
+                ).fetchone()
+                if row is not None:
+                    self._db.execute(
+                        'UPDATE parse_cache SET last_access = ? WHERE key = ?',
+                        (time.time(), key)
+                    )
+                    self._db.commit()
+                    value = json.loads(zlib.decompress(row[0]))
+                    self._remember(key, value)
+                    self._stats['disk_hits'] += 1
+                    return value
+
+            self._stats['misses'] += 1
+            return None
+
+    def put(self, key, value):
+        """
+        Store a parse result in both tiers
+
+        Args:
+            key: Cache key from make_key
+            value: JSON-serializable parse result
+        """
+        blob = zlib.compress(json.dumps(value).encode('utf-8'))
+
+        with self._lock:
+            self._remember(key, value)
+            self._stats['stores'] += 1
+
+            if self._db is not None:
+                # A plain DELETE fires the size trigger; REPLACE would not
+                self._db.execute('DELETE FROM parse_cache WHERE key = ?', (key,))
+                self._db.execute(
+                    'INSERT INTO parse_cache (key, value, size, last_access)'
+                    ' VALUES (?, ?, ?, ?)',
+                    (key, blob, len(blob), time.time())
+                )
+                self._evict_disk()
+                self._db.commit()
+
+    def _remember(self, key, value):
+        """Insert into the memory LRU, dropping the oldest entry when full"""
+        if self.memory_items == 0:
+            return
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """Delete least recently used rows until the disk tier fits its budget"""
+        total = self._disk_bytes()
+        if total <= self.disk_max_bytes:
+            return
+
+        rows = self._db.execute(
+            'SELECT key, size FROM parse_cache ORDER BY last_access'
+        )
+        expired = []
+        for key, size in rows:
+            if total <= self.disk_max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+
+        self._db.executemany('DELETE FROM parse_cache WHERE key = ?', expired)
+        self._stats['evictions'] += len(expired)
+
+    def _disk_bytes(self):
+        """Total size of the disk tier, as maintained by the size triggers"""
+        return self._db.execute('SELECT total FROM parse_cache_size WHERE id = 0').fetchone()[0]
+
+    def stats(self):
+        """
+        Get hit/miss counters and tier sizes
+
+        Returns:
+            dict: Cache statistics for this process
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            lookups = stats['memory_hits'] + stats['disk_hits'] + stats['misses']
+            stats['hit_rate'] = round((lookups - stats['misses']) / lookups, 4) if lookups else 0.0
+            stats['memory_entries'] = len(self._memory)
+
+            if self._db is not None:
+                stats['disk_entries'] = self._db.execute(
+                    'SELECT COUNT(*) FROM parse_cache'
+                ).fetchone()[0]
+                stats['disk_bytes'] = self._disk_bytes()
+
+            return stats
@@ -3,7 +3,13 @@ Configuration Module
 Contains configuration files and constants
 """
 
-from .skills_database import ALL_SKILLS, SKILL_CATEGORIES
+from .skills_database import (
+    ALL_SKILLS, SKILL_ALIASES, SKILL_CATEGORIES, SKILLS_VERSION, load_skills
+)
+from . import settings
 
-__all__ = ['ALL_SKILLS', 'SKILL_CATEGORIES']
+__all__ = [
+    'ALL_SKILLS', 'SKILL_ALIASES', 'SKILL_CATEGORIES', 'SKILLS_VERSION', 'load_skills',
+    'settings'
+]
 
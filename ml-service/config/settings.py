@@ -0,0 +1,244 @@
+"""
+Service Settings
+Runtime settings for the ML service, overridable through environment variables
+"""
+
+import os
+
+
+def _env_int(name, default):
+    """Read an integer setting from the environment"""
+    value = os.environ.get(name)
+    if value is None or value.strip() == '':
+        return default
+    return int(value)
+
+
+def _env_float(name, default):
+    """Read a float setting from the environment"""
+    value = os.environ.get(name)
+    if value is None or value.strip() == '':
+        return default
+    return float(value)
+
+
+# ============================================
+# Batch parsing (/parse-resumes)
+# ============================================
+# Worker processes used to parse PDFs of a batch in parallel
+BATCH_MAX_WORKERS = _env_int('BATCH_MAX_WORKERS', os.cpu_count() or 1)
+
+# Maximum number of files accepted in one batch request
+BATCH_MAX_FILES = _env_int('BATCH_MAX_FILES', 100)
+
+# How worker processes are started: 'spawn', 'fork' or 'forkserver'
+BATCH_START_METHOD = os.environ.get('BATCH_START_METHOD', 'spawn')
+
+# ============================================
+# OCR
+# ============================================
+# OCR engine: 'tesserocr' (in-process Tesseract fed raw page samples, one
+# engine per OCR thread; install it with requirement-ocr.txt, otherwise
+# falls back to pytesseract) or 'pytesseract' (one tesseract process per page)
+OCR_BACKEND = os.environ.get('OCR_BACKEND', 'tesserocr')
+
+# Tesseract language data to load
+OCR_LANGUAGE = os.environ.get('OCR_LANGUAGE', 'eng')
+
+# Resolution and colorspace ('gray' or 'rgb') pages are rendered at for OCR
+OCR_DPI = _env_int('OCR_DPI', 144)
+OCR_COLORSPACE = os.environ.get('OCR_COLORSPACE', 'gray')
+
+# Pages OCR'd concurrently (OCR threads, each with its own engine or
+# tesseract process). When raising this, consider OMP_THREAD_LIMIT=1 so
+# Tesseract does not also fan out across every core internally.
+OCR_MAX_WORKERS = _env_int('OCR_MAX_WORKERS', min(4, os.cpu_count() or 1))
+
+# Pages whose embedded text is shorter than this are OCR'd
+OCR_MIN_PAGE_CHARS = _env_int('OCR_MIN_PAGE_CHARS', 10)
+
+# ============================================
+# Parse budgets (results that hit one are flagged truncated)
+# ============================================
+# Pages read per PDF (0 reads every page)
+PDF_MAX_PAGES = _env_int('PDF_MAX_PAGES', 50)
+
+# Largest page rendering for OCR, in pixels; bigger pages are rendered at
+# a lower DPI and pages embedding a bigger image are not rendered (0 = no limit)
+PDF_MAX_RENDER_PIXELS = _env_int('PDF_MAX_RENDER_PIXELS', 40 * 1000 * 1000)
+
+# Seconds one PDF may spend in text extraction and OCR; the parser then
+# stops and returns the text it has (0 = no deadline). Keep below WEB_TIMEOUT.
+PDF_PARSE_DEADLINE = _env_float('PDF_PARSE_DEADLINE', 60.0)
+
+# Starting estimate of OCR seconds per rendered megapixel, refined from the
+# pages each process recognizes; pages whose estimate does not fit in the
+# time left are not sent to OCR
+OCR_SECONDS_PER_MEGAPIXEL = _env_float('OCR_SECONDS_PER_MEGAPIXEL', 0.5)
+
+# ============================================
+# Local storage
+# ============================================
+# Directory of the ml-service package, used to anchor local data files
+SERVICE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Durable local state (job queue, indexes)
+DATA_DIR = os.environ.get('ML_DATA_DIR', os.path.join(SERVICE_DIR, '.data'))
+
+# ============================================
+# Parse result cache
+# ============================================
+PARSE_CACHE_ENABLED = os.environ.get('PARSE_CACHE_ENABLED', '1') != '0'
+
+# Parse results kept in the in-process LRU tier
+PARSE_CACHE_MEMORY_ITEMS = _env_int('PARSE_CACHE_MEMORY_ITEMS', 256)
+
+# SQLite file of the persistent tier (empty string disables it)
+PARSE_CACHE_PATH = os.environ.get(
+    'PARSE_CACHE_PATH', os.path.join(SERVICE_DIR, '.cache', 'parse_cache.sqlite3')
+)
+
+# Size budget of the persistent tier; least recently used entries are evicted
+PARSE_CACHE_MAX_BYTES = _env_int('PARSE_CACHE_MAX_BYTES', 512 * 1024 * 1024)
+
+# ============================================
+# Async parse jobs
+# ============================================
+# SQLite file backing the durable job queue
+JOB_QUEUE_PATH = os.environ.get('JOB_QUEUE_PATH', os.path.join(DATA_DIR, 'jobs.sqlite3'))
+
+# Worker threads draining the queue inside each web process (0 leaves the
+# queue to standalone workers started with `python -m jobs.worker`)
+JOB_WORKERS = _env_int('JOB_WORKERS', 2)
+
+# Seconds an idle worker waits before polling the queue again
+JOB_POLL_INTERVAL = _env_float('JOB_POLL_INTERVAL', 1.0)
+
+# Running jobs not finished within this many seconds are assumed lost
+# (worker crashed) and handed to another worker
+JOB_LEASE_SECONDS = _env_int('JOB_LEASE_SECONDS', 600)
+
+# Attempts before a repeatedly lost job is marked as failed
+JOB_MAX_ATTEMPTS = _env_int('JOB_MAX_ATTEMPTS', 3)
+
+# Finished jobs (and their results) are deleted after this many seconds
+JOB_RETENTION_SECONDS = _env_int('JOB_RETENTION_SECONDS', 24 * 60 * 60)
+
+# ============================================
+# Uploads
+# ============================================
+# Largest PDF accepted per file; bigger uploads are rejected while streaming
+UPLOAD_MAX_BYTES = _env_int('UPLOAD_MAX_BYTES', 50 * 1024 * 1024)
+
+# Uploads larger than this are spooled to a temp file instead of memory
+UPLOAD_SPOOL_BYTES = _env_int('UPLOAD_SPOOL_BYTES', 1024 * 1024)
+
+# Directory for spooled uploads (system temp directory if unset)
+UPLOAD_TEMP_DIR = os.environ.get('UPLOAD_TEMP_DIR') or None
+
+# ============================================
+# Responses
+# ============================================
+# Compress JSON responses (zstd or gzip, from Accept-Encoding)
+RESPONSE_COMPRESSION_ENABLED = os.environ.get('RESPONSE_COMPRESSION_ENABLED', '1') != '0'
+
+# Responses smaller than this are sent uncompressed
+RESPONSE_COMPRESSION_MIN_BYTES = _env_int('RESPONSE_COMPRESSION_MIN_BYTES', 1024)
+
+# Compression levels (favour speed; payloads are mostly repetitive JSON)
+RESPONSE_GZIP_LEVEL = _env_int('RESPONSE_GZIP_LEVEL', 5)
+RESPONSE_ZSTD_LEVEL = _env_int('RESPONSE_ZSTD_LEVEL', 3)
+
+# ============================================
+# Production server (gunicorn -c gunicorn.conf.py wsgi:app)
+# ============================================
+# Address the server listens on
+WEB_BIND = os.environ.get('WEB_BIND', '0.0.0.0:5000')
+
+# Worker processes; parsing is CPU-bound, so roughly one per core
+WEB_WORKERS = _env_int('WEB_WORKERS', os.cpu_count() or 1)
+
+# Request threads per worker (overlap upload reads and OCR waits)
+WEB_THREADS = _env_int('WEB_THREADS', 4)
+
+# Seconds a request may run before its worker is restarted
+WEB_TIMEOUT = _env_int('WEB_TIMEOUT', 120)
+
+# Restart workers after this many requests (0 disables), with jitter
+WEB_MAX_REQUESTS = _env_int('WEB_MAX_REQUESTS', 0)
+WEB_MAX_REQUESTS_JITTER = _env_int('WEB_MAX_REQUESTS_JITTER', 50)
+
+# Warm up each worker in the background after it starts (reported by /readyz)
+WEB_WARMUP = os.environ.get('WEB_WARMUP', '1') != '0'
+
+# ============================================
+# Fuzzy skill matching (OCR'd pages only)
+# ============================================
+FUZZY_SKILLS_ENABLED = os.environ.get('FUZZY_SKILLS_ENABLED', '1') != '0'
+
+# Lowest confidence (1 - weighted edit cost / skill length) accepted as a match
+FUZZY_SKILLS_MIN_CONFIDENCE = _env_float('FUZZY_SKILLS_MIN_CONFIDENCE', 0.85)
+
+# ============================================
+# Streaming skill extraction (/extract-skills/batch)
+# ============================================
+# Documents extracted (and results written back) per chunk
+EXTRACT_SKILLS_CHUNK_SIZE = _env_int('EXTRACT_SKILLS_CHUNK_SIZE', 256)
+
+# Longest accepted NDJSON line; longer documents get an error record
+EXTRACT_SKILLS_MAX_LINE_BYTES = _env_int('EXTRACT_SKILLS_MAX_LINE_BYTES', 1024 * 1024)
+
+# ============================================
+# Skills vocabulary
+# ============================================
+# Versioned JSON file with skill categories and aliases
+SKILLS_PATH = os.environ.get('SKILLS_PATH', os.path.join(SERVICE_DIR, 'config', 'skills.json'))
+
+# Seconds between checks of the skills file for changes (0 disables reloading)
+SKILLS_RELOAD_INTERVAL = _env_float('SKILLS_RELOAD_INTERVAL', 30.0)
+
+# ============================================
+# Job recommendations (/job-postings, /recommend, /match)
+# ============================================
+# BM25 term-frequency saturation and length normalization
+JOB_INDEX_BM25_K1 = _env_float('JOB_INDEX_BM25_K1', 1.2)
+JOB_INDEX_BM25_B = _env_float('JOB_INDEX_BM25_B', 0.75)
+
+# Maximum postings accepted in one /job-postings request
+JOB_POSTINGS_MAX_BATCH = _env_int('JOB_POSTINGS_MAX_BATCH', 1000)
+
+# Recommendations returned by default, and the most a request may ask for
+RECOMMEND_DEFAULT_TOP_K = _env_int('RECOMMEND_DEFAULT_TOP_K', 10)
+RECOMMEND_MAX_TOP_K = _env_int('RECOMMEND_MAX_TOP_K', 100)
+
+# Maximum job descriptions scored against one resume by /match
+MATCH_MAX_JOBS = _env_int('MATCH_MAX_JOBS', 50000)
+
+# ============================================
+# Semantic job similarity (/similar-jobs)
+# ============================================
+VECTOR_STORE_ENABLED = os.environ.get('VECTOR_STORE_ENABLED', '1') != '0'
+
+# Directory of the memory-mapped job vector store (shared by all workers)
+VECTOR_STORE_PATH = os.environ.get('VECTOR_STORE_PATH', os.path.join(DATA_DIR, 'job_vectors'))
+
+# Width of the hashed text vectors (changing it requires a new store)
+VECTOR_DIM = _env_int('VECTOR_DIM', 256)
+
+# ============================================
+# Job store and bulk ingestion (python -m matching.ingest, /job-postings/ingest)
+# ============================================
+JOB_STORE_PATH = os.environ.get('JOB_STORE_PATH', os.path.join(DATA_DIR, 'job_postings.sqlite3'))
+
+# Seconds between checks for postings written by other processes
+JOB_INDEX_SYNC_INTERVAL = _env_float('JOB_INDEX_SYNC_INTERVAL', 5.0)
+
+# Extraction processes and postings per batch (one store transaction each)
+INGEST_WORKERS = _env_int('INGEST_WORKERS', os.cpu_count() or 1)
+INGEST_BATCH_SIZE = _env_int('INGEST_BATCH_SIZE', 500)
+
+# Postings whose SimHash fingerprints differ in at most this many bits are duplicates
+INGEST_NEAR_DUPLICATE_BITS = _env_int('INGEST_NEAR_DUPLICATE_BITS', 3)
+
+# Where feeds uploaded to /job-postings/ingest are kept until ingested
+INGEST_UPLOAD_DIR = os.environ.get('INGEST_UPLOAD_DIR', os.path.join(DATA_DIR, 'ingest'))
@@ -1,91 +1,110 @@
 """
 Skills Database Configuration
-Contains comprehensive list of technical skills for resume parsing
+Loads the skill vocabulary (categories and aliases) from a versioned data file
+
+The vocabulary lives in config/skills.json (or the file named by the
+SKILLS_PATH setting):
+
+    {
+        "version": "2026.10.18",
+        "categories": {"programming": ["python", ...], ...},
+        "aliases": {"kubernetes": ["k8s"], ...}
+    }
+
+Running services pick up changes to the file without a restart (see
+extractors.skill_registry). The constants below are the vocabulary as
+loaded at import time.
 """
 
-# Programming Languages
-PROGRAMMING_LANGUAGES = [
-    'python', 'javascript', 'java', 'c++', 'c#', 'typescript', 'go', 'rust',
-    'php', 'ruby', 'swift', 'kotlin', 'scala', 'r', 'matlab', 'perl',
-    'dart', 'c', 'objective-c', 'groovy', 'lua', 'shell', 'bash'
-]
-
-# Frontend Technologies
-FRONTEND_TECH = [
-    'react', 'vue', 'angular', 'html', 'css', 'tailwind', 'bootstrap',
-    'next.js', 'nuxt', 'redux', 'webpack', 'sass', 'less', 'svelte',
-    'jquery', 'backbone.js', 'ember.js', 'material-ui', 'chakra ui'
-]
-
-# Backend Technologies
-BACKEND_TECH = [
-    'node.js', 'express', 'django', 'flask', 'fastapi', 'spring boot',
-    'asp.net', 'laravel', 'rails', 'nest.js', 'koa', 'hapi',
-    'gin', 'echo', 'actix', 'axum'
-]
-
-# Databases
-DATABASES = [
-    'mongodb', 'mysql', 'postgresql', 'redis', 'sqlite', 'oracle',
-    'cassandra', 'dynamodb', 'elasticsearch', 'neo4j', 'couchdb',
-    'mariadb', 'mssql', 'firebase', 'supabase'
-]
-
-# Cloud & DevOps
-CLOUD_DEVOPS = [
-    'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins',
-    'git', 'github', 'gitlab', 'ci/cd', 'terraform', 'ansible',
-    'circleci', 'travis ci', 'bitbucket', 'heroku', 'vercel',
-    'netlify', 'cloudflare', 'nginx', 'apache'
-]
-
-# Mobile Development
-MOBILE_DEV = [
-    'android', 'ios', 'react native', 'flutter', 'xamarin',
-    'ionic', 'cordova', 'swift', 'kotlin'
-]
-
-# Data Science & ML
-DATA_SCIENCE_ML = [
-    'machine learning', 'deep learning', 'tensorflow', 'pytorch',
-    'scikit-learn', 'pandas', 'numpy', 'jupyter', 'keras',
-    'opencv', 'nltk', 'spacy', 'transformers', 'langchain',
-    'data analysis', 'data visualization', 'tableau', 'power bi'
-]
-
-# Other Technologies
-OTHER_TECH = [
-    'api', 'rest', 'graphql', 'microservices', 'agile', 'scrum',
-    'linux', 'windows', 'macos', 'websocket', 'grpc', 'rabbitmq',
-    'kafka', 'celery', 'pytest', 'jest', 'mocha', 'selenium',
-    'cypress', 'postman', 'swagger', 'oauth', 'jwt', 'blockchain',
-    'web3', 'solidity', 'ethereum'
-]
-
-# Combine all skills
-ALL_SKILLS = (
-    PROGRAMMING_LANGUAGES + 
-    FRONTEND_TECH + 
-    BACKEND_TECH + 
-    DATABASES + 
-    CLOUD_DEVOPS + 
-    MOBILE_DEV + 
-    DATA_SCIENCE_ML + 
-    OTHER_TECH
-)
-
-# Remove duplicates and sort
-ALL_SKILLS = sorted(list(set(ALL_SKILLS)))
-
-# For easier categorization later
-SKILL_CATEGORIES = {
-    'programming': PROGRAMMING_LANGUAGES,
-    'frontend': FRONTEND_TECH,
-    'backend': BACKEND_TECH,
-    'database': DATABASES,
-    'cloud_devops': CLOUD_DEVOPS,
-    'mobile': MOBILE_DEV,
-    'data_science': DATA_SCIENCE_ML,
-    'other': OTHER_TECH
-}
+import hashlib
+import json
+
+from . import settings
+
+
+def load_skills(path):
+    """
+    Read and validate a skills data file
+
+    Args:
+        path: Path of the JSON skills file
+
+    Returns:
+        dict: {
+            'version': str, declared version plus a fingerprint of the content,
+            'categories': dict of category -> list of canonical skills,
+            'aliases': dict of canonical skill -> list of alternative spellings,
+            'skills': sorted list of unique canonical skills
+        }
+
+    Raises:
+        ValueError: If the file is not a valid skills file
+        OSError: If the file cannot be read
+    """
+    with open(path, encoding='utf-8') as handle:
+        try:
+            data = json.load(handle)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid skills file {path}: {e}")
+
+    if not isinstance(data, dict):
+        raise ValueError(f"Invalid skills file {path}: expected a JSON object")
+
+    categories = data.get('categories')
+    if not isinstance(categories, dict) or not categories:
+        raise ValueError(
+            f"Invalid skills file {path}: 'categories' must be a non-empty object"
+        )
+    for category, skills in categories.items():
+        if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+            raise ValueError(
+                f"Invalid skills file {path}: category '{category}' must be a list of strings"
+            )
+
+    aliases = data.get('aliases', {})
+    if not isinstance(aliases, dict):
+        raise ValueError(f"Invalid skills file {path}: 'aliases' must be an object")
+    for skill, spellings in aliases.items():
+        if not isinstance(spellings, list) or not all(isinstance(alias, str) for alias in spellings):
+            raise ValueError(
+                f"Invalid skills file {path}: aliases of '{skill}' must be a list of strings"
+            )
+
+    # Remove duplicates and sort
+    skills = sorted(set(skill for category in categories.values() for skill in category))
+
+    unknown = sorted(skill for skill in aliases if skill not in skills)
+    if unknown:
+        raise ValueError(
+            f"Invalid skills file {path}: aliases for unknown skills: {', '.join(unknown)}"
+        )
+
+    # Fingerprint of the vocabulary; changes whenever a skill, category or
+    # alias is added or removed, even if the declared version was not bumped
+    fingerprint = hashlib.sha256('\n'.join(
+        sorted(f'{category}:{skill}' for category, members in categories.items()
+               for skill in members)
+        + sorted(f'{alias}={skill}' for skill, spellings in aliases.items()
+                 for alias in spellings)
+    ).encode('utf-8')).hexdigest()[:12]
+
+    return {
+        'version': f"{data.get('version', 'unversioned')}-{fingerprint}",
+        'categories': categories,
+        'aliases': aliases,
+        'skills': skills,
+    }
+
+
+_SKILLS = load_skills(settings.SKILLS_PATH)
+
+# Category -> skills (a skill may appear in several categories)
+SKILL_CATEGORIES = _SKILLS['categories']
+
+# Alternative spellings and abbreviations, matched as the canonical skill
+SKILL_ALIASES = _SKILLS['aliases']
+
+# Combined, de-duplicated and sorted
+ALL_SKILLS = _SKILLS['skills']
 
+SKILLS_VERSION = _SKILLS['version']
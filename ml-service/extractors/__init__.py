@@ -4,6 +4,12 @@ Handles information extraction from text
 """
 
 from .information_extractor import InformationExtractor
+from .skill_taxonomy import SkillTaxonomy
+from .skill_bitset import SkillBitset
+from .skill_registry import SkillRegistry, SkillVocabulary, get_skill_registry
 
-__all__ = ['InformationExtractor']
+__all__ = [
+    'InformationExtractor', 'SkillTaxonomy', 'SkillBitset',
+    'SkillRegistry', 'SkillVocabulary', 'get_skill_registry'
+]
 
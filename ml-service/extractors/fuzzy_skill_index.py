@@ -0,0 +1,222 @@
+"""
+Fuzzy Skill Index Module
+Edit-distance skill lookup for OCR text using a SymSpell deletion dictionary
+"""
+
+import re
+from itertools import combinations
+
+
+# Characters Tesseract commonly confuses; substituting one for the other
+# costs half an edit
+OCR_CONFUSIONS = {
+    ('0', 'o'), ('1', 'l'), ('1', 'i'), ('l', 'i'), ('|', 'l'), ('5', 's'),
+    ('8', 'b'), ('6', 'b'), ('9', 'g'), ('2', 'z'), ('v', 'y'), ('c', 'e'),
+}
+_CONFUSABLE = OCR_CONFUSIONS | {(b, a) for a, b in OCR_CONFUSIONS}
+_CONFUSION_COST = 0.5
+
+# Word-like OCR tokens, keeping symbols used inside skill names (c++, next.js, ci/cd)
+_TOKEN_PATTERN = re.compile(r'[\w|][\w|+#./-]*[\w|+#]|[\w|]')
+
+
+# Deletions indexed per surface form; two cover a full edit plus "rn" read as "m"
+_INDEX_DELETES = 2
+
+
+def _max_edits(length):
+    """
+    Edit cost tolerated for a skill of this length
+
+    Short skills are exact only. Up to eight characters only one OCR
+    confusion is tolerated: a full edit of a word that long is as likely
+    to be another word (window/windows, clutter/flutter, solidify/solidity)
+    as a misread skill.
+    """
+    if length < 5:
+        return 0
+    if length < 9:
+        return _CONFUSION_COST
+    if length < 14:
+        return 1
+    return 2
+
+
+def _deletes(word, max_edits):
+    """All strings obtained by deleting up to max_edits characters of word"""
+    variants = {word}
+    for edits in range(1, min(max_edits, len(word) - 1) + 1):
+        for positions in combinations(range(len(word)), edits):
+            variants.add(''.join(
+                char for index, char in enumerate(word) if index not in positions
+            ))
+    return variants
+
+
+def ocr_distance(source, target):
+    """
+    Weighted Damerau-Levenshtein distance tuned for OCR errors
+
+    Substituting OCR-confusable characters (0/o, 1/l, ...) and reading
+    "rn" as "m" cost half an edit; other edits and adjacent
+    transpositions cost one.
+
+    Args:
+        source: Token read from OCR text
+        target: Skill surface form
+
+    Returns:
+        float: Edit cost
+    """
+    rows, cols = len(source) + 1, len(target) + 1
+    dist = [[0.0] * cols for _ in range(rows)]
+    for i in range(rows):
+        dist[i][0] = float(i)
+    for j in range(cols):
+        dist[0][j] = float(j)
+
+    for i in range(1, rows):
+        for j in range(1, cols):
+            a, b = source[i - 1], target[j - 1]
+            if a == b:
+                substitution = 0.0
+            elif (a, b) in _CONFUSABLE:
+                substitution = _CONFUSION_COST
+            else:
+                substitution = 1.0
+
+            best = min(
+                dist[i - 1][j] + 1,
+                dist[i][j - 1] + 1,
+                dist[i - 1][j - 1] + substitution,
+            )
+
+            if i > 1 and j > 1 and a == target[j - 2] and source[i - 2] == b:
+                best = min(best, dist[i - 2][j - 2] + 1)
+
+            # "rn" <-> "m"
+            if i > 1 and source[i - 2:i] == 'rn' and b == 'm':
+                best = min(best, dist[i - 2][j - 1] + _CONFUSION_COST)
+            if j > 1 and target[j - 2:j] == 'rn' and a == 'm':
+                best = min(best, dist[i - 1][j - 2] + _CONFUSION_COST)
+
+            dist[i][j] = best
+
+    return dist[-1][-1]
+
+
+class FuzzySkillIndex:
+    """
+    Approximate skill matching for OCR'd text
+
+    Every skill surface form of at least five characters is indexed under
+    all strings obtained by deleting up to two of its characters. A token
+    is looked up by generating its own deletions, so candidates come from
+    a handful of dict lookups instead of comparing the token with every
+    skill; only those candidates are scored with the OCR-weighted edit
+    distance, against a budget that grows with the skill's length.
+
+    Short skills (``go``, ``c``, ``aws``) are never fuzzy matched: at that
+    length one edit turns them into ordinary words. Skills of up to eight
+    characters only absorb one OCR confusion (``pyth0n``, ``d0cker``), since
+    a full edit maps ordinary words onto them (``window`` onto ``windows``).
+    """
+
+    def __init__(self, surface_forms, min_confidence=0.85):
+        """
+        Args:
+            surface_forms: Dict of lowercased surface form -> canonical skill
+            min_confidence: Lowest confidence reported as a match
+        """
+        self.min_confidence = min_confidence
+        self._canonical = {}
+        self._deletes = {}
+        self._max_words = 1
+        self._max_length = 0
+
+        for surface, skill in surface_forms.items():
+            max_edits = _max_edits(len(surface))
+            if max_edits == 0:
+                continue
+
+            self._canonical[surface] = skill
+            self._max_words = max(self._max_words, surface.count(' ') + 1)
+            self._max_length = max(self._max_length, len(surface))
+            for variant in _deletes(surface, _INDEX_DELETES):
+                self._deletes.setdefault(variant, set()).add(surface)
+
+    def lookup(self, token):
+        """
+        Find the closest skill to a token
+
+        Args:
+            token: Lowercased token or space-joined token n-gram
+
+        Returns:
+            tuple or None: (skill, surface, confidence) of the best match
+        """
+        if len(token) < 5 or len(token) > self._max_length + 2:
+            return None
+
+        candidates = set()
+        for variant in _deletes(token, _INDEX_DELETES):
+            candidates.update(self._deletes.get(variant, ()))
+
+        best = None
+        for surface in candidates:
+            max_edits = _max_edits(len(surface))
+            # Each character of length difference costs at least half an edit ("rn" -> "m")
+            if abs(len(surface) - len(token)) * _CONFUSION_COST > max_edits:
+                continue
+            cost = ocr_distance(token, surface)
+            if cost > max_edits:
+                continue
+            confidence = round(1 - cost / len(surface), 3)
+            if best is None or confidence > best[2]:
+                best = (self._canonical[surface], surface, confidence)
+
+        if best is None or best[2] < self.min_confidence:
+            return None
+        return best
+
+    def find(self, text):
+        """
+        Fuzzy-match skills against every token and token n-gram of a text
+
+        Args:
+            text: OCR text
+
+        Returns:
+            dict: Skill -> {'count': int, 'confidence': float (best seen),
+                            'matched': str (token with the best confidence)}
+        """
+        hits = {}
+        if not text or not self._canonical:
+            return hits
+
+        tokens = [token.lower() for token in _TOKEN_PATTERN.findall(text)]
+        lookups = {}
+
+        for start in range(len(tokens)):
+            for size in range(1, self._max_words + 1):
+                if start + size > len(tokens):
+                    break
+                phrase = ' '.join(tokens[start:start + size])
+
+                if phrase not in lookups:
+                    lookups[phrase] = self.lookup(phrase)
+                match = lookups[phrase]
+                if match is None:
+                    continue
+
+                skill, _, confidence = match
+                entry = hits.get(skill)
+                if entry is None:
+                    hits[skill] = {'count': 1, 'confidence': confidence, 'matched': phrase}
+                else:
+                    entry['count'] += 1
+                    if confidence > entry['confidence']:
+                        entry['confidence'] = confidence
+                        entry['matched'] = phrase
+
+        return hits
@@ -3,42 +3,134 @@ Information Extractor Module
 Extracts structured information from resume text
 """
 
-import re
-from config.skills_database import ALL_SKILLS
+from config import settings
+from monitoring import time_stage, timed
+from .skill_registry import get_skill_registry
+from .section_segmenter import SectionSegmenter
+from . import patterns
 
 
 class InformationExtractor:
     """Extract structured information from resume text"""
     
-    def __init__(self):
-        self.skills_database = ALL_SKILLS
+    def __init__(self, skill_registry=None):
+        """
+        Args:
+            skill_registry: SkillRegistry providing the skill vocabulary
+                            (default: the process-wide registry)
+        """
+        # Compiled skill matcher, taxonomy and fuzzy index; swapped
+        # atomically when the skills file changes
+        self.skill_registry = skill_registry or get_skill_registry()
+        self.segmenter = SectionSegmenter()
+    
+    @property
+    def vocabulary(self):
+        """Active SkillVocabulary (take it once per request for a consistent view)"""
+        return self.skill_registry.current
+    
+    @property
+    def skills_version(self):
+        """Version of the active skills vocabulary"""
+        return self.skill_registry.current.version
+    
+    @property
+    def skills_database(self):
+        """Canonical skills of the active vocabulary"""
+        return self.skill_registry.current.skills
+    
+    @property
+    def taxonomy(self):
+        """SkillTaxonomy of the active vocabulary"""
+        return self.skill_registry.current.taxonomy
+    
+    @timed('extract_skill_hits')
+    def extract_skill_hits(self, text, vocabulary=None):
+        """
+        Find every skill occurrence in text with offsets and counts
+        
+        Args:
+            text: Resume text content
+            vocabulary: SkillVocabulary to use (default: the active one)
+            
+        Returns:
+            dict: Skill -> {'count': int, 'offsets': [(start, end), ...]}
+        """
+        if not text:
+            return {}
+        
+        # Compiled once per vocabulary; aliases ("k8s", "reactjs") are
+        # reported as their canonical skill
+        return (vocabulary or self.vocabulary).matcher.find(text)
     
-    def extract_skills(self, text):
+    @timed('extract_skills')
+    def extract_skills(self, text, vocabulary=None):
         """
         Find skills in text using keyword matching
         
         Args:
             text: Resume text content
+            vocabulary: SkillVocabulary to use (default: the active one)
             
         Returns:
-            list: Found skills sorted alphabetically
+            list: Found canonical skills sorted alphabetically
         """
         if not text:
             return []
         
-        text_lower = text.lower()
-        found_skills = []
+        # Single scan over the text; word boundaries avoid partial matches
+        # e.g., "react" won't match "create"
+        return sorted(self.extract_skill_hits(text, vocabulary))
+    
+    @timed('extract_fuzzy_skills')
+    def extract_fuzzy_skills(self, text, exclude=(), vocabulary=None):
+        """
+        Find skills misspelled by OCR using approximate matching
+        
+        Args:
+            text: OCR text (only OCR'd pages; clean text does not need it)
+            exclude: Skills already found by exact matching
+            vocabulary: SkillVocabulary to use (default: the active one)
+            
+        Returns:
+            dict: Skill -> {'confidence': float, 'matched': str}, only
+                  for skills not in exclude
+        """
+        if not text:
+            return {}
+        
+        # Edit-distance index: exact matching misses misread skills
+        # ("pyth0n", "kubemetes")
+        fuzzy_index = (vocabulary or self.vocabulary).fuzzy_index
+        
+        excluded = set(exclude)
+        return {
+            skill: {'confidence': hit['confidence'], 'matched': hit['matched']}
+            for skill, hit in sorted(fuzzy_index.find(text).items())
+            if skill not in excluded
+        }
+    
+    @timed('extract_skill_categories')
+    def extract_skill_categories(self, text, skills=None, vocabulary=None):
+        """
+        Group the skills found in text by category
         
-        for skill in self.skills_database:
-            # Use word boundaries to avoid partial matches
-            # e.g., "react" won't match "create"
-            pattern = r'\b' + re.escape(skill.lower()) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
+        Args:
+            text: Resume text content
+            skills: Skills already extracted from text (avoids a second scan)
+            vocabulary: SkillVocabulary to use (default: the active one)
+            
+        Returns:
+            dict: Category -> sorted canonical skills; skills in several
+                  categories (e.g. swift) appear under each of them
+        """
+        vocabulary = vocabulary or self.vocabulary
+        if skills is None:
+            skills = self.extract_skills(text, vocabulary)
         
-        # Remove duplicates and sort
-        return sorted(list(set(found_skills)))
+        return vocabulary.taxonomy.categorize(skills)
     
+    @timed('extract_email')
     def extract_email(self, text):
         """
         Extract email address using regex
@@ -53,8 +145,7 @@ class InformationExtractor:
             return None
         
         # Comprehensive email regex pattern
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        emails = re.findall(email_pattern, text)
+        emails = patterns.EMAIL_PATTERN.findall(text)
         
         # Return first valid email
         if emails:
@@ -65,6 +156,7 @@ class InformationExtractor:
         
         return None
     
+    @timed('extract_phone')
     def extract_phone(self, text):
         """
         Extract phone number - supports multiple formats
@@ -78,22 +170,15 @@ class InformationExtractor:
         if not text:
             return None
         
-        # Multiple phone number patterns
-        phone_patterns = [
-            r'[\+]?91[-\s]?[6-9]\d{9}',  # Indian: +91 9876543210
-            r'[6-9]\d{9}',  # Indian without code: 9876543210
-            r'\(\d{3}\)[-\s]?\d{3}[-\s]?\d{4}',  # US: (123) 456-7890
-            r'\d{3}[-\s]\d{3}[-\s]\d{4}',  # US: 123-456-7890
-            r'\+\d{1,3}[-\s]?\d{3}[-\s]?\d{3}[-\s]?\d{4}',  # International
-        ]
-        
-        for pattern in phone_patterns:
-            phones = re.findall(pattern, text)
-            if phones:
-                return phones[0]
+        # Phone formats in priority order; the first format found wins
+        for _, phone_pattern in patterns.PHONE_PATTERNS:
+            match = phone_pattern.search(text)
+            if match:
+                return match.group(0)
         
         return None
     
+    @timed('extract_name')
     def extract_name(self, text):
         """
         Attempt to extract name from resume
@@ -123,11 +208,12 @@ class InformationExtractor:
             words = line.split()
             if 2 <= len(words) <= 4 and line[0].isupper():
                 # Check if looks like a name (no special chars except .)
-                if re.match(r'^[A-Z][a-z]+(\s[A-Z][a-z.]+)+$', line):
+                if patterns.NAME_PATTERN.match(line):
                     return line
         
         return None
     
+    @timed('extract_urls')
     def extract_urls(self, text):
         """
         Extract URLs (LinkedIn, GitHub, portfolio, etc.)
@@ -144,20 +230,17 @@ class InformationExtractor:
         urls = {}
         
         # LinkedIn
-        linkedin_pattern = r'linkedin\.com/in/[\w-]+'
-        linkedin = re.search(linkedin_pattern, text, re.IGNORECASE)
+        linkedin = patterns.LINKEDIN_PATTERN.search(text)
         if linkedin:
             urls['linkedin'] = 'https://' + linkedin.group(0)
         
         # GitHub
-        github_pattern = r'github\.com/[\w-]+'
-        github = re.search(github_pattern, text, re.IGNORECASE)
+        github = patterns.GITHUB_PATTERN.search(text)
         if github:
             urls['github'] = 'https://' + github.group(0)
         
         # Portfolio/Website (general URL)
-        url_pattern = r'https?://(?:www\.)?[\w\.-]+\.\w+/?[\w\.-]*'
-        all_urls = re.findall(url_pattern, text, re.IGNORECASE)
+        all_urls = patterns.URL_PATTERN.findall(text)
         if all_urls:
             # Filter out LinkedIn and GitHub (already captured)
             portfolio_urls = [u for u in all_urls 
@@ -167,6 +250,7 @@ class InformationExtractor:
         
         return urls
     
+    @timed('extract_years_of_experience')
     def extract_years_of_experience(self, text):
         """
         Estimate years of experience from text
@@ -181,8 +265,7 @@ class InformationExtractor:
             return None
         
         # Look for explicit mentions like "5 years of experience"
-        exp_pattern = r'(\d+)[\s\-+]+years?\s+(?:of\s+)?experience'
-        matches = re.findall(exp_pattern, text, re.IGNORECASE)
+        matches = patterns.EXPERIENCE_YEARS_PATTERN.findall(text)
         
         if matches:
             # Return the highest number found
@@ -190,8 +273,7 @@ class InformationExtractor:
         
         # Alternatively, count date ranges (rough estimate)
         # e.g., "2018-2020", "Jan 2019 - Dec 2021"
-        year_pattern = r'(19|20)\d{2}'
-        years = re.findall(year_pattern, text)
+        years = patterns.YEAR_PATTERN.findall(text)
         
         if len(years) >= 2:
             years_int = [int(y) for y in years]
@@ -200,12 +282,14 @@ class InformationExtractor:
         
         return None
     
-    def extract_education(self, text):
+    @timed('extract_education')
+    def extract_education(self, text, sections=None):
         """
         Extract education information
         
         Args:
             text: Resume text content
+            sections: Optional ResumeSections already segmented from text
             
         Returns:
             list: List of education entries
@@ -215,86 +299,56 @@ class InformationExtractor:
         
         education = []
         
-        # Common degree patterns
-        degrees = [
-            r'\b(B\.?Tech|Bachelor of Technology)\b',
-            r'\b(B\.?E\.?|Bachelor of Engineering)\b',
-            r'\b(M\.?Tech|Master of Technology)\b',
-            r'\b(M\.?E\.?|Master of Engineering)\b',
-            r'\b(B\.?Sc\.?|Bachelor of Science)\b',
-            r'\b(M\.?Sc\.?|Master of Science)\b',
-            r'\b(B\.?A\.?|Bachelor of Arts)\b',
-            r'\b(M\.?A\.?|Master of Arts)\b',
-            r'\b(MBA|Master of Business Administration)\b',
-            r'\b(BBA|Bachelor of Business Administration)\b',
-            r'\b(Ph\.?D\.?|Doctorate)\b',
-            r'\b(B\.?Com\.?|Bachelor of Commerce)\b',
-            r'\b(M\.?Com\.?|Master of Commerce)\b',
-        ]
-        
-        # Look for education section
-        education_keywords = ['education', 'academic', 'qualification', 'degree']
-        lines = text.split('\n')
+        # Education section lines (up to the next section heading)
+        if sections is None:
+            sections = self.segmenter.segment(text)
         
-        in_education_section = False
         current_entry = {}
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            
-            # Detect education section start
-            if any(keyword in line_lower for keyword in education_keywords):
-                in_education_section = True
-                continue
+        for line, line_lower in sections.lines('education'):
+            # Check for degree
+            for _, degree_pattern in patterns.DEGREE_PATTERNS:
+                degree_match = degree_pattern.search(line)
+                if degree_match:
+                    if current_entry:
+                        education.append(current_entry)
+                    current_entry = {
+                        'degree': degree_match.group(0),
+                        'institution': '',
+                        'year': '',
+                        'field': ''
+                    }
+                    
+                    # Try to extract field of study from same line
+                    field_match = patterns.FIELD_OF_STUDY_PATTERN.search(line)
+                    if field_match:
+                        current_entry['field'] = field_match.group(1).strip()
             
-            # Stop at next section
-            if in_education_section and any(keyword in line_lower for keyword in 
-                ['experience', 'work history', 'projects', 'skills', 'certifications']):
-                if current_entry:
-                    education.append(current_entry)
-                break
+            # Extract year (4 digits)
+            year_match = patterns.GRADUATION_YEAR_PATTERN.search(line)
+            if year_match and current_entry:
+                current_entry['year'] = year_match.group(0)
             
-            if in_education_section:
-                # Check for degree
-                for degree_pattern in degrees:
-                    if re.search(degree_pattern, line, re.IGNORECASE):
-                        if current_entry:
-                            education.append(current_entry)
-                        current_entry = {
-                            'degree': re.search(degree_pattern, line, re.IGNORECASE).group(0),
-                            'institution': '',
-                            'year': '',
-                            'field': ''
-                        }
-                        
-                        # Try to extract field of study from same line
-                        field_match = re.search(r'in\s+([A-Z][a-zA-Z\s&]+)', line)
-                        if field_match:
-                            current_entry['field'] = field_match.group(1).strip()
-                
-                # Extract year (4 digits)
-                year_match = re.search(r'\b(19|20)\d{2}\b', line)
-                if year_match and current_entry:
-                    current_entry['year'] = year_match.group(0)
-                
-                # Institution (usually capitalized words)
-                if current_entry and not current_entry['institution']:
-                    # Look for capitalized multi-word names
-                    inst_match = re.search(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){2,})', line)
-                    if inst_match:
-                        current_entry['institution'] = inst_match.group(0)
+            # Institution (usually capitalized words)
+            if current_entry and not current_entry['institution']:
+                # Look for capitalized multi-word names
+                inst_match = patterns.INSTITUTION_PATTERN.search(line)
+                if inst_match:
+                    current_entry['institution'] = inst_match.group(0)
         
         if current_entry:
             education.append(current_entry)
         
         return education
     
-    def extract_experience(self, text):
+    @timed('extract_experience')
+    def extract_experience(self, text, sections=None):
         """
         Extract work experience information
         
         Args:
             text: Resume text content
+            sections: Optional ResumeSections already segmented from text
             
         Returns:
             list: List of work experience entries
@@ -304,65 +358,53 @@ class InformationExtractor:
         
         experience = []
         
-        # Look for experience section
-        experience_keywords = ['experience', 'work history', 'employment', 'professional background']
-        lines = text.split('\n')
+        # Experience section lines (up to the next section heading)
+        if sections is None:
+            sections = self.segmenter.segment(text)
         
-        in_experience_section = False
         current_entry = {}
         
-        for i, line in enumerate(lines):
-            line_lower = line.lower().strip()
-            
-            # Detect experience section start
-            if any(keyword in line_lower for keyword in experience_keywords):
-                in_experience_section = True
+        for line, line_lower in sections.lines('experience'):
+            if not line_lower:
                 continue
             
-            # Stop at next section
-            if in_experience_section and any(keyword in line_lower for keyword in 
-                ['education', 'skills', 'projects', 'certifications', 'achievements']):
+            # Look for date patterns (2020-2022, Jan 2020 - Dec 2022)
+            duration_match = patterns.DATE_RANGE_PATTERN.search(line)
+            
+            if duration_match:
                 if current_entry:
                     experience.append(current_entry)
-                break
+                current_entry = {
+                    'position': '',
+                    'company': '',
+                    'duration': duration_match.group(0)
+                }
             
-            if in_experience_section and line.strip():
-                # Look for date patterns (2020-2022, Jan 2020 - Dec 2022)
-                date_pattern = r'\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?\d{4}\s*[-–]\s*(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?\d{4}\b|\bPresent\b|\bCurrent\b'
-                duration_match = re.search(date_pattern, line, re.IGNORECASE)
-                
-                if duration_match:
-                    if current_entry:
-                        experience.append(current_entry)
-                    current_entry = {
-                        'position': '',
-                        'company': '',
-                        'duration': duration_match.group(0)
-                    }
-                
-                # Common position titles
-                position_keywords = ['engineer', 'developer', 'analyst', 'manager', 'intern', 
-                                   'consultant', 'designer', 'lead', 'architect', 'specialist']
-                if current_entry and not current_entry['position']:
-                    if any(keyword in line_lower for keyword in position_keywords):
-                        current_entry['position'] = line.strip()
-                
-                # Company name (usually after "at" or "@")
-                company_match = re.search(r'(?:at|@)\s+([A-Z][a-zA-Z\s&.,]+)', line)
-                if company_match and current_entry:
-                    current_entry['company'] = company_match.group(1).strip()
+            # Common position titles
+            position_keywords = ['engineer', 'developer', 'analyst', 'manager', 'intern', 
+                               'consultant', 'designer', 'lead', 'architect', 'specialist']
+            if current_entry and not current_entry['position']:
+                if any(keyword in line_lower for keyword in position_keywords):
+                    current_entry['position'] = line.strip()
+            
+            # Company name (usually after "at" or "@")
+            company_match = patterns.COMPANY_PATTERN.search(line)
+            if company_match and current_entry:
+                current_entry['company'] = company_match.group(1).strip()
         
         if current_entry:
             experience.append(current_entry)
         
         return experience
     
-    def extract_certifications(self, text):
+    @timed('extract_certifications')
+    def extract_certifications(self, text, sections=None):
         """
         Extract certifications
         
         Args:
             text: Resume text content
+            sections: Optional ResumeSections already segmented from text
             
         Returns:
             list: List of certifications
@@ -372,50 +414,39 @@ class InformationExtractor:
         
         certifications = []
         
-        # Common certification keywords
-        cert_keywords = ['certification', 'certificate', 'certified', 'license']
-        
         # Common certifications
         common_certs = [
             'AWS Certified', 'Azure', 'Google Cloud', 'PMP', 'CISSP',
             'CompTIA', 'Scrum Master', 'Six Sigma', 'ITIL', 'Oracle Certified'
         ]
         
-        lines = text.split('\n')
-        in_cert_section = False
+        # Certification section lines (up to the next section heading)
+        if sections is None:
+            sections = self.segmenter.segment(text)
         
-        for line in lines:
-            line_lower = line.lower().strip()
-            
-            # Detect certification section
-            if any(keyword in line_lower for keyword in cert_keywords):
-                in_cert_section = True
+        for line, line_lower in sections.lines('certifications'):
+            if not line_lower:
                 continue
             
-            # Stop at next section
-            if in_cert_section and any(keyword in line_lower for keyword in 
-                ['experience', 'education', 'skills', 'projects']):
-                break
-            
-            if in_cert_section and line.strip():
-                # Look for common certifications
-                for cert in common_certs:
-                    if cert.lower() in line_lower:
-                        certifications.append({
-                            'name': line.strip(),
-                            'issuer': cert.split()[0] if ' ' in cert else cert
-                        })
-                        break
-                else:
-                    # Generic certification entry
-                    if line.strip() and len(line.strip()) > 5:
-                        certifications.append({
-                            'name': line.strip(),
-                            'issuer': ''
-                        })
+            # Look for common certifications
+            for cert in common_certs:
+                if cert.lower() in line_lower:
+                    certifications.append({
+                        'name': line.strip(),
+                        'issuer': cert.split()[0] if ' ' in cert else cert
+                    })
+                    break
+            else:
+                # Generic certification entry
+                if line.strip() and len(line.strip()) > 5:
+                    certifications.append({
+                        'name': line.strip(),
+                        'issuer': ''
+                    })
         
         return certifications
     
+    @timed('extract_location')
     def extract_location(self, text):
         """
         Extract location/address
@@ -429,47 +460,57 @@ class InformationExtractor:
         if not text:
             return None
         
-        # Common Indian cities
-        cities = [
-            'Mumbai', 'Delhi', 'Bangalore', 'Bengaluru', 'Hyderabad', 'Chennai',
-            'Kolkata', 'Pune', 'Ahmedabad', 'Jaipur', 'Surat', 'Lucknow',
-            'Kanpur', 'Nagpur', 'Indore', 'Thane', 'Bhopal', 'Visakhapatnam',
-            'Patna', 'Vadodara', 'Ghaziabad', 'Ludhiana', 'Agra', 'Nashik',
-            'Noida', 'Gurugram', 'Gurgaon'
-        ]
-        
-        # Look for city names
-        for city in cities:
-            if re.search(r'\b' + city + r'\b', text, re.IGNORECASE):
-                # Try to get state/country with it
-                location_pattern = rf'\b{city}[,\s]+([A-Z][a-zA-Z\s]+)'
-                match = re.search(location_pattern, text, re.IGNORECASE)
-                if match:
-                    return match.group(0)
-                return city
+        # Leftmost known city, with state/country when it follows
+        match = patterns.LOCATION_PATTERN.search(text)
+        if match:
+            if match.group('region'):
+                return match.group(0)
+            return patterns.CITY_LOOKUP[match.group('city').lower()]
         
         return None
     
-    def extract_all(self, text):
+    @timed('extract_all')
+    def extract_all(self, text, ocr_texts=None):
         """
         Extract all information at once
         
         Args:
             text: Resume text content
+            ocr_texts: Text of the pages that were OCR'd, fuzzy matched for
+                       skills when settings.FUZZY_SKILLS_ENABLED is on
             
         Returns:
             dict: Dictionary containing all extracted information
         """
+        # Split and lowercase the lines once for all section extractors
+        with time_stage('segment_sections'):
+            sections = self.segmenter.segment(text)
+        
+        # One vocabulary for the whole resume, even if a reload lands mid-way
+        vocabulary = self.vocabulary
+        skills = self.extract_skills(text, vocabulary)
+        
+        # Skills OCR misspelled are added with their match confidence
+        fuzzy_skills = {}
+        if ocr_texts and settings.FUZZY_SKILLS_ENABLED:
+            fuzzy_skills = self.extract_fuzzy_skills(
+                '\n'.join(ocr_texts), exclude=skills, vocabulary=vocabulary
+            )
+            skills = sorted(set(skills) | set(fuzzy_skills))
+        
         return {
             'name': self.extract_name(text),
             'email': self.extract_email(text),
             'phone': self.extract_phone(text),
             'location': self.extract_location(text),
-            'skills': self.extract_skills(text),
-            'education': self.extract_education(text),
-            'experience': self.extract_experience(text),
-            'certifications': self.extract_certifications(text),
+            'skills': skills,
+            'skill_categories': self.extract_skill_categories(text, skills, vocabulary),
+            'fuzzy_skills': fuzzy_skills,
+            'education': self.extract_education(text, sections),
+            'experience': self.extract_experience(text, sections),
+            'certifications': self.extract_certifications(text, sections),
             'urls': self.extract_urls(text),
             'years_of_experience': self.extract_years_of_experience(text),
+            'skills_version': vocabulary.version,
         }
 
@@ -0,0 +1,131 @@
+"""
+Pattern Registry Module
+Compiled regular expressions used by the information extractor
+
+Every pattern is compiled once at import time so extraction never goes
+through the re module cache, which is easily flushed under load.
+"""
+
+import re
+
+
+# ============================================
+# Contact details
+# ============================================
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+
+# Phone formats in priority order. Each is searched for separately and the
+# first format with a match anywhere in the text wins: in one alternation a
+# lower-priority format could claim the span of a higher-priority one
+# ("+1 9876543210" must give the Indian number, not the international one)
+PHONE_FORMATS = (
+    ('indian_with_code', r'[\+]?91[-\s]?[6-9]\d{9}'),  # Indian: +91 9876543210
+    ('indian', r'[6-9]\d{9}'),  # Indian without code: 9876543210
+    ('us_parentheses', r'\(\d{3}\)[-\s]?\d{3}[-\s]?\d{4}'),  # US: (123) 456-7890
+    ('us', r'\d{3}[-\s]\d{3}[-\s]\d{4}'),  # US: 123-456-7890
+    ('international', r'\+\d{1,3}[-\s]?\d{3}[-\s]?\d{3}[-\s]?\d{4}'),  # International
+)
+
+PHONE_PATTERNS = tuple((name, re.compile(pattern)) for name, pattern in PHONE_FORMATS)
+
+NAME_PATTERN = re.compile(r'^[A-Z][a-z]+(\s[A-Z][a-z.]+)+$')
+
+# ============================================
+# URLs
+# ============================================
+LINKEDIN_PATTERN = re.compile(r'linkedin\.com/in/[\w-]+', re.IGNORECASE)
+GITHUB_PATTERN = re.compile(r'github\.com/[\w-]+', re.IGNORECASE)
+URL_PATTERN = re.compile(r'https?://(?:www\.)?[\w\.-]+\.\w+/?[\w\.-]*', re.IGNORECASE)
+
+# ============================================
+# Experience
+# ============================================
+EXPERIENCE_YEARS_PATTERN = re.compile(
+    r'(\d+)[\s\-+]+years?\s+(?:of\s+)?experience', re.IGNORECASE
+)
+
+# Captures the century only, findall() returns '19' / '20'
+YEAR_PATTERN = re.compile(r'(19|20)\d{2}')
+
+# Date ranges (2020-2022, Jan 2020 - Dec 2022) or open-ended roles
+DATE_RANGE_PATTERN = re.compile(
+    r'\b((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?\d{4}\s*[-–]\s*'
+    r'(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+)?\d{4}\b'
+    r'|\bPresent\b|\bCurrent\b',
+    re.IGNORECASE
+)
+
+# Company name (usually after "at" or "@")
+COMPANY_PATTERN = re.compile(r'(?:at|@)\s+([A-Z][a-zA-Z\s&.,]+)')
+
+# ============================================
+# Education
+# ============================================
+DEGREE_FORMATS = (
+    ('btech', r'B\.?Tech|Bachelor of Technology'),
+    ('be', r'B\.?E\.?|Bachelor of Engineering'),
+    ('mtech', r'M\.?Tech|Master of Technology'),
+    ('me', r'M\.?E\.?|Master of Engineering'),
+    ('bsc', r'B\.?Sc\.?|Bachelor of Science'),
+    ('msc', r'M\.?Sc\.?|Master of Science'),
+    ('ba', r'B\.?A\.?|Bachelor of Arts'),
+    ('ma', r'M\.?A\.?|Master of Arts'),
+    ('mba', r'MBA|Master of Business Administration'),
+    ('bba', r'BBA|Bachelor of Business Administration'),
+    ('phd', r'Ph\.?D\.?|Doctorate'),
+    ('bcom', r'B\.?Com\.?|Bachelor of Commerce'),
+    ('mcom', r'M\.?Com\.?|Master of Commerce'),
+)
+
+# One pattern per degree, tried in list order like the phone formats
+DEGREE_PATTERNS = tuple(
+    (name, re.compile(r'\b(?:' + pattern + r')\b', re.IGNORECASE))
+    for name, pattern in DEGREE_FORMATS
+)
+
+FIELD_OF_STUDY_PATTERN = re.compile(r'in\s+([A-Z][a-zA-Z\s&]+)')
+GRADUATION_YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+
+# Capitalized multi-word names (institutions)
+INSTITUTION_PATTERN = re.compile(r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+){2,})')
+
+# ============================================
+# Location
+# ============================================
+# Common Indian cities
+CITIES = [
+    'Mumbai', 'Delhi', 'Bangalore', 'Bengaluru', 'Hyderabad', 'Chennai',
+    'Kolkata', 'Pune', 'Ahmedabad', 'Jaipur', 'Surat', 'Lucknow',
+    'Kanpur', 'Nagpur', 'Indore', 'Thane', 'Bhopal', 'Visakhapatnam',
+    'Patna', 'Vadodara', 'Ghaziabad', 'Ludhiana', 'Agra', 'Nashik',
+    'Noida', 'Gurugram', 'Gurgaon'
+]
+
+CITY_LOOKUP = {city.lower(): city for city in CITIES}
+
+# City, optionally followed by state/country
+LOCATION_PATTERN = re.compile(
+    r'\b(?P<city>' + '|'.join(CITIES) + r')\b(?P<region>[,\s]+[A-Z][a-zA-Z\s]+)?',
+    re.IGNORECASE
+)
+
+# ============================================
+# Registry
+# ============================================
+PATTERNS = {
+    'email': EMAIL_PATTERN,
+    **{f'phone_{name}': pattern for name, pattern in PHONE_PATTERNS},
+    'name': NAME_PATTERN,
+    'linkedin': LINKEDIN_PATTERN,
+    'github': GITHUB_PATTERN,
+    'url': URL_PATTERN,
+    'experience_years': EXPERIENCE_YEARS_PATTERN,
+    'year': YEAR_PATTERN,
+    'date_range': DATE_RANGE_PATTERN,
+    'company': COMPANY_PATTERN,
+    **{f'degree_{name}': pattern for name, pattern in DEGREE_PATTERNS},
+    'field_of_study': FIELD_OF_STUDY_PATTERN,
+    'graduation_year': GRADUATION_YEAR_PATTERN,
+    'institution': INSTITUTION_PATTERN,
+    'location': LOCATION_PATTERN,
+}
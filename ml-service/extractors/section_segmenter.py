@@ -0,0 +1,208 @@
+"""
+Section Segmenter Module
+Splits resume text into labelled sections in a single pass over its lines
+
+Headings are short lines (at most HEADING_MAX_LENGTH characters) that
+start with a section keyword. Before segmentation, any line containing a
+keyword switched sections, so "My Education" or "Summary of skills and
+experience" used to open or close a section and no longer do.
+"""
+
+import re
+
+
+# Keywords of the heading that opens each section
+SECTION_KEYWORDS = {
+    'education': ['education', 'academic', 'qualification', 'degree'],
+    'experience': ['experience', 'work history', 'employment', 'professional background'],
+    'certifications': ['certification', 'certificate', 'certified', 'license'],
+}
+
+# Keywords of the headings that close each section
+SECTION_END_KEYWORDS = {
+    'education': ['experience', 'work history', 'projects', 'skills', 'certifications'],
+    'experience': ['education', 'skills', 'projects', 'certifications', 'achievements'],
+    'certifications': ['experience', 'education', 'skills', 'projects'],
+}
+
+# Keywords of the heading that opens each section when every line is
+# tagged; lines before the first heading are tagged 'header'
+LINE_SECTION_KEYWORDS = {
+    'summary': ['summary', 'objective', 'profile'],
+    'education': SECTION_KEYWORDS['education'],
+    'experience': SECTION_KEYWORDS['experience'],
+    'certifications': SECTION_KEYWORDS['certifications'],
+    'skills': ['skills', 'competencies', 'technologies'],
+    'projects': ['projects', 'project'],
+    'achievements': ['achievements', 'awards', 'honors', 'accomplishments'],
+}
+
+# Longest line that can be a heading; longer lines are content that
+# merely mentions a keyword ("5 years of experience in ...")
+HEADING_MAX_LENGTH = 50
+
+# Words allowed before the keyword of a heading ("Work Experience")
+HEADING_QUALIFIERS = ['work', 'professional', 'relevant', 'technical', 'key', 'core']
+
+_ALL_KEYWORDS = sorted(
+    {
+        keyword
+        for keyword_sets in (SECTION_KEYWORDS, SECTION_END_KEYWORDS)
+        for keywords in keyword_sets.values()
+        for keyword in keywords
+    },
+    key=len, reverse=True
+)
+
+
+def _heading_pattern(keywords):
+    """A heading starts with a keyword, after any bullet or numbering and an
+    optional qualifier"""
+    return re.compile(
+        r'[\W\d_]*(?:(?:' + '|'.join(HEADING_QUALIFIERS) + r')\s+)?(?:'
+        + '|'.join(re.escape(keyword) for keyword in keywords) + ')'
+    )
+
+
+_HEADING_PATTERN = _heading_pattern(_ALL_KEYWORDS)
+
+_START_KEYWORDS = {section: frozenset(keywords) for section, keywords in SECTION_KEYWORDS.items()}
+_END_KEYWORDS = {section: frozenset(keywords) for section, keywords in SECTION_END_KEYWORDS.items()}
+_LINE_SECTIONS = {
+    keyword: section
+    for section, keywords in LINE_SECTION_KEYWORDS.items()
+    for keyword in keywords
+}
+# Tagging keywords get their own pattern so that they never open or close
+# the extractor spans
+_TAG_KEYWORDS = sorted(_LINE_SECTIONS, key=len, reverse=True)
+_TAG_HEADING_PATTERN = _heading_pattern(_TAG_KEYWORDS)
+
+
+class ResumeSections:
+    """Lines of a resume grouped into sections"""
+
+    def __init__(self):
+        # Section name -> list of spans, each span a list of (line, line_lower)
+        self.spans = {}
+        # Every line as (line, line_lower, section), in resume order
+        self.tagged = []
+
+    def add_span(self, section):
+        """Start a new span for a section and return it"""
+        span = []
+        self.spans.setdefault(section, []).append(span)
+        return span
+
+    def lines(self, section):
+        """
+        Get the first span of a section
+
+        Args:
+            section: Section name (e.g. 'education')
+
+        Returns:
+            list: (line, line_lower) tuples, empty if the section is missing
+        """
+        spans = self.spans.get(section)
+        return spans[0] if spans else []
+
+    def tagged_lines(self, section):
+        """
+        Get every line tagged with a section
+
+        Args:
+            section: Section name (e.g. 'skills', or 'header' for the lines
+                     before the first heading)
+
+        Returns:
+            list: (line, line_lower) tuples, heading lines included
+        """
+        return [(line, line_lower) for line, line_lower, tag in self.tagged if tag == section]
+
+
+class SectionSegmenter:
+    """Tag each resume line with the sections it belongs to"""
+
+    def heading_keywords(self, line_lower):
+        """
+        Keywords of a heading line
+
+        Args:
+            line_lower: Stripped, lowercased line
+
+        Returns:
+            set: Section keywords in the line, empty if it is not a heading
+                 (too long, or not starting with a keyword)
+        """
+        if len(line_lower) > HEADING_MAX_LENGTH or not _HEADING_PATTERN.match(line_lower):
+            return set()
+        return {keyword for keyword in _ALL_KEYWORDS if keyword in line_lower}
+
+    def heading_section(self, line_lower):
+        """
+        Section a heading line switches the line tags to
+
+        Args:
+            line_lower: Stripped, lowercased line
+
+        Returns:
+            str: Section of the first tagging keyword in the line, or None
+                 if the line is not a heading
+        """
+        if len(line_lower) > HEADING_MAX_LENGTH or not _TAG_HEADING_PATTERN.match(line_lower):
+            return None
+        keywords = [keyword for keyword in _TAG_KEYWORDS if keyword in line_lower]
+        return _LINE_SECTIONS[min(keywords, key=line_lower.find)]
+
+    def segment(self, text):
+        """
+        Walk resume lines once and group them by section
+
+        Each section opens at the first heading with one of its keywords
+        and runs until a heading with one of its end keywords; the heading
+        lines are not part of the span. Repeated headings of an open
+        section (e.g. "Degree" inside Education) keep the span going.
+        Sections are tracked independently, so a line can belong to more
+        than one, and each section has at most one span. These spans are
+        what the education, experience and certification extractors read.
+
+        The same pass also tags every line with exactly one section from
+        LINE_SECTION_KEYWORDS: each heading switches the tag to the section
+        of its first keyword, and lines before any heading are 'header'.
+
+        Args:
+            text: Resume text content
+
+        Returns:
+            ResumeSections: Pre-split, pre-lowercased lines per section
+        """
+        sections = ResumeSections()
+        if not text:
+            return sections
+
+        open_spans = {}
+        closed = set()
+        tag = 'header'
+
+        for line in text.split('\n'):
+            line_lower = line.lower().strip()
+            keywords = self.heading_keywords(line_lower)
+
+            tag = self.heading_section(line_lower) or tag
+            sections.tagged.append((line, line_lower, tag))
+
+            for section in SECTION_KEYWORDS:
+                if section in closed:
+                    continue
+                if keywords & _START_KEYWORDS[section]:
+                    if section not in open_spans:
+                        open_spans[section] = sections.add_span(section)
+                elif section in open_spans:
+                    if keywords & _END_KEYWORDS[section]:
+                        del open_spans[section]
+                        closed.add(section)
+                    else:
+                        open_spans[section].append((line, line_lower))
+
+        return sections
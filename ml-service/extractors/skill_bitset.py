@@ -0,0 +1,133 @@
+"""
+Skill Bitset Module
+Fixed-width bitmask encoding of skill sets for vectorized overlap scoring
+"""
+
+import numpy as np
+
+
+# Set bits per byte value, for NumPy versions without bitwise_count
+_POPCOUNT_TABLE = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+def popcount(bits):
+    """
+    Count set bits per row
+
+    Args:
+        bits: uint64 array of shape (..., words)
+
+    Returns:
+        numpy.ndarray: int32 set-bit counts of shape (...)
+    """
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(bits).sum(axis=-1, dtype=np.int32)
+    bytes_view = np.ascontiguousarray(bits).view(np.uint8)
+    return _POPCOUNT_TABLE[bytes_view].sum(axis=-1, dtype=np.int32)
+
+
+class SkillBitset:
+    """
+    Bitmask codec over a fixed skill vocabulary
+
+    Every canonical skill owns one bit, so a skill set is a row of
+    ``ceil(len(skills) / 64)`` uint64 words. Comparing one resume with N
+    jobs is then an AND, an OR and a popcount over an (N, words) matrix
+    instead of N Python set intersections; skill names are only decoded
+    for the rows that are reported.
+    """
+
+    def __init__(self, skills):
+        """
+        Args:
+            skills: Canonical skills of the vocabulary (bit order)
+        """
+        self.skills = tuple(skills)
+        self.words = max(1, (len(self.skills) + 63) // 64)
+        self._positions = {skill: position for position, skill in enumerate(self.skills)}
+
+    def encode(self, skills):
+        """
+        Encode one skill set (skills outside the vocabulary are ignored)
+
+        Args:
+            skills: Iterable of canonical skills
+
+        Returns:
+            numpy.ndarray: uint64 array of shape (words,)
+        """
+        return self.encode_many([skills])[0]
+
+    def encode_many(self, skill_sets):
+        """
+        Encode a batch of skill sets
+
+        Args:
+            skill_sets: List of iterables of canonical skills
+
+        Returns:
+            numpy.ndarray: uint64 matrix of shape (len(skill_sets), words)
+        """
+        rows = []
+        positions = []
+        for row, skills in enumerate(skill_sets):
+            for skill in skills:
+                position = self._positions.get(skill)
+                if position is not None:
+                    rows.append(row)
+                    positions.append(position)
+
+        bits = np.zeros((len(skill_sets), self.words), dtype=np.uint64)
+        if positions:
+            positions = np.asarray(positions, dtype=np.uint64)
+            np.bitwise_or.at(
+                bits,
+                (np.asarray(rows, dtype=np.intp), (positions >> np.uint64(6)).astype(np.intp)),
+                np.uint64(1) << (positions & np.uint64(63))
+            )
+        return bits
+
+    def decode(self, bits):
+        """
+        Decode one bitmask
+
+        Args:
+            bits: uint64 array of shape (words,)
+
+        Returns:
+            list: Canonical skills, in vocabulary order
+        """
+        flags = np.unpackbits(
+            np.ascontiguousarray(bits, dtype=np.uint64).view(np.uint8), bitorder='little'
+        )
+        return [self.skills[position] for position in np.flatnonzero(flags[:len(self.skills)])]
+
+    @staticmethod
+    def overlap(resume_bits, job_bits):
+        """
+        Score one skill set against many
+
+        Args:
+            resume_bits: uint64 array of shape (words,)
+            job_bits: uint64 matrix of shape (jobs, words)
+
+        Returns:
+            dict: float32 arrays over jobs: 'jaccard' (shared / either),
+                  'coverage' (share of each job's skills the resume has),
+                  and int32 'matched' and 'job_skills' counts
+        """
+        matched = popcount(job_bits & resume_bits)
+        union = popcount(job_bits | resume_bits)
+        job_skills = popcount(job_bits)
+
+        return {
+            'jaccard': np.divide(
+                matched, union, out=np.zeros(len(job_bits), dtype=np.float32), where=union > 0
+            ),
+            'coverage': np.divide(
+                matched, job_skills, out=np.zeros(len(job_bits), dtype=np.float32),
+                where=job_skills > 0
+            ),
+            'matched': matched,
+            'job_skills': job_skills,
+        }
@@ -0,0 +1,176 @@
+"""
+Skill Matcher Module
+Finds every known skill in a text with a single compiled regex scan
+"""
+
+import re
+
+
+# Marks the end of a skill inside the character trie
+_END = ''
+
+
+def _is_word_char(char):
+    """Mirror of the regex \\w class for a single character"""
+    return char.isalnum() or char == '_'
+
+
+class SkillMatcher:
+    """
+    Match a skill vocabulary against text in one pass
+
+    All skills are folded into a character trie which is rendered as one
+    compiled alternation, e.g. ``java``, ``javascript`` and ``jest`` become
+    ``j(?:ava(?:script)?|est)``. At any position the regex engine follows at
+    most one trie path, so scanning cost depends on the text length and the
+    longest skill, not on how many skills the database holds.
+
+    Boundaries use ``(?<!\\w)`` / ``(?!\\w)`` instead of ``\\b`` so that skills
+    ending in symbols (``c++``, ``c#``) or containing them (``next.js``,
+    ``ci/cd``) match when followed by a space or punctuation.
+
+    Aliases are folded into the same trie and reported under their
+    canonical skill (``k8s`` -> ``kubernetes``).
+    """
+
+    def __init__(self, skills, aliases=None):
+        """
+        Build the trie and compile the combined pattern
+
+        Args:
+            skills: Iterable of skill names
+            aliases: Optional dict of alias -> canonical skill name
+        """
+        self.skills = sorted(set(skills))
+
+        # Lowercased surface form -> skill name as stored in the database
+        self._skill_lookup = {}
+        for skill in self.skills:
+            self._skill_lookup.setdefault(skill.lower(), skill)
+        for alias, skill in (aliases or {}).items():
+            self._skill_lookup.setdefault(alias.lower(), skill)
+
+        self._trie = {}
+        for surface in self._skill_lookup:
+            node = self._trie
+            for char in surface:
+                node = node.setdefault(char, {})
+            node[_END] = {}
+
+        # Skills found inside longer skills ("react" in "react native"),
+        # stored as (skill, start offset, end offset) relative to the outer skill
+        self._nested = {
+            surface: self._find_nested(surface) for surface in self._skill_lookup
+        }
+
+        if self._trie:
+            self.pattern = re.compile(
+                r'(?<!\w)' + self._render(self._trie) + r'(?!\w)',
+                re.IGNORECASE
+            )
+        else:
+            self.pattern = None
+
+    def _render(self, node):
+        """
+        Render a trie node as a regex fragment
+
+        Args:
+            node: Trie node (dict of character -> child node)
+
+        Returns:
+            str: Regex fragment matching every suffix below this node
+        """
+        branches = [
+            re.escape(char) + self._render(child)
+            for char, child in sorted(node.items())
+            if char != _END
+        ]
+
+        if not branches:
+            return ''
+
+        # Greedy optional group: longer skills are tried before shorter ones
+        if _END in node:
+            return '(?:' + '|'.join(branches) + ')?'
+
+        if len(branches) == 1:
+            return branches[0]
+
+        return '(?:' + '|'.join(branches) + ')'
+
+    def _find_nested(self, surface):
+        """
+        Find other skills contained in a skill at word boundaries
+
+        Args:
+            surface: Lowercased skill name
+
+        Returns:
+            list: (skill, start, end) tuples, excluding the skill itself
+        """
+        nested = []
+        outer_skill = self._skill_lookup[surface]
+
+        for start in range(len(surface)):
+            if start > 0 and _is_word_char(surface[start - 1]):
+                continue
+
+            node = self._trie
+            for end in range(start, len(surface)):
+                node = node.get(surface[end])
+                if node is None:
+                    break
+
+                stop = end + 1
+                if _END not in node or (start == 0 and stop == len(surface)):
+                    continue
+                if stop < len(surface) and _is_word_char(surface[stop]):
+                    continue
+
+                # An alias containing its own skill ("react.js") counts once
+                nested_skill = self._skill_lookup[surface[start:stop]]
+                if nested_skill != outer_skill:
+                    nested.append((nested_skill, start, stop))
+
+        return nested
+
+    def find(self, text):
+        """
+        Scan text once and collect every skill occurrence
+
+        Args:
+            text: Text content
+
+        Returns:
+            dict: Skill -> {'count': int, 'offsets': [(start, end), ...]}
+                  with offsets into the original text
+        """
+        hits = {}
+
+        if not text or self.pattern is None:
+            return hits
+
+        for match in self.pattern.finditer(text):
+            surface = match.group(0).lower()
+            skill = self._skill_lookup.get(surface)
+            if skill is None:
+                continue
+
+            start = match.start()
+            self._record(hits, skill, start, match.end())
+
+            for nested_skill, nested_start, nested_end in self._nested[surface]:
+                self._record(hits, nested_skill,
+                             start + nested_start, start + nested_end)
+
+        return hits
+
+    @staticmethod
+    def _record(hits, skill, start, end):
+        """Add one occurrence of a skill to the hit table"""
+        entry = hits.get(skill)
+        if entry is None:
+            entry = hits[skill] = {'count': 0, 'offsets': []}
+        entry['count'] += 1
+        entry['offsets'].append((start, end))
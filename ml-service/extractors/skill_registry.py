@@ -0,0 +1,171 @@
+"""
+Skill Registry Module
+Holds the compiled skill vocabulary and hot-reloads it when the skills file changes
+"""
+
+import os
+import threading
+
+from config import settings
+from config.skills_database import load_skills
+from .fuzzy_skill_index import FuzzySkillIndex
+from .skill_bitset import SkillBitset
+from .skill_matcher import SkillMatcher
+from .skill_taxonomy import SkillTaxonomy
+
+
+class SkillVocabulary:
+    """
+    One version of the skill vocabulary with everything compiled from it
+
+    Instances are never modified after construction, so a request that
+    took a reference keeps a consistent matcher, taxonomy, fuzzy index and
+    skill bitset even if a newer vocabulary is swapped in while it runs.
+    """
+
+    def __init__(self, skills_data):
+        """
+        Args:
+            skills_data: Output of config.skills_database.load_skills
+        """
+        self.version = skills_data['version']
+        self.skills = skills_data['skills']
+        self.taxonomy = SkillTaxonomy(skills_data['categories'], skills_data['aliases'])
+        self.matcher = SkillMatcher(self.skills, self.taxonomy.aliases)
+        self.fuzzy_index = FuzzySkillIndex(
+            self.taxonomy.surface_forms,
+            min_confidence=settings.FUZZY_SKILLS_MIN_CONFIDENCE
+        )
+        self.bitset = SkillBitset(self.skills)
+
+
+class SkillRegistry:
+    """
+    Process-wide holder of the active SkillVocabulary
+
+    A background thread polls the skills file; when it changes, the new
+    vocabulary is loaded and compiled on that thread and then published
+    with a single reference assignment. Readers never take a lock and
+    in-flight requests finish on the vocabulary they started with. A file
+    that fails to load or validate is reported and the active vocabulary
+    is kept.
+    """
+
+    def __init__(self, path, reload_interval=30.0):
+        """
+        Args:
+            path: Path of the JSON skills file
+            reload_interval: Seconds between change checks (0 disables reloading)
+        """
+        self.path = path
+        self.reload_interval = reload_interval
+
+        self._signature = self._file_signature()
+        self._current = SkillVocabulary(load_skills(path))
+
+        self._reload_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._watching_pid = None
+
+    @property
+    def current(self):
+        """The active SkillVocabulary"""
+        return self._current
+
+    @property
+    def version(self):
+        """Version of the active vocabulary"""
+        return self._current.version
+
+    def _file_signature(self):
+        """Modification time and size of the skills file (None if missing)"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def reload(self, force=False):
+        """
+        Rebuild the vocabulary if the skills file changed
+
+        Args:
+            force: Reload even if the file looks unchanged
+
+        Returns:
+            bool: True if a new vocabulary was swapped in
+        """
+        with self._reload_lock:
+            signature = self._file_signature()
+            if signature is None or (signature == self._signature and not force):
+                return False
+            self._signature = signature
+
+            try:
+                vocabulary = SkillVocabulary(load_skills(self.path))
+            except (OSError, ValueError) as e:
+                print(f"⚠️ Skills reload failed, keeping version {self.version}: {e}")
+                return False
+
+            if vocabulary.version == self.version:
+                return False
+
+            previous = self.version
+            self._current = vocabulary
+
+        print(f"🔄 Skills vocabulary reloaded: {previous} -> {vocabulary.version}")
+        return True
+
+    def ensure_watching(self):
+        """Start the reload thread once per process (threads don't survive fork)"""
+        if self.reload_interval <= 0 or self._watching_pid == os.getpid():
+            return
+
+        with self._reload_lock:
+            if self._watching_pid == os.getpid():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(
+                target=self._watch, name='skills-watcher', daemon=True
+            )
+            self._thread.start()
+            self._watching_pid = os.getpid()
+
+    def stop(self):
+        """Stop the reload thread"""
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+        self._watching_pid = None
+
+    def _watch(self):
+        """Reload thread: poll the skills file until stopped"""
+        while not self._stopping.wait(self.reload_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"❌ Skills watcher error: {str(e)}")
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_skill_registry():
+    """
+    Get the process-wide skill registry, loading settings.SKILLS_PATH on first use
+
+    Returns:
+        SkillRegistry: Shared registry
+    """
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = SkillRegistry(
+                    settings.SKILLS_PATH,
+                    reload_interval=settings.SKILLS_RELOAD_INTERVAL
+                )
+    return _registry
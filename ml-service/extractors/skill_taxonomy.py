@@ -0,0 +1,99 @@
+"""
+Skill Taxonomy Module
+Index of skill surface forms, canonical skills and their categories
+"""
+
+
+class SkillTaxonomy:
+    """
+    Dictionary index over the skills vocabulary
+
+    Every surface form (canonical name or alias, lowercased) maps to its
+    canonical skill, and every canonical skill maps to the categories it
+    belongs to, so canonicalizing and categorizing a match are single dict
+    lookups however large the vocabulary grows. A skill listed in several
+    categories (``swift``, ``kotlin``) keeps all of them, in category order.
+    """
+
+    def __init__(self, categories, aliases=None):
+        """
+        Args:
+            categories: Category name -> list of canonical skills
+            aliases: Canonical skill -> list of alternative spellings
+        """
+        # Canonical skill -> tuple of category names
+        skill_categories = {}
+        for category, skills in categories.items():
+            for skill in skills:
+                owners = skill_categories.setdefault(skill, [])
+                if category not in owners:
+                    owners.append(category)
+        self._categories = {
+            skill: tuple(owners) for skill, owners in skill_categories.items()
+        }
+        self.category_names = tuple(categories)
+
+        # Lowercased surface form -> canonical skill; canonical names win over aliases
+        self._canonical = {skill.lower(): skill for skill in self._categories}
+        self.aliases = {}
+        for skill, spellings in (aliases or {}).items():
+            for spelling in spellings:
+                surface = spelling.lower()
+                if surface not in self._canonical:
+                    self._canonical[surface] = skill
+                    self.aliases[surface] = skill
+
+    @property
+    def surface_forms(self):
+        """Dict of lowercased surface form (name or alias) -> canonical skill"""
+        return dict(self._canonical)
+
+    @property
+    def skills(self):
+        """Sorted canonical skills"""
+        return sorted(self._categories)
+
+    def canonical(self, surface):
+        """
+        Resolve a surface form to its canonical skill
+
+        Args:
+            surface: Skill name or alias (any case)
+
+        Returns:
+            str or None: Canonical skill, None if unknown
+        """
+        return self._canonical.get(surface.lower())
+
+    def categories(self, skill):
+        """
+        Get the categories of a canonical skill
+
+        Args:
+            skill: Canonical skill name
+
+        Returns:
+            tuple: Category names (empty if the skill is unknown)
+        """
+        return self._categories.get(skill, ())
+
+    def categorize(self, skills):
+        """
+        Group canonical skills by category
+
+        Args:
+            skills: Iterable of canonical skill names
+
+        Returns:
+            dict: Category -> sorted skills, only for categories with skills
+        """
+        grouped = {}
+        for skill in skills:
+            for category in self._categories.get(skill, ()):
+                grouped.setdefault(category, []).append(skill)
+
+        return {
+            category: sorted(grouped[category])
+            for category in self.category_names
+            if category in grouped
+        }
@@ -0,0 +1,34 @@
+"""
+Gunicorn Configuration
+Production server settings for the ML service (values from config.settings)
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import os
+import sys
+
+# Make the service packages importable however gunicorn was launched
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import settings  # noqa: E402
+
+
+bind = settings.WEB_BIND
+workers = settings.WEB_WORKERS
+threads = settings.WEB_THREADS
+worker_class = 'gthread'
+timeout = settings.WEB_TIMEOUT
+max_requests = settings.WEB_MAX_REQUESTS
+max_requests_jitter = settings.WEB_MAX_REQUESTS_JITTER
+
+# Import the app once in the master, then fork workers from it
+preload_app = True
+
+
+def post_fork(server, worker):
+    """Start background threads in each forked worker (threads don't survive fork)"""
+    from app import info_extractor, job_index_sync, job_workers, pdf_parser, readiness
+    job_workers.ensure_started()
+    info_extractor.skill_registry.ensure_watching()
+    readiness.ensure_started(pdf_parser, info_extractor, job_index_sync)
@@ -0,0 +1,9 @@
+"""
+Jobs Module
+Asynchronous parse jobs backed by a durable local queue
+"""
+
+from .job_queue import JobQueue
+from .worker import JobWorkerPool, make_parse_handler
+
+__all__ = ['JobQueue', 'JobWorkerPool', 'make_parse_handler']
@@ -0,0 +1,246 @@
+"""
+Job Queue Module
+Durable SQLite-backed queue of asynchronous parse jobs
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+
+# Job lifecycle states
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+
+class JobQueue:
+    """
+    Queue of parse jobs persisted in a local SQLite file
+
+    The uploaded PDF is stored with the job so a queued job survives a
+    restart, and any process on the host (web workers or standalone
+    `python -m jobs.worker` processes) can claim it. Claims are leases:
+    a job left running past the lease (its worker died) is handed out
+    again until it runs out of attempts. Each claim is identified by its
+    start time, and only the current holder of a lease can record the
+    outcome, so a worker that overran its lease cannot overwrite the
+    result of the worker the job was handed to next.
+    """
+
+    def __init__(self, path, lease_seconds=600, max_attempts=3):
+        """
+        Args:
+            path: SQLite file of the queue
+            lease_seconds: Time a claimed job may run before it is reclaimed
+            max_attempts: Claims allowed before a lost job is marked failed
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        # SQLite connections must not cross a fork, so each process opens its own
+        self._conn = None
+        self._conn_pid = None
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        db = self._connect()
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            ' id TEXT PRIMARY KEY,'
+            ' status TEXT NOT NULL,'
+            ' filename TEXT,'
+            ' payload BLOB,'
+            ' result TEXT,'
+            ' error TEXT,'
+            ' attempts INTEGER NOT NULL DEFAULT 0,'
+            ' created_at REAL NOT NULL,'
+            ' started_at REAL,'
+            ' finished_at REAL)'
+        )
+        db.execute('CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)')
+        db.commit()
+
+    def _connect(self):
+        """Open (or reopen after a fork) the SQLite connection"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def submit(self, filename, pdf_bytes):
+        """
+        Enqueue a parse job
+
+        Args:
+            filename: Original upload filename
+            pdf_bytes: Binary content of PDF file
+
+        Returns:
+            str: Job id
+        """
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._connect().execute(
+                'INSERT INTO jobs (id, status, filename, payload, created_at)'
+                ' VALUES (?, ?, ?, ?, ?)',
+                (job_id, QUEUED, filename, pdf_bytes, time.time())
+            )
+        return job_id
+
+    def claim(self):
+        """
+        Take the oldest queued job (or an expired lease) for processing
+
+        Returns:
+            tuple or None: (job_id, filename, pdf_bytes, lease) or None if
+                           idle; the lease is passed back to complete/fail
+        """
+        now = time.time()
+
+        with self._lock:
+            db = self._connect()
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                # Jobs whose worker died: retry, or give up after max_attempts
+                db.execute(
+                    'UPDATE jobs SET status = ?, error = ?, finished_at = ?, payload = NULL'
+                    ' WHERE status = ? AND started_at < ? AND attempts >= ?',
+                    (FAILED, 'Job was abandoned by its worker too many times', now,
+                     RUNNING, now - self.lease_seconds, self.max_attempts)
+                )
+
+                row = db.execute(
+                    'SELECT id, filename, payload FROM jobs'
+                    ' WHERE status = ? OR (status = ? AND started_at < ?)'
+                    ' ORDER BY created_at LIMIT 1',
+                    (QUEUED, RUNNING, now - self.lease_seconds)
+                ).fetchone()
+
+                if row is not None:
+                    db.execute(
+                        'UPDATE jobs SET status = ?, started_at = ?, attempts = attempts + 1'
+                        ' WHERE id = ?',
+                        (RUNNING, now, row[0])
+                    )
+                db.execute('COMMIT')
+            except Exception:
+                db.execute('ROLLBACK')
+                raise
+
+        return (*row, now) if row is not None else None
+
+    def complete(self, job_id, result, lease=None):
+        """
+        Mark a job as succeeded and store its result
+
+        Args:
+            job_id: Job id
+            result: JSON-serializable result
+            lease: Lease returned by claim() (None: any running claim)
+
+        Returns:
+            bool: False if the job is no longer running under this lease
+        """
+        return self._finish(job_id, SUCCEEDED, lease, result=json.dumps(result))
+
+    def fail(self, job_id, error, lease=None):
+        """
+        Mark a job as failed
+
+        Args:
+            job_id: Job id
+            error: Error message
+            lease: Lease returned by claim() (None: any running claim)
+
+        Returns:
+            bool: False if the job is no longer running under this lease
+        """
+        return self._finish(job_id, FAILED, lease, error=error)
+
+    def _finish(self, job_id, status, lease, result=None, error=None):
+        """Record the outcome of a running job and drop its payload"""
+        with self._lock:
+            cursor = self._connect().execute(
+                'UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?,'
+                ' payload = NULL WHERE id = ? AND status = ? AND (? IS NULL OR started_at = ?)',
+                (status, result, error, time.time(), job_id, RUNNING, lease, lease)
+            )
+        return cursor.rowcount > 0
+
+    def get(self, job_id):
+        """
+        Look up a job
+
+        Args:
+            job_id: Job id
+
+        Returns:
+            dict or None: Job status, timestamps and result or error
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT id, status, filename, result, error, attempts,'
+                ' created_at, started_at, finished_at FROM jobs WHERE id = ?',
+                (job_id,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        job = {
+            'id': row[0],
+            'status': row[1],
+            'filename': row[2],
+            'attempts': row[5],
+            'created_at': row[6],
+            'started_at': row[7],
+            'finished_at': row[8],
+        }
+        if row[3] is not None:
+            job['result'] = json.loads(row[3])
+        if row[4] is not None:
+            job['error'] = row[4]
+        return job
+
+    def purge_finished(self, older_than_seconds):
+        """
+        Delete finished jobs past their retention period
+
+        Args:
+            older_than_seconds: Age of finished jobs to delete
+
+        Returns:
+            int: Number of jobs deleted
+        """
+        with self._lock:
+            cursor = self._connect().execute(
+                'DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?',
+                (SUCCEEDED, FAILED, time.time() - older_than_seconds)
+            )
+        return cursor.rowcount
+
+    def counts(self):
+        """
+        Count jobs by status
+
+        Returns:
+            dict: Status -> number of jobs
+        """
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT status, COUNT(*) FROM jobs GROUP BY status'
+            ).fetchall()
+        return dict(rows)
@@ -0,0 +1,201 @@
+"""
+Job Worker Module
+Background workers that drain the parse job queue
+
+Workers run as threads inside the web process (settings.JOB_WORKERS) and
+can also be started as a standalone process so OCR capacity scales
+independently of the HTTP tier:
+
+    python -m jobs.worker --workers 4
+"""
+
+import argparse
+import os
+import threading
+import time
+
+from pipeline import InvalidPDFError, parse_resume_cached
+from .job_queue import JobQueue
+
+
+def make_parse_handler(pdf_parser, info_extractor, parse_cache):
+    """
+    Build the job handler that parses one queued resume
+
+    Args:
+        pdf_parser: PDFParser instance
+        info_extractor: InformationExtractor instance
+        parse_cache: ParseCache instance, or None
+
+    Returns:
+        callable: handler(filename, pdf_bytes) -> {'data': dict, 'cached': bool}
+    """
+    def handle(filename, pdf_bytes):
+        try:
+            response_data, cached = parse_resume_cached(
+                pdf_bytes, pdf_parser, info_extractor, parse_cache
+            )
+        except InvalidPDFError as e:
+            raise Exception(f'PDF validation failed: {str(e)}')
+        return {'data': response_data, 'cached': cached}
+
+    return handle
+
+
+class JobWorkerPool:
+    """Pool of threads that claim queued jobs and run them through a handler"""
+
+    def __init__(self, queue, handler, workers=2, poll_interval=1.0, retention_seconds=86400,
+                 max_backoff=30.0):
+        """
+        Args:
+            queue: JobQueue to drain
+            handler: Callable(filename, pdf_bytes) -> JSON-serializable result;
+                     exceptions mark the job as failed
+            workers: Number of worker threads
+            poll_interval: Seconds an idle worker sleeps between polls
+            retention_seconds: Age at which finished jobs are purged
+            max_backoff: Longest pause after repeated queue errors
+        """
+        self.queue = queue
+        self.handler = handler
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.max_backoff = max_backoff
+
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._threads = []
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self):
+        """Start the worker threads once per process (no-op when workers=0)"""
+        if self.workers <= 0 or self._started_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._started_pid == os.getpid():
+                return
+
+            # Threads do not survive a fork; start a fresh set in this process
+            self._stopping.clear()
+            self._threads = [
+                threading.Thread(target=self._run, name=f'job-worker-{index}', daemon=True)
+                for index in range(self.workers)
+            ]
+            for thread in self._threads:
+                thread.start()
+            self._started_pid = os.getpid()
+
+        print(f"🧵 Started {self.workers} job workers (pid {os.getpid()})")
+
+    def notify(self):
+        """Wake idle workers after a job was submitted"""
+        self._wakeup.set()
+
+    def stop(self, timeout=None):
+        """Ask the workers to exit and wait for them"""
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        self._started_pid = None
+
+    def _run(self):
+        """Worker loop: claim, process, record, repeat"""
+        last_purge = 0.0
+        backoff = 0.0
+
+        while not self._stopping.is_set():
+            try:
+                if time.time() - last_purge > 60:
+                    self.queue.purge_finished(self.retention_seconds)
+                    last_purge = time.time()
+
+                job = self.queue.claim()
+                if job is None:
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+                else:
+                    self.process(*job)
+                backoff = 0.0
+            except Exception as e:
+                # A locked or unreadable queue must not kill the thread;
+                # back off so a persistent error does not spin
+                backoff = min(max(backoff * 2, self.poll_interval), self.max_backoff)
+                print(f"⚠️ Job worker error (retrying in {backoff:.0f}s): {str(e)}")
+                self._stopping.wait(backoff)
+
+    def process(self, job_id, filename, pdf_bytes, lease=None):
+        """
+        Run one claimed job and record the outcome
+
+        Args:
+            job_id: Job id
+            filename: Original upload filename
+            pdf_bytes: Binary content of PDF file
+            lease: Lease returned by JobQueue.claim()
+        """
+        print(f"⚙️ Processing job {job_id} ({filename})")
+        try:
+            result = self.handler(filename, pdf_bytes)
+        except Exception as e:
+            print(f"❌ Job {job_id} failed: {str(e)}")
+            if not self.queue.fail(job_id, str(e), lease):
+                print(f"⚠️ Job {job_id} lease expired; its failure was not recorded")
+            return
+
+        if not self.queue.complete(job_id, result, lease):
+            print(f"⚠️ Job {job_id} lease expired; its result was not recorded")
+            return
+        print(f"✅ Job {job_id} completed")
+
+
+def main():
+    """Run standalone job workers against the shared queue"""
+    from config import settings
+    from parsers import PDFParser
+    from extractors import InformationExtractor
+    from cache import ParseCache
+
+    parser = argparse.ArgumentParser(description='Drain the async parse job queue')
+    parser.add_argument('--workers', type=int, default=max(settings.JOB_WORKERS, 1),
+                        help='worker threads in this process')
+    args = parser.parse_args()
+
+    parse_cache = ParseCache(
+        memory_items=settings.PARSE_CACHE_MEMORY_ITEMS,
+        disk_path=settings.PARSE_CACHE_PATH,
+        disk_max_bytes=settings.PARSE_CACHE_MAX_BYTES
+    ) if settings.PARSE_CACHE_ENABLED else None
+
+    info_extractor = InformationExtractor()
+    info_extractor.skill_registry.ensure_watching()
+    handler = make_parse_handler(PDFParser(), info_extractor, parse_cache)
+
+    queue = JobQueue(
+        settings.JOB_QUEUE_PATH,
+        lease_seconds=settings.JOB_LEASE_SECONDS,
+        max_attempts=settings.JOB_MAX_ATTEMPTS
+    )
+    pool = JobWorkerPool(
+        queue, handler,
+        workers=args.workers,
+        poll_interval=settings.JOB_POLL_INTERVAL,
+        retention_seconds=settings.JOB_RETENTION_SECONDS
+    )
+    pool.ensure_started()
+
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        print("🛑 Stopping job workers...")
+        pool.stop()
+
+
+if __name__ == '__main__':
+    main()
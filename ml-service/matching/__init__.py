@@ -0,0 +1,15 @@
+"""
+Matching Module
+Ranking job postings against parsed resumes
+"""
+
+from .job_index import JobIndex, job_skill_counts
+from .job_store import JobIndexSync, JobStore
+from .text_encoder import HashingTextEncoder
+from .vector_store import VectorStore
+
+__all__ = [
+    'JobIndex', 'job_skill_counts',
+    'JobIndexSync', 'JobStore',
+    'HashingTextEncoder', 'VectorStore'
+]
@@ -0,0 +1,136 @@
+"""
+Duplicate Detection Module
+Content hashes and SimHash fingerprints of job postings
+"""
+
+import hashlib
+import re
+
+import numpy as np
+
+from .text_encoder import hash_words, ngram_hashes
+
+
+_WORD_PATTERN = re.compile(r'\w+')
+
+# SimHash fingerprints are split into this many 16-bit bands; two
+# fingerprints within 3 bits of each other share at least one band
+SIMHASH_BANDS = 4
+_BAND_BITS = 64 // SIMHASH_BANDS
+_BAND_MASK = (1 << _BAND_BITS) - 1
+
+_BIT_WEIGHTS = np.uint64(1) << np.arange(64, dtype=np.uint64)
+
+
+def normalize_words(text):
+    """Lowercased words of a text, punctuation and spacing dropped"""
+    return _WORD_PATTERN.findall(str(text or '').lower())
+
+
+def content_hash(posting):
+    """
+    Exact-duplicate key of a posting
+
+    Title, company, location and description are compared after
+    lowercasing and collapsing punctuation and whitespace, so re-posts
+    that differ only in formatting hash the same, while the same opening
+    posted for another city does not.
+
+    Args:
+        posting: Job posting dict
+
+    Returns:
+        str: SHA-1 hex digest
+    """
+    parts = [
+        ' '.join(normalize_words(posting.get(field)))
+        for field in ('title', 'company', 'location', 'description')
+    ]
+    return hashlib.sha1('\x1f'.join(parts).encode('utf-8')).hexdigest()
+
+
+def fingerprint_text(posting):
+    """
+    Text a posting's SimHash is computed over
+
+    Title and company lead the description, so postings whose
+    descriptions are shared boilerplate still differ by who is hiring
+    for what.
+
+    Args:
+        posting: Job posting dict
+
+    Returns:
+        str: Title, company and description, one per line
+    """
+    return '\n'.join(
+        str(posting.get(field) or '') for field in ('title', 'company', 'description')
+    )
+
+
+def listing_key(posting):
+    """
+    Normalized (title, company, location) of a posting
+
+    Near-duplicates must agree on this key: similar text alone is not
+    enough, since one company's template is reused across its openings
+    and cities.
+
+    Args:
+        posting: Job posting dict (or its stored metadata)
+
+    Returns:
+        tuple: Normalized title, company and location
+    """
+    return tuple(
+        ' '.join(normalize_words(posting.get(field)))
+        for field in ('title', 'company', 'location')
+    )
+
+
+def simhash(text, shingle_size=3):
+    """
+    64-bit SimHash of a text over word shingles
+
+    Near-identical texts (a changed date, an extra sentence) get
+    fingerprints a few bits apart.
+
+    Args:
+        text: Posting text
+        shingle_size: Words per shingle
+
+    Returns:
+        int: Fingerprint (signed, so it fits an SQLite INTEGER)
+    """
+    word_hashes = hash_words(normalize_words(text))
+    if not len(word_hashes):
+        return 0
+
+    shingles = ngram_hashes(word_hashes, min(shingle_size, len(word_hashes)))
+    shingles = np.unique(shingles)
+    bits = (shingles[:, None] & _BIT_WEIGHTS) != 0
+    votes = bits.sum(axis=0) * 2 > len(shingles)
+    fingerprint = int(_BIT_WEIGHTS[votes].sum(dtype=np.uint64))
+    return fingerprint - (1 << 64) if fingerprint >= 1 << 63 else fingerprint
+
+
+def simhash_bands(fingerprint):
+    """
+    Split a fingerprint into its bands
+
+    Args:
+        fingerprint: Value from simhash()
+
+    Returns:
+        list: SIMHASH_BANDS integers
+    """
+    unsigned = fingerprint & ((1 << 64) - 1)
+    return [
+        (unsigned >> (band * _BAND_BITS)) & _BAND_MASK
+        for band in range(SIMHASH_BANDS)
+    ]
+
+
+def hamming_distance(first, second):
+    """Number of differing bits between two fingerprints"""
+    return bin((first ^ second) & ((1 << 64) - 1)).count('1')
@@ -0,0 +1,326 @@
+"""
+Job Ingestion Module
+Streams NDJSON job feeds into the job store with batched skill extraction,
+duplicate detection and resumable checkpoints
+
+Each line of a feed is one posting: {"id": ..., "description": ..., plus
+any fields (title, company, location, url, ...) returned with results}.
+
+Usage:
+    python -m matching.ingest feed.ndjson
+    zcat feed.ndjson.gz | python -m matching.ingest - --source nightly-2026-10-18
+
+Re-running with the same source resumes after the last committed batch;
+--restart reads the feed from the beginning.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+
+from monitoring import drain_worker_metrics, merge_worker_metrics
+from .dedup import content_hash, fingerprint_text, simhash
+from .job_index import job_skill_counts
+from .job_store import COMPLETED, FAILED
+from .text_encoder import HashingTextEncoder
+
+
+# Invalid lines reported in a run's stats
+MAX_REPORTED_ERRORS = 20
+
+# Per-process extractor and encoder, built once by the pool initializer
+_worker_extractor = None
+_worker_encoder = None
+
+
+def build_record(posting, info_extractor):
+    """
+    Turn a job posting into a job store record
+
+    Args:
+        posting: Posting dict with id and description
+        info_extractor: InformationExtractor instance
+
+    Returns:
+        dict: id, metadata (every field but the description), skills
+              (skill -> mentions), content_hash, simhash and text (title
+              and description, for the vector store)
+
+    Raises:
+        ValueError: If the posting has no id or description, or its id
+                    contains a line break (ids are stored one per line)
+    """
+    if (not isinstance(posting, dict) or posting.get('id') in (None, '')
+            or not isinstance(posting.get('description'), str)):
+        raise ValueError('posting needs an id and a description')
+    if '\n' in str(posting['id']) or '\r' in str(posting['id']):
+        raise ValueError('posting id must not contain line breaks')
+
+    return {
+        'id': str(posting['id']),
+        'metadata': {key: value for key, value in posting.items() if key != 'description'},
+        'skills': job_skill_counts(info_extractor, posting),
+        'content_hash': content_hash(posting),
+        'simhash': simhash(fingerprint_text(posting)),
+        'text': f"{posting.get('title') or ''}\n{posting['description']}",
+    }
+
+
+def prepare_lines(lines, info_extractor, encoder=None):
+    """
+    Parse and prepare one batch of feed lines
+
+    Args:
+        lines: List of (line number, raw line bytes)
+        info_extractor: InformationExtractor instance
+        encoder: HashingTextEncoder for job vectors, or None
+
+    Returns:
+        tuple: (records, vectors aligned with records or None, invalid line messages)
+    """
+    records = []
+    invalid = []
+
+    for number, line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append(build_record(json.loads(line), info_extractor))
+        except ValueError as e:
+            invalid.append(f'line {number}: {e}')
+
+    texts = [record.pop('text') for record in records]
+    vectors = encoder.encode(texts) if encoder is not None and records else None
+    return records, vectors, invalid
+
+
+def _init_worker(vector_dim):
+    """Build the extractor and encoder inside a freshly started worker"""
+    global _worker_extractor, _worker_encoder
+
+    from extractors import InformationExtractor
+
+    _worker_extractor = InformationExtractor()
+    _worker_extractor.skill_registry.ensure_watching()
+    _worker_encoder = HashingTextEncoder(vector_dim) if vector_dim else None
+
+
+def _prepare_in_worker(lines):
+    """
+    Pool task: prepare one batch with the worker's own extractor
+
+    Returns:
+        tuple: prepare_lines() result followed by the worker's metrics snapshot
+    """
+    return prepare_lines(lines, _worker_extractor, _worker_encoder) + (drain_worker_metrics(),)
+
+
+class JobIngestor:
+    """
+    Bulk loader of NDJSON job feeds
+
+    The main process only reads raw lines and writes to the store: JSON
+    decoding, skill extraction, fingerprinting and vector encoding run in
+    a process pool, one batch per task. At most two batches per worker
+    are in flight, so memory stays flat however long the feed is, and
+    batches are committed in feed order. Each commit is one store
+    transaction that also advances the run's checkpoint (byte offset and
+    line count), so an interrupted run resumes after its last committed
+    batch. Duplicate detection happens inside that transaction against
+    everything already stored, including earlier batches of the same run.
+    """
+
+    def __init__(self, job_store, vector_store=None, workers=1, batch_size=500,
+                 near_duplicate_distance=3, start_method='spawn'):
+        """
+        Args:
+            job_store: JobStore to upsert into
+            vector_store: VectorStore for job text vectors, or None
+            workers: Extraction processes (1 extracts in the calling process)
+            batch_size: Lines per batch (and per store transaction)
+            near_duplicate_distance: SimHash bits within which postings are
+                                     near-duplicates (None disables dedup)
+            start_method: multiprocessing start method for the workers
+        """
+        self.job_store = job_store
+        self.vector_store = vector_store
+        self.workers = max(1, workers)
+        self.batch_size = max(1, batch_size)
+        self.near_duplicate_distance = near_duplicate_distance
+        self.start_method = start_method
+
+    def _batches(self, stream, offset, lines):
+        """Read the feed from a checkpoint, yielding (lines, end offset, end line)"""
+        if offset and stream.seekable():
+            stream.seek(offset)
+        else:
+            for _ in range(lines):
+                offset += len(stream.readline())
+
+        batch = []
+        for raw in iter(stream.readline, b''):
+            offset += len(raw)
+            lines += 1
+            batch.append((lines, raw))
+            if len(batch) >= self.batch_size:
+                yield batch, offset, lines
+                batch = []
+        if batch:
+            yield batch, offset, lines
+
+    def _commit(self, source, task, offset, lines, stats):
+        """Write one prepared batch and advance the checkpoint"""
+        records, vectors, invalid, metrics = task.result()
+        merge_worker_metrics(metrics)
+
+        stats = dict(stats)
+        stats['invalid'] = stats.get('invalid', 0) + len(invalid)
+        errors = stats.get('errors', [])
+        stats['errors'] = (errors + invalid)[:MAX_REPORTED_ERRORS]
+
+        before_commit = None
+        if self.vector_store is not None and vectors is not None:
+            rows = {record['id']: row for row, record in enumerate(records)}
+
+            def before_commit(accepted):
+                # Written before the store commits, so a crash in between
+                # only re-adds these vectors when the batch is replayed
+                ids = list({record['id']: None for record in accepted})
+                if ids:
+                    self.vector_store.add(ids, vectors[[rows[job_id] for job_id in ids]])
+
+        counts = self.job_store.write_batch(
+            records,
+            near_duplicate_distance=self.near_duplicate_distance,
+            checkpoint={'source': source, 'offset': offset, 'lines': lines, 'stats': stats},
+            before_commit=before_commit
+        )
+        for key, value in counts.items():
+            stats[key] = stats.get(key, 0) + value
+        return stats
+
+    def run(self, stream, source, restart=False):
+        """
+        Ingest a feed, resuming from the source's checkpoint
+
+        Args:
+            stream: Binary file object of NDJSON lines
+            source: Name of the feed, identifying its checkpoint
+            restart: Ignore the checkpoint and read from the beginning
+
+        Returns:
+            dict: The run record (status, offset, lines, stats)
+        """
+        run = self.job_store.start_run(source, restart=restart)
+        if run['status'] == COMPLETED:
+            print(f"✅ Feed {source} was already ingested ({run['lines']} lines)")
+            return run
+
+        if run['lines']:
+            print(f"⏩ Resuming {source} after line {run['lines']}")
+
+        executor = None
+        vector_dim = self.vector_store.dim if self.vector_store is not None else None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context(self.start_method),
+                initializer=_init_worker,
+                initargs=(vector_dim,),
+            )
+        else:
+            from extractors import InformationExtractor
+            info_extractor = InformationExtractor()
+            encoder = HashingTextEncoder(vector_dim) if vector_dim else None
+
+        stats = run['stats']
+        started = time.time()
+        pending = deque()
+        try:
+            for batch, offset, lines in self._batches(stream, run['offset'], run['lines']):
+                if executor is not None:
+                    task = executor.submit(_prepare_in_worker, batch)
+                else:
+                    task = Future()
+                    task.set_result(prepare_lines(batch, info_extractor, encoder) + (None,))
+                pending.append((task, offset, lines))
+
+                while len(pending) > self.workers * 2 or (pending and pending[0][0].done()):
+                    task, offset, lines = pending.popleft()
+                    stats = self._commit(source, task, offset, lines, stats)
+
+                    if lines // self.batch_size % 100 == 0:
+                        rate = (lines - run['lines']) / max(time.time() - started, 1e-9)
+                        print(f"📥 {source}: {lines} lines ({rate:.0f} lines/s)")
+
+            while pending:
+                stats = self._commit(source, *pending.popleft(), stats)
+
+        except BaseException as e:
+            self.job_store.finish_run(source, FAILED, error=str(e) or type(e).__name__)
+            print(f"❌ Ingestion of {source} failed: {str(e)}")
+            raise
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+        self.job_store.finish_run(source, COMPLETED, stats)
+        run = self.job_store.get_run(source)
+        print(f"✅ Ingested {source}: {run['lines']} lines in {time.time() - started:.1f}s "
+              f"({stats.get('inserted', 0)} new, {stats.get('updated', 0)} updated, "
+              f"{stats.get('unchanged', 0)} unchanged, "
+              f"{stats.get('duplicate', 0) + stats.get('near_duplicate', 0)} duplicates)")
+        return run
+
+
+def main():
+    """Ingest an NDJSON job feed from the command line"""
+    from config import settings
+    from .job_store import JobStore
+    from .vector_store import VectorStore
+
+    parser = argparse.ArgumentParser(description='Ingest an NDJSON job feed into the job store')
+    parser.add_argument('feed', help="NDJSON file, or '-' for standard input")
+    parser.add_argument('--source', help='checkpoint name (default: the feed path)')
+    parser.add_argument('--restart', action='store_true',
+                        help='ignore the checkpoint and read the feed from the beginning')
+    parser.add_argument('--workers', type=int, default=settings.INGEST_WORKERS,
+                        help='extraction processes')
+    parser.add_argument('--batch-size', type=int, default=settings.INGEST_BATCH_SIZE,
+                        help='postings per batch')
+    parser.add_argument('--no-dedup', action='store_true',
+                        help='store duplicate postings too')
+    args = parser.parse_args()
+
+    if args.feed == '-' and not args.source:
+        parser.error('--source is required when reading standard input')
+
+    ingestor = JobIngestor(
+        JobStore(settings.JOB_STORE_PATH),
+        vector_store=VectorStore(
+            settings.VECTOR_STORE_PATH, dim=settings.VECTOR_DIM
+        ) if settings.VECTOR_STORE_ENABLED else None,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        near_duplicate_distance=None if args.no_dedup else settings.INGEST_NEAR_DUPLICATE_BITS,
+        start_method=settings.BATCH_START_METHOD
+    )
+
+    if args.feed == '-':
+        run = ingestor.run(sys.stdin.buffer, args.source, restart=args.restart)
+    else:
+        with open(args.feed, 'rb') as stream:
+            run = ingestor.run(
+                stream, args.source or os.path.abspath(args.feed), restart=args.restart
+            )
+    return 0 if run['status'] == COMPLETED else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,256 @@
+"""
+Job Index Module
+In-memory inverted index from skills to job postings with BM25 scoring
+"""
+
+import math
+import threading
+
+import numpy as np
+
+
+def job_skill_counts(info_extractor, posting):
+    """
+    Extract the skills of a job posting with their occurrence counts
+
+    Args:
+        info_extractor: InformationExtractor instance
+        posting: Job posting dict with 'description' and optional 'title'
+
+    Returns:
+        dict: Canonical skill -> number of mentions
+    """
+    text = '\n'.join(
+        part for part in (posting.get('title'), posting.get('description')) if part
+    )
+    hits = info_extractor.extract_skill_hits(text)
+    return {skill: hit['count'] for skill, hit in hits.items()}
+
+
+class JobIndex:
+    """
+    Inverted index of job postings keyed by canonical skill
+
+    Each skill maps to the postings that mention it. Queries are scored
+    with BM25 over skills: a rare skill shared with a job counts for more
+    than a common one (``python``), mentions saturate, and jobs listing
+    many skills are normalized against the average posting.
+
+    Postings are compiled into NumPy arrays of (job slot, precomputed BM25
+    weight) per skill, so scoring a resume is one vectorized scatter-add
+    per resume skill followed by a partial sort, and only the top-k jobs
+    are turned back into Python objects. The compiled snapshot is rebuilt
+    on the first query after the index changed and swapped in with a
+    single reference assignment; queries never take the lock.
+    """
+
+    def __init__(self, k1=1.2, b=0.75):
+        """
+        Args:
+            k1: BM25 term-frequency saturation
+            b: BM25 length normalization (0 disables it)
+        """
+        self.k1 = k1
+        self.b = b
+
+        self._lock = threading.Lock()
+        self._slots = {}      # job id -> slot
+        self._jobs = []       # slot -> posting metadata (None once removed)
+        self._skills = []     # slot -> {skill: count} (None once removed)
+        self._lengths = []    # slot -> total skill mentions
+        self._postings = {}   # skill -> ([slot, ...], [count, ...])
+        self._removed = 0
+        self._snapshot = None
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, job_id):
+        return str(job_id) in self._slots
+
+    def get(self, job_id, default=None):
+        """
+        Get the metadata of an indexed posting
+
+        Args:
+            job_id: Posting id
+            default: Returned when the posting is not indexed
+
+        Returns:
+            dict: Posting metadata (including 'id'), or default
+        """
+        with self._lock:
+            slot = self._slots.get(str(job_id))
+            if slot is None:
+                return default
+            return dict(self._jobs[slot])
+
+    def add(self, job_id, skill_counts, metadata=None):
+        """
+        Add a job posting, replacing any posting with the same id
+
+        Args:
+            job_id: Unique posting id
+            skill_counts: Dict of canonical skill -> mentions
+            metadata: Dict returned with search results (title, company, ...)
+        """
+        job_id = str(job_id)
+        job = dict(metadata or {})
+        job['id'] = job_id
+
+        with self._lock:
+            if job_id in self._slots:
+                self._remove(job_id)
+
+            slot = len(self._jobs)
+            self._slots[job_id] = slot
+            self._jobs.append(job)
+            self._skills.append(dict(skill_counts))
+            self._lengths.append(sum(skill_counts.values()))
+            for skill, count in skill_counts.items():
+                slots, counts = self._postings.setdefault(skill, ([], []))
+                slots.append(slot)
+                counts.append(count)
+
+            self._snapshot = None
+
+    def remove(self, job_id):
+        """
+        Remove a job posting
+
+        Args:
+            job_id: Posting id
+
+        Returns:
+            bool: True if the posting was indexed
+        """
+        with self._lock:
+            if str(job_id) not in self._slots:
+                return False
+            self._remove(str(job_id))
+            self._snapshot = None
+            return True
+
+    def _remove(self, job_id):
+        """Tombstone a posting's slot (caller holds the lock)"""
+        slot = self._slots.pop(job_id)
+        self._jobs[slot] = None
+        self._skills[slot] = None
+        self._lengths[slot] = 0
+        self._removed += 1
+
+        # Reclaim tombstoned slots once they dominate the index
+        if self._removed > len(self._slots):
+            self._compact()
+
+    def _compact(self):
+        """Renumber live postings into contiguous slots (caller holds the lock)"""
+        live = [
+            (job, skills) for job, skills in zip(self._jobs, self._skills)
+            if job is not None
+        ]
+        self._slots = {}
+        self._jobs = []
+        self._skills = []
+        self._lengths = []
+        self._postings = {}
+        self._removed = 0
+
+        for slot, (job, skills) in enumerate(live):
+            self._slots[job['id']] = slot
+            self._jobs.append(job)
+            self._skills.append(skills)
+            self._lengths.append(sum(skills.values()))
+            for skill, count in skills.items():
+                slots, counts = self._postings.setdefault(skill, ([], []))
+                slots.append(slot)
+                counts.append(count)
+
+    def _build_snapshot(self):
+        """Compile postings into per-skill slot and BM25 weight arrays"""
+        with self._lock:
+            if self._snapshot is not None:
+                return self._snapshot
+
+            lengths = np.asarray(self._lengths, dtype=np.float32)
+            alive = np.fromiter(
+                (job is not None for job in self._jobs), dtype=bool, count=len(self._jobs)
+            )
+            documents = len(self._slots)
+            average_length = float(lengths[alive].mean()) if documents else 1.0
+            norms = self.k1 * (1 - self.b + self.b * lengths / max(average_length, 1.0))
+
+            postings = {}
+            for skill, (slots, counts) in self._postings.items():
+                slots = np.asarray(slots, dtype=np.int32)
+                counts = np.asarray(counts, dtype=np.float32)
+                keep = alive[slots]
+                slots, counts = slots[keep], counts[keep]
+                if not len(slots):
+                    continue
+
+                frequency = len(slots)
+                idf = math.log(1 + (documents - frequency + 0.5) / (frequency + 0.5))
+                weights = idf * counts * (self.k1 + 1) / (counts + norms[slots])
+                postings[skill] = (slots, weights.astype(np.float32))
+
+            self._snapshot = {
+                'postings': postings,
+                'jobs': list(self._jobs),
+                'skills': list(self._skills),
+                'size': len(self._jobs),
+            }
+            return self._snapshot
+
+    def search(self, skills, top_k=10):
+        """
+        Rank job postings against a set of resume skills
+
+        Args:
+            skills: Iterable of canonical resume skills
+            top_k: Number of results to return
+
+        Returns:
+            list: Best matches first, each the posting metadata plus
+                  'score' (BM25), 'coverage' (share of the job's skills the
+                  resume has), 'matched_skills' and 'missing_skills'
+        """
+        snapshot = self._snapshot or self._build_snapshot()
+        query = set(skills)
+        if not query or not snapshot['size'] or top_k <= 0:
+            return []
+
+        scores = np.zeros(snapshot['size'], dtype=np.float32)
+        for skill in query:
+            entry = snapshot['postings'].get(skill)
+            if entry is not None:
+                slots, weights = entry
+                scores[slots] += weights
+
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > top_k:
+            best = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+            candidates = np.sort(candidates[best])
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
+
+        results = []
+        for slot in order.tolist():
+            job_skills = snapshot['skills'][slot]
+            matched = sorted(query.intersection(job_skills))
+            results.append({
+                **snapshot['jobs'][slot],
+                'score': round(float(scores[slot]), 4),
+                'coverage': round(len(matched) / len(job_skills), 3),
+                'matched_skills': matched,
+                'missing_skills': sorted(set(job_skills).difference(query)),
+            })
+
+        return results
+
+    def stats(self):
+        """Number of indexed postings and distinct skills"""
+        snapshot = self._snapshot or self._build_snapshot()
+        return {
+            'jobs': len(self._slots),
+            'skills': len(snapshot['postings']),
+        }
@@ -0,0 +1,444 @@
+"""
+Job Store Module
+Durable SQLite store of job postings, their skills and ingestion checkpoints
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from .dedup import SIMHASH_BANDS, hamming_distance, listing_key, simhash_bands
+
+
+# Ingestion run states
+RUNNING = 'running'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+_BAND_COLUMNS = [f'band{band}' for band in range(SIMHASH_BANDS)]
+
+
+def _listing_column(metadata):
+    """Stored form of a posting's listing_key, compared for equality in SQL"""
+    return json.dumps(listing_key(metadata))
+
+
+class JobStore:
+    """
+    Job postings persisted in a local SQLite file
+
+    Every write stamps the posting with the next value of a store-wide
+    sequence number, and removals are kept as tombstones, so each worker
+    process can bring its in-memory JobIndex up to date by replaying the
+    changes after the last sequence number it applied (apply_changes).
+
+    Postings carry an exact content hash and a SimHash fingerprint whose
+    16-bit bands are indexed columns. Near-duplicate candidates are the
+    rows sharing a band and the normalized title, company and location
+    (the indexed listing_key column), so finding them never scans the
+    table or decodes stored metadata.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path: SQLite file of the store
+        """
+        self.path = path
+
+        # SQLite connections must not cross a fork, so each process opens its own
+        self._conn = None
+        self._conn_pid = None
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        db = self._connect()
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS job_postings ('
+            ' id TEXT PRIMARY KEY,'
+            ' seq INTEGER NOT NULL,'
+            ' deleted INTEGER NOT NULL DEFAULT 0,'
+            ' metadata TEXT,'
+            ' skills TEXT,'
+            ' content_hash TEXT,'
+            ' simhash INTEGER,'
+            + ''.join(f' {column} INTEGER,' for column in _BAND_COLUMNS) +
+            ' updated_at REAL NOT NULL,'
+            ' listing_key TEXT)'
+        )
+        self._add_listing_key_column(db)
+        db.execute(
+            'CREATE INDEX IF NOT EXISTS job_postings_listing_key ON job_postings (listing_key)'
+        )
+        db.execute('CREATE INDEX IF NOT EXISTS job_postings_seq ON job_postings (seq)')
+        db.execute(
+            'CREATE INDEX IF NOT EXISTS job_postings_content_hash ON job_postings (content_hash)'
+        )
+        for column in _BAND_COLUMNS:
+            db.execute(
+                f'CREATE INDEX IF NOT EXISTS job_postings_{column} ON job_postings ({column})'
+            )
+        db.execute(
+            'CREATE TABLE IF NOT EXISTS ingest_runs ('
+            ' source TEXT PRIMARY KEY,'
+            ' status TEXT NOT NULL,'
+            ' byte_offset INTEGER NOT NULL DEFAULT 0,'
+            ' lines INTEGER NOT NULL DEFAULT 0,'
+            ' stats TEXT,'
+            ' error TEXT,'
+            ' started_at REAL NOT NULL,'
+            ' updated_at REAL NOT NULL)'
+        )
+
+    def _connect(self):
+        """Open (or reopen after a fork) the SQLite connection"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            self._conn = sqlite3.connect(
+                self.path, timeout=30, check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    @staticmethod
+    def _add_listing_key_column(db):
+        """Add listing_key to a store created before it existed and fill it in"""
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            columns = {row[1] for row in db.execute('PRAGMA table_info(job_postings)')}
+            if 'listing_key' not in columns:
+                db.execute('ALTER TABLE job_postings ADD COLUMN listing_key TEXT')
+                rows = db.execute(
+                    'SELECT id, metadata FROM job_postings WHERE deleted = 0'
+                ).fetchall()
+                db.executemany(
+                    'UPDATE job_postings SET listing_key = ? WHERE id = ?',
+                    [(_listing_column(json.loads(metadata)), job_id) for job_id, metadata in rows]
+                )
+                print(f"🔧 Added listing_key to {len(rows)} stored postings")
+            db.execute('COMMIT')
+        except Exception:
+            db.execute('ROLLBACK')
+            raise
+
+    def _find_duplicate(self, db, record, near_duplicate_distance):
+        """
+        Classify a record against the stored postings
+
+        A record repeating its own stored content is 'unchanged' only if
+        its metadata and skills are unchanged too; otherwise it is stored
+        again so the index picks up the new fields. Stored JSON is only
+        decoded when it differs from the record's serialized form (e.g. in
+        key order). Near-duplicates must also share the normalized title,
+        company and location, which is compared in SQL.
+
+        Args:
+            db: Connection inside the write transaction
+            record: Record with its serialized 'metadata_json', 'skills_json'
+                    and 'listing_key' added by write_batch
+            near_duplicate_distance: SimHash bits within which postings are
+                                     near-duplicates
+
+        Returns:
+            str or None: 'unchanged', 'duplicate', 'near_duplicate' or None
+        """
+        row = db.execute(
+            'SELECT id, metadata, skills FROM job_postings WHERE content_hash = ? AND deleted = 0'
+            ' ORDER BY id = ? DESC LIMIT 1',
+            (record['content_hash'], record['id'])
+        ).fetchone()
+        if row is not None:
+            if row[0] != record['id']:
+                return 'duplicate'
+            if ((row[1] == record['metadata_json']
+                    or json.loads(row[1]) == record['metadata'])
+                    and (row[2] == record['skills_json']
+                         or json.loads(row[2]) == record['skills'])):
+                return 'unchanged'
+            return None
+
+        if near_duplicate_distance is None or not record['simhash']:
+            return None
+
+        bands = simhash_bands(record['simhash'])
+        candidates = db.execute(
+            'SELECT simhash FROM job_postings WHERE deleted = 0 AND id != ?'
+            ' AND listing_key = ? AND ('
+            + ' OR '.join(f'{column} = ?' for column in _BAND_COLUMNS) + ')',
+            (record['id'], record['listing_key'], *bands)
+        )
+        for (fingerprint,) in candidates:
+            if hamming_distance(record['simhash'], fingerprint) <= near_duplicate_distance:
+                return 'near_duplicate'
+        return None
+
+    def write_batch(self, records, near_duplicate_distance=None, checkpoint=None,
+                    before_commit=None):
+        """
+        Upsert a batch of postings in one transaction
+
+        Args:
+            records: List of dicts with id, metadata, skills (skill -> count),
+                     content_hash and simhash
+            near_duplicate_distance: Drop records that repeat the content of
+                     another posting exactly or within this many SimHash bits
+                     (None stores every record as given)
+            checkpoint: Optional dict (source, offset, lines, stats) recorded
+                        in the same transaction; the batch's counts are
+                        added to stats (the run's counters so far)
+            before_commit: Optional callable(accepted records) run before the
+                           transaction commits
+
+        Returns:
+            dict: Counts of inserted, updated, unchanged, duplicate and
+                  near_duplicate records
+        """
+        counts = {
+            'inserted': 0, 'updated': 0, 'unchanged': 0,
+            'duplicate': 0, 'near_duplicate': 0,
+        }
+        accepted = []
+        now = time.time()
+
+        with self._lock:
+            db = self._connect()
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                seq = db.execute('SELECT COALESCE(MAX(seq), 0) FROM job_postings').fetchone()[0]
+
+                for record in records:
+                    stored = dict(
+                        record,
+                        metadata_json=json.dumps(record['metadata']),
+                        skills_json=json.dumps(record['skills']),
+                        listing_key=_listing_column(record['metadata'])
+                    )
+                    if near_duplicate_distance is not None:
+                        verdict = self._find_duplicate(db, stored, near_duplicate_distance)
+                        if verdict is not None:
+                            counts[verdict] += 1
+                            continue
+
+                    exists = db.execute(
+                        'SELECT 1 FROM job_postings WHERE id = ? AND deleted = 0', (record['id'],)
+                    ).fetchone()
+                    seq += 1
+                    db.execute(
+                        'INSERT OR REPLACE INTO job_postings (id, seq, deleted, metadata, skills,'
+                        ' content_hash, simhash, ' + ', '.join(_BAND_COLUMNS) + ','
+                        ' updated_at, listing_key)'
+                        ' VALUES (?, ?, 0, ?, ?, ?, ?, '
+                        + ', '.join('?' * SIMHASH_BANDS) + ', ?, ?)',
+                        (record['id'], seq, stored['metadata_json'], stored['skills_json'],
+                         record['content_hash'], record['simhash'],
+                         *simhash_bands(record['simhash']), now, stored['listing_key'])
+                    )
+                    counts['updated' if exists else 'inserted'] += 1
+                    accepted.append(record)
+
+                if checkpoint is not None:
+                    stats = dict(checkpoint['stats'])
+                    for key, value in counts.items():
+                        stats[key] = stats.get(key, 0) + value
+                    db.execute(
+                        'UPDATE ingest_runs SET byte_offset = ?, lines = ?, stats = ?,'
+                        ' updated_at = ? WHERE source = ?',
+                        (checkpoint['offset'], checkpoint['lines'],
+                         json.dumps(stats), now, checkpoint['source'])
+                    )
+
+                if before_commit is not None:
+                    before_commit(accepted)
+                db.execute('COMMIT')
+            except Exception:
+                db.execute('ROLLBACK')
+                raise
+
+        return counts
+
+    def remove(self, job_id):
+        """
+        Tombstone a posting
+
+        Args:
+            job_id: Posting id
+
+        Returns:
+            bool: True if the posting was stored
+        """
+        with self._lock:
+            db = self._connect()
+            db.execute('BEGIN IMMEDIATE')
+            try:
+                seq = db.execute('SELECT COALESCE(MAX(seq), 0) FROM job_postings').fetchone()[0]
+                cursor = db.execute(
+                    'UPDATE job_postings SET seq = ?, deleted = 1, metadata = NULL, skills = NULL,'
+                    ' content_hash = NULL, simhash = NULL, listing_key = NULL, '
+                    + ', '.join(f'{column} = NULL' for column in _BAND_COLUMNS) +
+                    ', updated_at = ? WHERE id = ? AND deleted = 0',
+                    (seq + 1, time.time(), str(job_id))
+                )
+                db.execute('COMMIT')
+            except Exception:
+                db.execute('ROLLBACK')
+                raise
+        return cursor.rowcount > 0
+
+    def apply_changes(self, job_index, since=0, page_size=5000):
+        """
+        Replay postings written after a sequence number into a JobIndex
+
+        Args:
+            job_index: JobIndex to update
+            since: Last sequence number already applied (0 loads everything)
+            page_size: Rows read per query
+
+        Returns:
+            int: Last sequence number applied
+        """
+        while True:
+            with self._lock:
+                rows = self._connect().execute(
+                    'SELECT seq, id, deleted, metadata, skills FROM job_postings'
+                    ' WHERE seq > ? ORDER BY seq LIMIT ?',
+                    (since, page_size)
+                ).fetchall()
+
+            for seq, job_id, deleted, metadata, skills in rows:
+                if deleted:
+                    job_index.remove(job_id)
+                else:
+                    job_index.add(job_id, json.loads(skills), json.loads(metadata))
+                since = seq
+
+            if len(rows) < page_size:
+                return since
+
+    def count(self):
+        """Number of stored (non-removed) postings"""
+        with self._lock:
+            return self._connect().execute(
+                'SELECT COUNT(*) FROM job_postings WHERE deleted = 0'
+            ).fetchone()[0]
+
+    def start_run(self, source, restart=False):
+        """
+        Begin or resume an ingestion run
+
+        Args:
+            source: Name of the feed (resuming requires the same name)
+            restart: Discard any checkpoint and start from the beginning
+
+        Returns:
+            dict: Run record (status, offset, lines, stats, ...)
+        """
+        now = time.time()
+        with self._lock:
+            db = self._connect()
+            if restart:
+                db.execute('DELETE FROM ingest_runs WHERE source = ?', (source,))
+            db.execute(
+                'INSERT OR IGNORE INTO ingest_runs (source, status, started_at, updated_at)'
+                ' VALUES (?, ?, ?, ?)',
+                (source, RUNNING, now, now)
+            )
+            db.execute(
+                'UPDATE ingest_runs SET status = ?, error = NULL, updated_at = ?'
+                ' WHERE source = ? AND status != ?',
+                (RUNNING, now, source, COMPLETED)
+            )
+        return self.get_run(source)
+
+    def finish_run(self, source, status, stats=None, error=None):
+        """
+        Record the outcome of an ingestion run
+
+        Args:
+            source: Name of the feed
+            status: COMPLETED or FAILED
+            stats: Final counters
+            error: Error message of a failed run
+        """
+        with self._lock:
+            self._connect().execute(
+                'UPDATE ingest_runs SET status = ?, stats = COALESCE(?, stats), error = ?,'
+                ' updated_at = ? WHERE source = ?',
+                (status, json.dumps(stats) if stats is not None else None, error,
+                 time.time(), source)
+            )
+
+    def get_run(self, source):
+        """
+        Look up an ingestion run
+
+        Args:
+            source: Name of the feed
+
+        Returns:
+            dict or None: source, status, offset, lines, stats, error, timestamps
+        """
+        with self._lock:
+            row = self._connect().execute(
+                'SELECT source, status, byte_offset, lines, stats, error, started_at, updated_at'
+                ' FROM ingest_runs WHERE source = ?',
+                (source,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'source': row[0],
+            'status': row[1],
+            'offset': row[2],
+            'lines': row[3],
+            'stats': json.loads(row[4]) if row[4] else {},
+            'error': row[5],
+            'started_at': row[6],
+            'updated_at': row[7],
+        }
+
+
+class JobIndexSync:
+    """
+    Keeps one process's JobIndex in step with the shared JobStore
+
+    Writes made by other workers, the ingestion command or an ingestion
+    run in a background thread become visible after at most one sync
+    interval.
+    """
+
+    def __init__(self, job_store, job_index, interval=5.0):
+        """
+        Args:
+            job_store: JobStore holding the postings
+            job_index: JobIndex of this process
+            interval: Seconds between checks for changes
+        """
+        self.job_store = job_store
+        self.job_index = job_index
+        self.interval = interval
+
+        self._seq = 0
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def sync(self, force=False):
+        """
+        Apply store changes not yet in the index
+
+        Args:
+            force: Check now even if the interval has not elapsed
+        """
+        if not force and time.time() - self._checked_at < self.interval:
+            return
+
+        with self._lock:
+            self._seq = self.job_store.apply_changes(self.job_index, self._seq)
+            self._checked_at = time.time()
@@ -0,0 +1,145 @@
+"""
+Text Encoder Module
+Offline hashing vectorizer for resume and job texts
+"""
+
+import re
+import zlib
+
+import numpy as np
+
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+
+# Function words carry no signal about a role but dominate raw counts
+STOP_WORDS = frozenset("""
+a about above after again all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during
+each etc few for from further had has have having he her here hers him his how
+i if in into is it its itself just me more most my no nor not now of off on once
+only or other our ours out over own per same she should so some such than that
+the their theirs them then there these they this those through to too under
+until up us very was we were what when where which while who whom why will with
+within would you your yours
+""".split())
+
+# Odd 64-bit constants used to combine and mix word hashes
+_PAIR_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_MIX_MULTIPLIER = np.uint64(0xBF58476D1CE4E5B9)
+
+# Word -> 64-bit hash; job texts share most of their vocabulary, so hashing
+# each distinct word once keeps per-text work in NumPy
+_word_hash_cache = {}
+_WORD_HASH_CACHE_SIZE = 500000
+
+
+def hash_words(words):
+    """
+    Stable 64-bit hashes of words (two CRC32s, the second salted)
+
+    Args:
+        words: List of strings
+
+    Returns:
+        numpy.ndarray: uint64 hash per word
+    """
+    cache = _word_hash_cache
+    if len(cache) > _WORD_HASH_CACHE_SIZE:
+        cache.clear()
+
+    # Hashes are collected locally: another thread may clear the shared
+    # cache between filling it and reading it back
+    hashes = {}
+    for word in set(words):
+        value = cache.get(word)
+        if value is None:
+            data = word.encode('utf-8')
+            value = cache[word] = (zlib.crc32(data) << 32) | zlib.crc32(data, 0x9E3779B9)
+        hashes[word] = value
+    return np.array([hashes[word] for word in words], dtype=np.uint64)
+
+
+def mix_hashes(hashes):
+    """Scramble uint64 hashes so every output bit depends on every input bit"""
+    hashes = hashes ^ (hashes >> np.uint64(31))
+    hashes = hashes * _MIX_MULTIPLIER
+    return hashes ^ (hashes >> np.uint64(29))
+
+
+def ngram_hashes(word_hashes, size):
+    """
+    Hashes of consecutive word n-grams, combined from the word hashes
+
+    Args:
+        word_hashes: uint64 hashes from hash_words
+        size: Words per n-gram
+
+    Returns:
+        numpy.ndarray: uint64 hash per n-gram (empty if there are fewer words)
+    """
+    count = len(word_hashes) - size + 1
+    if count <= 0:
+        return np.empty(0, dtype=np.uint64)
+
+    combined = word_hashes[:count].copy()
+    for offset in range(1, size):
+        combined = combined * _PAIR_MULTIPLIER + word_hashes[offset:offset + count]
+    return mix_hashes(combined)
+
+
+class HashingTextEncoder:
+    """
+    Encode texts as fixed-width dense vectors without a fitted model
+
+    Word unigrams and bigrams are hashed (CRC32-based, stable across
+    processes and restarts) into ``dim`` signed buckets with sublinear
+    term frequency, then L2-normalized so the dot product of two vectors
+    is their cosine similarity. Folding the open vocabulary into a few
+    hundred buckets is the dimensionality reduction: nothing has to be
+    trained, stored or kept in sync between workers.
+    """
+
+    def __init__(self, dim=256):
+        """
+        Args:
+            dim: Vector width
+        """
+        self.dim = dim
+
+    @staticmethod
+    def tokens(text):
+        """Lowercased tokens of a text, stop words removed"""
+        return [
+            token for token in _TOKEN_PATTERN.findall((text or '').lower())
+            if token not in STOP_WORDS
+        ]
+
+    def encode(self, texts):
+        """
+        Encode a batch of texts
+
+        Args:
+            texts: List of strings
+
+        Returns:
+            numpy.ndarray: float32 matrix of shape (len(texts), dim), rows
+                           L2-normalized (all-zero for texts without tokens)
+        """
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+
+        for row, text in enumerate(texts):
+            word_hashes = hash_words(self.tokens(text))
+            if not len(word_hashes):
+                continue
+
+            features = np.concatenate([mix_hashes(word_hashes), ngram_hashes(word_hashes, 2)])
+            features, counts = np.unique(features, return_counts=True)
+
+            # The top hash bit picks the sign so collisions tend to cancel
+            signs = np.where(features >> np.uint64(63), 1.0, -1.0).astype(np.float32)
+            buckets = (features % np.uint64(self.dim)).astype(np.intp)
+            np.add.at(matrix[row], buckets, signs * (1.0 + np.log(counts, dtype=np.float32)))
+
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
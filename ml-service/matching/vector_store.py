@@ -0,0 +1,338 @@
+"""
+Vector Store Module
+Memory-mapped float32 vector matrix with batched cosine top-k search
+"""
+
+import contextlib
+import fcntl
+import json
+import os
+import threading
+
+import numpy as np
+
+
+# Rows scored per matrix multiply; bounds the score buffer for large stores
+SEARCH_CHUNK_ROWS = 65536
+
+
+class VectorStore:
+    """
+    Append-only store of L2-normalized vectors, persisted as one raw
+    float32 matrix that every process maps read-only
+
+    Files in the store directory (``<g>`` is the compaction generation):
+
+        meta.json          dim, generation and the committed row count
+        vectors-<g>.f32    row-major float32 matrix, one row per vector
+        ids-<g>.txt        id of each row, one per line
+        removed-<g>.i32    int32 numbers of rows that were replaced or removed
+
+    Writers append rows and ids, record replaced rows as removed, then
+    publish the new row count by atomically replacing meta.json. Writers
+    serialize on a file lock. Readers map exactly the committed rows, so
+    opening a store costs no more than reading its ids. The matrix lives
+    in the shared page cache instead of each worker's heap. A reader picks
+    up new rows incrementally when meta.json changes.
+
+    compact() rewrites live rows into a new generation. Old files are
+    unlinked, and readers still holding their mapping keep working until
+    they refresh.
+    """
+
+    def __init__(self, path, dim=256):
+        """
+        Args:
+            path: Store directory (created if missing)
+            dim: Vector width (must match an existing store)
+        """
+        self.path = path
+        self.dim = dim
+        os.makedirs(path, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._signature = None
+        self._state = None
+
+        with self._write_lock():
+            if not os.path.exists(self._meta_path):
+                self._write_meta({'dim': dim, 'generation': 0, 'rows': 0})
+        self._refresh()
+
+        if self._state['dim'] != dim:
+            raise ValueError(
+                f"Vector store {path} has dimension {self._state['dim']}, expected {dim}"
+            )
+
+    @property
+    def _meta_path(self):
+        return os.path.join(self.path, 'meta.json')
+
+    def _file(self, kind, generation):
+        """Path of one of a generation's files ('vectors', 'ids' or 'removed')"""
+        extension = {'vectors': 'f32', 'ids': 'txt', 'removed': 'i32'}[kind]
+        return os.path.join(self.path, f'{kind}-{generation}.{extension}')
+
+    @contextlib.contextmanager
+    def _write_lock(self):
+        """Serialize writers across threads and processes"""
+        with self._lock, open(os.path.join(self.path, 'write.lock'), 'a') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _write_meta(self, meta):
+        """Atomically replace meta.json"""
+        temp_path = f'{self._meta_path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as handle:
+            json.dump(meta, handle)
+        os.replace(temp_path, self._meta_path)
+
+    def _refresh(self):
+        """
+        Bring the in-process view up to date with meta.json
+
+        Returns:
+            dict: Current state (matrix, ids, alive mask, row positions)
+        """
+        stat = os.stat(self._meta_path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        if signature == self._signature:
+            return self._state
+
+        with self._lock:
+            if signature == self._signature:
+                return self._state
+
+            with open(self._meta_path, encoding='utf-8') as handle:
+                meta = json.load(handle)
+            generation, rows = meta['generation'], meta['rows']
+
+            previous = self._state
+            if previous is None or previous['generation'] != generation:
+                previous = {
+                    'generation': generation, 'rows': 0, 'ids': [], 'positions': {},
+                    'alive': np.zeros(0, dtype=bool), 'ids_offset': 0, 'removed_offset': 0,
+                }
+
+            ids = previous['ids']
+            positions = previous['positions']
+            ids_offset = previous['ids_offset']
+            if rows > previous['rows']:
+                with open(self._file('ids', generation), 'rb') as handle:
+                    handle.seek(ids_offset)
+                    for _ in range(rows - previous['rows']):
+                        line = handle.readline()
+                        ids_offset += len(line)
+                        item_id = line.decode('utf-8').rstrip('\n')
+                        positions[item_id] = len(ids)
+                        ids.append(item_id)
+
+            alive = np.ones(rows, dtype=bool)
+            alive[:len(previous['alive'])] = previous['alive']
+            removed_offset = previous['removed_offset']
+            removed_path = self._file('removed', generation)
+            if os.path.exists(removed_path):
+                with open(removed_path, 'rb') as handle:
+                    handle.seek(removed_offset)
+                    data = handle.read()
+                data = data[:len(data) - len(data) % 4]
+                removed_offset += len(data)
+                for row in np.frombuffer(data, dtype=np.int32).tolist():
+                    alive[row] = False
+                    if positions.get(ids[row]) == row:
+                        del positions[ids[row]]
+
+            matrix = np.memmap(
+                self._file('vectors', generation), dtype=np.float32, mode='r',
+                shape=(rows, meta['dim'])
+            ) if rows else np.zeros((0, meta['dim']), dtype=np.float32)
+
+            self._state = {
+                'dim': meta['dim'], 'generation': generation, 'rows': rows,
+                'matrix': matrix, 'ids': ids, 'positions': positions, 'alive': alive,
+                'ids_offset': ids_offset, 'removed_offset': removed_offset,
+            }
+            self._signature = signature
+            return self._state
+
+    def __len__(self):
+        return len(self._refresh()['positions'])
+
+    def __contains__(self, item_id):
+        return str(item_id) in self._refresh()['positions']
+
+    def add(self, ids, vectors):
+        """
+        Add vectors, replacing existing vectors with the same ids
+
+        Args:
+            ids: List of ids, one per vector (unique within the call)
+            vectors: float32 array of shape (len(ids), dim), rows L2-normalized
+        """
+        ids = [str(item_id) for item_id in ids]
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if vectors.shape != (len(ids), self.dim):
+            raise ValueError(f'Expected vectors of shape ({len(ids)}, {self.dim})')
+        if any('\n' in item_id for item_id in ids):
+            raise ValueError('Vector ids must not contain newlines')
+        if not ids:
+            return
+
+        with self._write_lock():
+            state = self._refresh()
+            generation, rows = state['generation'], state['rows']
+            replaced = [state['positions'][item_id] for item_id in ids
+                        if item_id in state['positions']]
+
+            self._append(self._file('vectors', generation), vectors.tobytes(),
+                         rows * self.dim * 4)
+            self._append(self._file('ids', generation),
+                         ''.join(f'{item_id}\n' for item_id in ids).encode('utf-8'),
+                         state['ids_offset'])
+            if replaced:
+                self._append(self._file('removed', generation),
+                             np.asarray(replaced, dtype=np.int32).tobytes(),
+                             state['removed_offset'])
+
+            self._write_meta({'dim': self.dim, 'generation': generation,
+                              'rows': rows + len(ids)})
+
+    @staticmethod
+    def _append(path, data, committed_size):
+        """Append data after the committed end of a file (dropping torn writes)"""
+        with open(path, 'ab') as handle:
+            handle.truncate(committed_size)
+            handle.write(data)
+            handle.flush()
+            os.fsync(handle.fileno())
+
+    def remove(self, item_id):
+        """
+        Remove a vector
+
+        Args:
+            item_id: Vector id
+
+        Returns:
+            bool: True if the id was stored
+        """
+        with self._write_lock():
+            state = self._refresh()
+            row = state['positions'].get(str(item_id))
+            if row is None:
+                return False
+
+            self._append(self._file('removed', state['generation']),
+                         np.asarray([row], dtype=np.int32).tobytes(),
+                         state['removed_offset'])
+            # Touch meta.json so every reader notices the removal
+            self._write_meta({'dim': self.dim, 'generation': state['generation'],
+                              'rows': state['rows']})
+            return True
+
+    def compact(self):
+        """
+        Rewrite live rows into a new generation, reclaiming removed rows
+
+        Returns:
+            int: Rows reclaimed
+        """
+        with self._write_lock():
+            state = self._refresh()
+            live = np.flatnonzero(state['alive'])
+            reclaimed = state['rows'] - len(live)
+            if not reclaimed:
+                return 0
+
+            old_generation = state['generation']
+            generation = old_generation + 1
+            with open(self._file('vectors', generation), 'wb') as handle:
+                for start in range(0, len(live), SEARCH_CHUNK_ROWS):
+                    handle.write(np.ascontiguousarray(
+                        state['matrix'][live[start:start + SEARCH_CHUNK_ROWS]]
+                    ).tobytes())
+                os.fsync(handle.fileno())
+            with open(self._file('ids', generation), 'wb') as handle:
+                handle.write(''.join(
+                    f"{state['ids'][row]}\n" for row in live.tolist()
+                ).encode('utf-8'))
+                os.fsync(handle.fileno())
+
+            self._write_meta({'dim': self.dim, 'generation': generation, 'rows': len(live)})
+
+            for kind in ('vectors', 'ids', 'removed'):
+                try:
+                    os.remove(self._file(kind, old_generation))
+                except FileNotFoundError:
+                    pass
+
+        print(f"🧹 Vector store compacted: {reclaimed} rows reclaimed")
+        return reclaimed
+
+    def search(self, queries, top_k=10):
+        """
+        Cosine top-k for a batch of query vectors
+
+        Args:
+            queries: float32 array of shape (n, dim) or (dim,), L2-normalized
+            top_k: Results per query
+
+        Returns:
+            list: Per query, a list of (id, similarity) pairs, best first
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if top_k <= 0:
+            return [[] for _ in queries]
+        state = self._refresh()
+        matrix, alive = state['matrix'], state['alive']
+
+        best_scores = np.empty((len(queries), 0), dtype=np.float32)
+        best_rows = np.empty((len(queries), 0), dtype=np.int64)
+
+        for start in range(0, state['rows'], SEARCH_CHUNK_ROWS):
+            block = matrix[start:start + SEARCH_CHUNK_ROWS]
+            scores = queries @ block.T
+            dead = ~alive[start:start + len(block)]
+            if dead.any():
+                scores[:, dead] = -np.inf
+
+            # Top-k of this chunk, then merged with the running top-k
+            if scores.shape[1] > top_k:
+                rows = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+                scores = np.take_along_axis(scores, rows, axis=1)
+                rows += start
+            else:
+                rows = np.broadcast_to(
+                    np.arange(start, start + len(block)), scores.shape
+                )
+
+            scores = np.concatenate([best_scores, scores], axis=1)
+            rows = np.concatenate([best_rows, rows], axis=1)
+            if scores.shape[1] > top_k:
+                keep = np.argpartition(-scores, top_k - 1, axis=1)[:, :top_k]
+                scores = np.take_along_axis(scores, keep, axis=1)
+                rows = np.take_along_axis(rows, keep, axis=1)
+            best_scores, best_rows = scores, rows
+
+        results = []
+        for scores, rows in zip(best_scores, best_rows):
+            order = np.argsort(-scores, kind='stable')
+            results.append([
+                (state['ids'][row], round(float(score), 4))
+                for score, row in zip(scores[order].tolist(), rows[order].tolist())
+                if score != -np.inf
+            ])
+        return results
+
+    def stats(self):
+        """Live vectors, committed rows and size on disk"""
+        state = self._refresh()
+        return {
+            'vectors': len(state['positions']),
+            'rows': state['rows'],
+            'dim': state['dim'],
+            'bytes': state['rows'] * state['dim'] * 4,
+        }
@@ -0,0 +1,16 @@
+"""
+Monitoring Module
+Latency histograms and counters for the parse pipeline
+"""
+
+from .metrics import (
+    REGISTRY, Counter, Histogram, MetricsRegistry,
+    OCR_FALLBACK_DOCUMENTS, OCR_PAGES, PDF_BYTES, PDF_DOCUMENTS, STAGE_SECONDS,
+    drain_worker_metrics, merge_worker_metrics, time_stage, timed
+)
+
+__all__ = [
+    'REGISTRY', 'Counter', 'Histogram', 'MetricsRegistry',
+    'OCR_FALLBACK_DOCUMENTS', 'OCR_PAGES', 'PDF_BYTES', 'PDF_DOCUMENTS', 'STAGE_SECONDS',
+    'drain_worker_metrics', 'merge_worker_metrics', 'time_stage', 'timed'
+]
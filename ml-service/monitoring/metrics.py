@@ -0,0 +1,383 @@
+"""
+Metrics Module
+In-process counters and histograms rendered in the Prometheus text format
+
+Pool worker processes (batch parsing, job ingestion) record into their
+own copy of the registry. Each task drains it with drain_worker_metrics()
+and returns the snapshot with its result; the parent adds it to its own
+registry with merge_worker_metrics(), so /metrics covers their stages too.
+"""
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Histogram bucket upper bounds in seconds: sub-millisecond regex passes
+# up to multi-second OCR of large scans
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+
+def _escape(value):
+    """Escape a label value for the text exposition format"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, labelvalues, extra=None):
+    """Render {name="value",...} for one sample (empty string without labels)"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.extend(f'{name}="{_escape(value)}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_number(value):
+    """Render a sample value (integers without a trailing .0)"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+    """Monotonically increasing count, optionally split by labels"""
+
+    type_name = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        # Unlabelled counters report 0 before the first increment
+        self._values = {} if self.labelnames else {(): 0}
+        self._lock = threading.Lock()
+
+    def _key(self, labels):
+        """Label values in labelnames order"""
+        return tuple(labels.get(name, '') for name in self.labelnames)
+
+    def inc(self, amount=1, **labels):
+        """
+        Increase the counter
+
+        Args:
+            amount: Non-negative increment
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels):
+        """Current value for the given labels"""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def drain(self):
+        """
+        Take the counts recorded so far and reset them
+
+        Returns:
+            dict: Label values -> count, without zero counts
+        """
+        with self._lock:
+            values = self._values
+            self._values = {} if self.labelnames else {(): 0}
+        return {key: value for key, value in values.items() if value}
+
+    def merge(self, values):
+        """
+        Add counts drained from the same counter in another process
+
+        Args:
+            values: Result of drain()
+        """
+        with self._lock:
+            for key, value in values.items():
+                self._values[key] = self._values.get(key, 0) + value
+
+    def render(self):
+        """
+        Render the samples of this metric
+
+        Returns:
+            list: Exposition lines
+        """
+        with self._lock:
+            values = sorted(self._values.items())
+        return [
+            f'{self.name}{_format_labels(self.labelnames, key)} {_format_number(value)}'
+            for key, value in values
+        ]
+
+
+class Histogram:
+    """Distribution of observed values in cumulative buckets"""
+
+    type_name = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels every sample carries
+            buckets: Sorted bucket upper bounds (+Inf is added)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, **labels):
+        """
+        Record one observation
+
+        Args:
+            value: Observed value (seconds for durations)
+            **labels: Label values
+        """
+        key = tuple(labels.get(name, '') for name in self.labelnames)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {
+                    'counts': [0] * len(self.buckets),
+                    'sum': 0.0,
+                    'count': 0,
+                }
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series['counts'][index] += 1
+                    break
+            series['sum'] += value
+            series['count'] += 1
+
+    def drain(self):
+        """
+        Take the series recorded so far and reset them
+
+        Returns:
+            dict: Label values -> {'counts', 'sum', 'count'}
+        """
+        with self._lock:
+            series, self._series = self._series, {}
+        return series
+
+    def merge(self, series):
+        """
+        Add series drained from the same histogram in another process
+
+        Args:
+            series: Result of drain()
+        """
+        with self._lock:
+            for key, data in series.items():
+                target = self._series.get(key)
+                if target is None:
+                    target = self._series[key] = {
+                        'counts': [0] * len(self.buckets),
+                        'sum': 0.0,
+                        'count': 0,
+                    }
+                target['counts'] = [a + b for a, b in zip(target['counts'], data['counts'])]
+                target['sum'] += data['sum']
+                target['count'] += data['count']
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of a with-block"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def render(self):
+        """
+        Render the samples of this metric
+
+        Returns:
+            list: Exposition lines
+        """
+        with self._lock:
+            series = sorted(
+                (key, list(data['counts']), data['sum'], data['count'])
+                for key, data in self._series.items()
+            )
+
+        lines = []
+        for key, counts, total, count in series:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, [('le', _format_number(bound))])
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f'{self.name}_sum{labels} {_format_number(total)}')
+            lines.append(f'{self.name}_count{labels} {count}')
+        return lines
+
+
+class MetricsRegistry:
+    """Named collection of metrics exposed together"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        """Add a metric, returning the existing one if the name is taken"""
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name, documentation, labelnames=()):
+        """Create (or get) a counter"""
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Create (or get) a histogram"""
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def drain(self):
+        """
+        Take everything recorded so far and reset it
+
+        Returns:
+            dict: Metric name -> drained values, only for metrics with data
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        snapshot = {}
+        for metric in metrics:
+            values = metric.drain()
+            if values:
+                snapshot[metric.name] = values
+        return snapshot
+
+    def merge(self, snapshot):
+        """
+        Add a snapshot drained from the registry of another process
+
+        Args:
+            snapshot: Result of drain(); unknown metric names are ignored
+        """
+        with self._lock:
+            metrics = {name: self._metrics.get(name) for name in snapshot}
+        for name, metric in metrics.items():
+            if metric is not None:
+                metric.merge(snapshot[name])
+
+    def render(self):
+        """
+        Render every metric in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type_name}')
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# Process-wide registry. Each gunicorn worker keeps its own values, so
+# /metrics reports the worker that served the scrape (including the pool
+# tasks it merged back).
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'resume_stage_duration_seconds',
+    'Duration of resume parsing pipeline stages',
+    labelnames=('stage',)
+)
+OCR_PAGES = REGISTRY.counter(
+    'resume_ocr_pages_total',
+    'Pages run through OCR'
+)
+OCR_FALLBACK_DOCUMENTS = REGISTRY.counter(
+    'resume_ocr_fallback_documents_total',
+    'Documents with at least one page falling back to OCR'
+)
+PDF_BYTES = REGISTRY.counter(
+    'resume_pdf_bytes_total',
+    'Bytes of uploaded PDFs processed',
+    labelnames=('endpoint',)
+)
+PDF_DOCUMENTS = REGISTRY.counter(
+    'resume_pdf_documents_total',
+    'Uploaded PDFs processed',
+    labelnames=('endpoint',)
+)
+
+
+def time_stage(stage):
+    """
+    Time a pipeline stage
+
+    Args:
+        stage: Stage name (label of resume_stage_duration_seconds)
+
+    Returns:
+        context manager: Records the duration of the with-block
+    """
+    return STAGE_SECONDS.time(stage=stage)
+
+
+def timed(stage):
+    """
+    Decorator recording each call of a function as a pipeline stage
+
+    Args:
+        stage: Stage name (label of resume_stage_duration_seconds)
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with STAGE_SECONDS.time(stage=stage):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def drain_worker_metrics():
+    """
+    Snapshot and reset this process's metrics at the end of a pool task
+
+    Anything recorded after the snapshot (e.g. a task that failed before
+    draining) rides along with the next task's snapshot.
+
+    Returns:
+        dict: Picklable snapshot for merge_worker_metrics()
+    """
+    return REGISTRY.drain()
+
+
+def merge_worker_metrics(snapshot):
+    """
+    Add the metrics a pool task recorded in its worker process
+
+    Args:
+        snapshot: Result of drain_worker_metrics() in the worker, or None
+    """
+    if snapshot:
+        REGISTRY.merge(snapshot)
@@ -3,7 +3,8 @@ Parsers Module
 Handles document parsing for various file formats
 """
 
-from .pdf_parser import PDFParser
+from .pdf_parser import PDFParser, probe_tesseract
+from .pdf_document import PDFDocument
 
-__all__ = ['PDFParser']
+__all__ = ['PDFParser', 'PDFDocument', 'probe_tesseract']
 
@@ -0,0 +1,204 @@
+"""
+OCR Engine Module
+Tesseract backends fed with the raw samples of rendered pages
+
+A rendered page is a dict with the pixel buffer and its layout:
+
+    {'samples': buffer (bytes or memoryview), 'width': int, 'height': int,
+     'channels': 1 (gray) or 3 (RGB), 'stride': bytes per row, 'dpi': int,
+     'pixmap': object owning the buffer, kept alive while the page is OCR'd}
+"""
+
+import threading
+
+
+class TesserocrBackend:
+    """
+    In-process Tesseract through the tesserocr C API
+
+    Each OCR thread keeps one engine for its whole life, so the language
+    data is loaded once per thread instead of once per page, and pages go
+    to Tesseract as raw samples: no image encoding, temp files or
+    subprocesses. tesserocr releases the GIL while recognizing, so OCR
+    threads run in parallel, and a recognition past its timeout is
+    abandoned by Tesseract itself, freeing the thread.
+    """
+
+    name = 'tesserocr'
+
+    def __init__(self, language='eng'):
+        """
+        Args:
+            language: Tesseract language code
+
+        Raises:
+            ImportError: If tesserocr is not installed
+        """
+        import tesserocr
+
+        self._tesserocr = tesserocr
+        self.language = language
+        self._local = threading.local()
+        self._copy_samples = False
+
+    def _engine(self):
+        """This thread's engine, created on first use"""
+        engine = getattr(self._local, 'engine', None)
+        if engine is None:
+            engine = self._local.engine = self._tesserocr.PyTessBaseAPI(lang=self.language)
+        return engine
+
+    def version(self):
+        """
+        Tesseract version, checking that an engine can be started
+
+        The check uses a throwaway engine, released at once: the calling
+        thread (the warm-up) is not an OCR thread and would otherwise keep
+        the language data loaded for nothing.
+
+        Raises:
+            RuntimeError: If the language data cannot be loaded
+        """
+        with self._tesserocr.PyTessBaseAPI(lang=self.language):
+            pass
+        return self._tesserocr.tesseract_version().splitlines()[0]
+
+    def _set_image(self, engine, page):
+        """Hand the page's samples to the engine, without a copy when it accepts buffers"""
+        layout = (page['width'], page['height'], page['channels'], page['stride'])
+        if not self._copy_samples:
+            try:
+                engine.SetImageBytes(page['samples'], *layout)
+                return
+            except TypeError:
+                # tesserocr builds that only take bytes: copy from now on
+                self._copy_samples = True
+        engine.SetImageBytes(bytes(page['samples']), *layout)
+
+    def recognize(self, page, timeout=None):
+        """
+        OCR one rendered page
+
+        Args:
+            page: Rendered page dict (see module docstring)
+            timeout: Seconds before Tesseract abandons the page (None: no limit)
+
+        Returns:
+            str: Recognized text
+
+        Raises:
+            TimeoutError: If the timeout expired
+        """
+        engine = self._engine()
+        try:
+            self._set_image(engine, page)
+            engine.SetSourceResolution(page['dpi'])
+            # Tesseract checks the timeout (in ms, 0 = none) while it
+            # recognizes, so a slow page releases its OCR thread on time
+            if not engine.Recognize(max(1, int(timeout * 1000)) if timeout else 0):
+                if timeout:
+                    raise TimeoutError(f'OCR did not finish within {timeout:.1f}s')
+                raise RuntimeError('Tesseract could not recognize the page')
+            return engine.GetUTF8Text()
+        finally:
+            engine.Clear()
+
+
+class PytesseractBackend:
+    """
+    Tesseract command line through pytesseract
+
+    Fallback when tesserocr is unavailable: every page is written to a
+    temp file and recognized by a new tesseract process.
+    """
+
+    name = 'pytesseract'
+
+    def __init__(self, language='eng'):
+        """
+        Args:
+            language: Tesseract language code
+        """
+        import pytesseract
+        from PIL import Image
+
+        self._pytesseract = pytesseract
+        self._image = Image
+        self.language = language
+
+    def version(self):
+        """
+        Tesseract version
+
+        Raises:
+            Exception: If the tesseract binary cannot be run
+        """
+        return f'tesseract {self._pytesseract.get_tesseract_version()}'
+
+    def recognize(self, page, timeout=None):
+        """
+        OCR one rendered page
+
+        Args:
+            page: Rendered page dict (see module docstring)
+            timeout: Seconds before the tesseract process is killed (None: no limit)
+
+        Returns:
+            str: Recognized text
+
+        Raises:
+            RuntimeError: If the timeout expired
+        """
+        mode = 'L' if page['channels'] == 1 else 'RGB'
+        image = self._image.frombuffer(
+            mode, (page['width'], page['height']), page['samples'],
+            'raw', mode, page['stride'], 1
+        )
+        try:
+            return self._pytesseract.image_to_string(
+                image, lang=self.language, config=f"--dpi {page['dpi']}",
+                timeout=timeout or 0
+            )
+        finally:
+            image.close()
+
+
+OCR_BACKENDS = {
+    'tesserocr': TesserocrBackend,
+    'pytesseract': PytesseractBackend,
+}
+
+
+def load_ocr_backend(name='tesserocr', language='eng'):
+    """
+    Create a working OCR backend
+
+    tesserocr falls back to pytesseract when it is not installed or its
+    engine cannot start; pytesseract is used only as asked.
+
+    Args:
+        name: 'tesserocr' or 'pytesseract'
+        language: Tesseract language code
+
+    Returns:
+        tuple: (backend, Tesseract version)
+
+    Raises:
+        ValueError: If the backend name is unknown
+        RuntimeError: If no backend can run Tesseract
+    """
+    if name not in OCR_BACKENDS:
+        raise ValueError(
+            f"Unknown OCR backend '{name}' (expected one of: {', '.join(OCR_BACKENDS)})"
+        )
+
+    candidates = [name] if name == 'pytesseract' else [name, 'pytesseract']
+    errors = []
+    for candidate in candidates:
+        try:
+            backend = OCR_BACKENDS[candidate](language)
+            return backend, backend.version()
+        except Exception as e:
+            errors.append(f'{candidate}: {e}')
+
+    raise RuntimeError('; '.join(errors))
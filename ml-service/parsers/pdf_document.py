@@ -0,0 +1,152 @@
+"""
+PDF Document Module
+A PDF opened once and shared by every parsing step of a request
+"""
+
+
+class PDFDocument:
+    """
+    Open PDF handle serving validation, page text, metadata and rendering
+
+    The PDF structure is parsed once when the object is created. Page text
+    is cached so steps that look at the same page (validation reads the
+    first page, extraction reads all of them) do not extract it twice.
+
+    Use as a context manager so the handle is released when the request
+    ends:
+
+        with pdf_parser.open(pdf_bytes) as document:
+            pdf_parser.validate_pdf(document)
+            pdf_parser.extract_text(document)
+    """
+
+    def __init__(self, source):
+        """
+        Args:
+            source: PDF bytes or path to a PDF file
+
+        Raises:
+            Exception: If the source cannot be opened as a PDF
+        """
+        # PyMuPDF is imported on first use so importing the service stays fast
+        import fitz
+
+        if isinstance(source, (bytes, bytearray, memoryview)):
+            self.doc = fitz.open(stream=source, filetype="pdf")
+        else:
+            self.doc = fitz.open(source, filetype="pdf")
+
+        self._page_texts = {}
+
+    @property
+    def page_count(self):
+        """Number of pages in the document"""
+        return len(self.doc)
+
+    @property
+    def closed(self):
+        """Whether the underlying handle has been released"""
+        return self.doc is None
+
+    def page_text(self, page_index):
+        """
+        Get the embedded text of a page
+
+        Args:
+            page_index: 0-based page index
+
+        Returns:
+            str: Text layer of the page (may be empty for scanned pages)
+        """
+        text = self._page_texts.get(page_index)
+        if text is None:
+            text = self._page_texts[page_index] = self.doc[page_index].get_text()
+        return text
+
+    def cached_page_text(self, page_index):
+        """
+        Get the embedded text of a page if it was already extracted
+
+        Args:
+            page_index: 0-based page index
+
+        Returns:
+            str or None: Text layer of the page, None if not yet extracted
+        """
+        return self._page_texts.get(page_index)
+
+    def page_size(self, page_index):
+        """
+        Get the size of a page
+
+        Args:
+            page_index: 0-based page index
+
+        Returns:
+            tuple: (width, height) in points (1/72 inch)
+        """
+        rect = self.doc[page_index].rect
+        return rect.width, rect.height
+
+    def largest_image_pixels(self, page_index):
+        """
+        Get the pixel count of the largest image a page embeds
+
+        Read from the image dictionaries, without decoding any image.
+
+        Args:
+            page_index: 0-based page index
+
+        Returns:
+            int: width * height of the largest image (0 without images)
+        """
+        return max(
+            (width * height for _, _, width, height, *_ in self.doc[page_index].get_images()),
+            default=0
+        )
+
+    def render_page(self, page_index, dpi=144, colorspace='gray'):
+        """
+        Render a page to a pixmap without an alpha channel
+
+        Args:
+            page_index: 0-based page index
+            dpi: Resolution (144 renders at 2x the PDF's 72 points per inch)
+            colorspace: 'gray' (one byte per pixel) or 'rgb'
+
+        Returns:
+            fitz.Pixmap: Rendered page
+        """
+        import fitz
+
+        return self.doc[page_index].get_pixmap(
+            dpi=dpi, colorspace=fitz.csRGB if colorspace == 'rgb' else fitz.csGRAY, alpha=False
+        )
+
+    def metadata(self):
+        """
+        Get document metadata
+
+        Returns:
+            dict: Metadata information
+        """
+        return {
+            'page_count': self.page_count,
+            'author': self.doc.metadata.get('author', ''),
+            'title': self.doc.metadata.get('title', ''),
+            'subject': self.doc.metadata.get('subject', ''),
+            'keywords': self.doc.metadata.get('keywords', ''),
+        }
+
+    def close(self):
+        """Release the underlying PyMuPDF document"""
+        if self.doc is not None:
+            self.doc.close()
+            self.doc = None
+            self._page_texts.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -3,32 +3,384 @@ PDF Parser Module
 Handles extraction of text from PDF files with OCR support
 """
 
-import fitz  # PyMuPDF
-from PIL import Image
-import io
-import pytesseract
+import math
+import threading
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+from config import settings
+from monitoring import OCR_FALLBACK_DOCUMENTS, OCR_PAGES, time_stage
+from .ocr_engine import load_ocr_backend
+from .pdf_document import PDFDocument
+
+
+# Separator inserted between the text of consecutive pages
+PAGE_SEPARATOR = "\n\n--- Page Break ---\n\n"
+
+# Reasons a parse can leave pages out (see PDFParser.extract_text_details)
+TRUNCATED_MAX_PAGES = 'max_pages'
+TRUNCATED_MAX_PIXELS = 'max_pixels'
+TRUNCATED_DEADLINE = 'deadline'
+
+# OCR backend of the process and its probe result, set on first use
+_ocr_backend = None
+_tesseract_probe = None
+_tesseract_probe_lock = threading.Lock()
+
+
+def probe_tesseract():
+    """
+    Check whether Tesseract can be run, once per process
+    
+    Loading the configured backend (settings.OCR_BACKEND) starts an
+    engine or runs the tesseract binary, so the answer is cached and the
+    first caller (normally the background warm-up) pays for it, including
+    the import of the OCR modules.
+    
+    Returns:
+        tuple: (available: bool, Tesseract version or error message: str)
+    """
+    global _ocr_backend, _tesseract_probe
+    
+    with _tesseract_probe_lock:
+        if _tesseract_probe is None:
+            try:
+                _ocr_backend, version = load_ocr_backend(
+                    settings.OCR_BACKEND, language=settings.OCR_LANGUAGE
+                )
+                _tesseract_probe = (True, f'{version} ({_ocr_backend.name})')
+            except Exception as e:
+                print(f"⚠️ Warning: Tesseract not found. OCR will be disabled. Error: {e}")
+                _tesseract_probe = (False, str(e))
+        return _tesseract_probe
+
+
+class _Truncation:
+    """Pages a parse left out, and why"""
+    
+    def __init__(self):
+        self.reasons = []
+        self.skipped_pages = set()
+    
+    def skip(self, reason, page_indexes):
+        """Record 0-based pages left out for a reason"""
+        page_indexes = list(page_indexes)
+        if not page_indexes:
+            return
+        if reason not in self.reasons:
+            self.reasons.append(reason)
+        self.skipped_pages.update(page_indexes)
+    
+    def report(self):
+        """
+        Returns:
+            dict or None: reasons and 1-based skipped_pages, None if nothing was left out
+        """
+        if not self.reasons:
+            return None
+        
+        report = {
+            'reasons': list(self.reasons),
+            'skipped_pages': sorted(page_index + 1 for page_index in self.skipped_pages),
+        }
+        print(f"⏱️ Parse truncated ({', '.join(report['reasons'])}): "
+              f"pages {report['skipped_pages']} left out")
+        return report
 
 
 class PDFParser:
     """Parse PDF files and extract text content with OCR fallback"""
     
-    def __init__(self):
+    def __init__(self, ocr_workers=None, max_pages=None, max_render_pixels=None,
+                 time_budget=None):
+        """
+        Args:
+            ocr_workers: Pages OCR'd concurrently (default: settings.OCR_MAX_WORKERS)
+            max_pages: Pages read per PDF (default: settings.PDF_MAX_PAGES; 0 = all)
+            max_render_pixels: Largest page rendering for OCR (default:
+                               settings.PDF_MAX_RENDER_PIXELS; 0 = no limit)
+            time_budget: Seconds a PDF may take to extract (default:
+                         settings.PDF_PARSE_DEADLINE; 0 = no deadline)
+        """
         self.supported_formats = ['.pdf']
-        self.ocr_enabled = True
+        self.ocr_workers = max(1, ocr_workers or settings.OCR_MAX_WORKERS)
+        self.max_pages = settings.PDF_MAX_PAGES if max_pages is None else max_pages
+        self.max_render_pixels = (
+            settings.PDF_MAX_RENDER_PIXELS if max_render_pixels is None else max_render_pixels
+        )
+        self.time_budget = settings.PDF_PARSE_DEADLINE if time_budget is None else time_budget
         
-        # Try to detect tesseract installation
-        try:
-            pytesseract.get_tesseract_version()
-        except Exception as e:
-            print(f"⚠️ Warning: Tesseract not found. OCR will be disabled. Error: {e}")
-            self.ocr_enabled = False
+        # Shared by all requests so total OCR concurrency stays bounded
+        self._ocr_executor = None
+        self._ocr_executor_lock = threading.Lock()
+        
+        # Estimated OCR cost, refined from recognized pages, and the
+        # estimated seconds of OCR submitted to the pool and not yet done
+        self._ocr_seconds_per_megapixel = settings.OCR_SECONDS_PER_MEGAPIXEL
+        self._ocr_backlog = 0.0
+        self._ocr_cost_lock = threading.Lock()
+        
+        # Tesseract is probed on first use, not at construction
+        self._ocr_enabled = None
+    
+    @property
+    def ocr_enabled(self):
+        """Whether OCR is available (probes Tesseract on first access)"""
+        if self._ocr_enabled is None:
+            self._ocr_enabled = probe_tesseract()[0]
+        return self._ocr_enabled
+    
+    @ocr_enabled.setter
+    def ocr_enabled(self, enabled):
+        self._ocr_enabled = enabled
+    
+    def open(self, source):
+        """
+        Open a PDF once for all parsing steps of a request
+        
+        Args:
+            source: PDF bytes or path to a PDF file
+            
+        Returns:
+            PDFDocument: Open document (use as a context manager)
+            
+        Raises:
+            Exception: If the source cannot be opened as a PDF
+        """
+        return PDFDocument(source)
+    
+    @contextmanager
+    def _document(self, pdf):
+        """
+        Use an already open PDFDocument, or open raw bytes for one call
+        
+        Args:
+            pdf: PDFDocument or binary content of PDF file
+            
+        Yields:
+            PDFDocument: Open document, closed afterwards only if opened here
+        """
+        if isinstance(pdf, PDFDocument):
+            yield pdf
+        else:
+            with self.open(pdf) as document:
+                yield document
+    
+    def start_deadline(self, deadline=None):
+        """
+        Deadline of a parse starting now
+        
+        Args:
+            deadline: Deadline already set by the caller (returned as is)
+            
+        Returns:
+            float or None: time.monotonic() value, None without a time budget
+        """
+        if deadline is None and self.time_budget > 0:
+            return time.monotonic() + self.time_budget
+        return deadline
+    
+    @staticmethod
+    def _time_left(deadline):
+        """Seconds until the deadline (never negative), or None without one"""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+    
+    def _page_count(self, document, truncation):
+        """Pages to read within max_pages, recording the ones left out"""
+        page_count = document.page_count
+        if self.max_pages > 0 and page_count > self.max_pages:
+            truncation.skip(TRUNCATED_MAX_PAGES, range(self.max_pages, page_count))
+            return self.max_pages
+        return page_count
+    
+    def _render_dpi(self, document, page_index):
+        """
+        Resolution to render a page at for OCR within max_render_pixels
+        
+        Returns:
+            int or None: DPI (lowered for oversized pages), or None if the
+                         page embeds an image larger than the limit
+        """
+        dpi = settings.OCR_DPI
+        if self.max_render_pixels <= 0:
+            return dpi
+        
+        # Decoding an oversized embedded image is the decompression bomb case
+        if document.largest_image_pixels(page_index) > self.max_render_pixels:
+            return None
+        
+        width, height = document.page_size(page_index)
+        pixels = (width * dpi / 72) * (height * dpi / 72)
+        if pixels > self.max_render_pixels:
+            dpi = max(1, int(dpi * math.sqrt(self.max_render_pixels / pixels)))
+        return dpi
+    
+    def _ocr_fits(self, estimate, deadline):
+        """
+        Whether a page estimated to take this many OCR seconds can finish
+        before the deadline, behind the work already queued on the pool
+        """
+        time_left = self._time_left(deadline)
+        if time_left is None:
+            return True
+        with self._ocr_cost_lock:
+            backlog = self._ocr_backlog
+        return (backlog + estimate) / self.ocr_workers <= time_left
     
-    def extract_text_with_ocr(self, pdf_bytes):
+    def _add_ocr_backlog(self, seconds):
+        """Account estimated OCR seconds submitted to (or done by) the pool"""
+        with self._ocr_cost_lock:
+            self._ocr_backlog = max(0.0, self._ocr_backlog + seconds)
+    
+    def _record_ocr_cost(self, megapixels, seconds):
+        """Refine the OCR cost estimate with a recognized page"""
+        if megapixels <= 0:
+            return
+        with self._ocr_cost_lock:
+            self._ocr_seconds_per_megapixel += 0.2 * (
+                seconds / megapixels - self._ocr_seconds_per_megapixel
+            )
+    
+    def _get_ocr_executor(self):
+        """Create the OCR thread pool on first use"""
+        with self._ocr_executor_lock:
+            if self._ocr_executor is None:
+                self._ocr_executor = ThreadPoolExecutor(
+                    max_workers=self.ocr_workers,
+                    thread_name_prefix='ocr'
+                )
+            return self._ocr_executor
+    
+    def _ocr_page(self, page, deadline=None):
+        """
+        Run Tesseract on one rendered page
+        
+        Args:
+            page: Rendered page dict (raw samples, see parsers.ocr_engine)
+            deadline: time.monotonic() value after which OCR is not started
+            
+        Returns:
+            str: Recognized text
+            
+        Raises:
+            TimeoutError: If the deadline passed while the page was queued
+                          or before OCR finished
+        """
+        if _ocr_backend is None:
+            probe_tesseract()
+        
+        timeout = self._time_left(deadline)
+        if timeout == 0:
+            raise TimeoutError('Parse deadline passed before OCR started')
+        
+        start = time.monotonic()
+        with time_stage('ocr_page'):
+            text = _ocr_backend.recognize(page, timeout=timeout)
+        self._record_ocr_cost(
+            page['width'] * page['height'] / 1e6, time.monotonic() - start
+        )
+        return text
+    
+    def _ocr_pages(self, document, page_indexes, truncation, deadline=None):
+        """
+        OCR selected pages of an open document
+        
+        Pages are rendered one after another (PyMuPDF documents are not
+        thread-safe) and OCR'd concurrently on the shared OCR pool. The
+        raw samples of each rendering go straight to the OCR backend.
+        
+        A page is only rendered and submitted if its estimated OCR time
+        (rendered megapixels times the learned cost) fits in the time left
+        behind the work already on the pool, so a request never fills the
+        pool with pages it cannot wait for. Backends stop recognizing at
+        the deadline (tesserocr via its timeout, pytesseract by killing
+        the process), and pages not recognized by then are given up on,
+        so the caller can return what it has.
+        
+        Args:
+            document: Open PDFDocument
+            page_indexes: 0-based indexes of the pages to OCR
+            truncation: _Truncation collecting the pages left out
+            deadline: time.monotonic() value to stop at, or None
+            
+        Returns:
+            dict: Page index -> OCR text for every page that was recognized
+        """
+        executor = self._get_ocr_executor()
+        futures = []
+        
+        page_indexes = list(page_indexes)
+        for position, page_index in enumerate(page_indexes):
+            if self._time_left(deadline) == 0:
+                truncation.skip(TRUNCATED_DEADLINE, page_indexes[position:])
+                break
+            
+            dpi = self._render_dpi(document, page_index)
+            if dpi is None:
+                print(f"  ⚠️ Page {page_index + 1} embeds an image over "
+                      f"{self.max_render_pixels} pixels, not rendering it")
+                truncation.skip(TRUNCATED_MAX_PIXELS, [page_index])
+                continue
+            
+            width, height = document.page_size(page_index)
+            estimate = (width * dpi / 72) * (height * dpi / 72) / 1e6 * (
+                self._ocr_seconds_per_megapixel
+            )
+            if not self._ocr_fits(estimate, deadline):
+                print(f"  ⏱️ Page {page_index + 1} would not finish OCR before the deadline")
+                truncation.skip(TRUNCATED_DEADLINE, [page_index])
+                continue
+            
+            print(f"  📄 Rendering page {page_index + 1}/{document.page_count} for OCR...")
+            
+            with time_stage('render_page'):
+                pix = document.render_page(
+                    page_index, dpi=dpi, colorspace=settings.OCR_COLORSPACE
+                )
+                # A view of the pixmap's own buffer; the page holds the
+                # pixmap so the buffer outlives this loop until OCR is done
+                page = {
+                    'samples': pix.samples_mv,
+                    'width': pix.width,
+                    'height': pix.height,
+                    'channels': pix.n,
+                    'stride': pix.stride,
+                    'dpi': dpi,
+                    'pixmap': pix,
+                }
+                pix = None
+            
+            # Perform OCR in the background while the next page renders
+            self._add_ocr_backlog(estimate)
+            future = executor.submit(self._ocr_page, page, deadline)
+            future.add_done_callback(lambda _, estimate=estimate: self._add_ocr_backlog(-estimate))
+            futures.append((page_index, future))
+            OCR_PAGES.inc()
+        
+        page_texts = {}
+        for page_index, future in futures:
+            try:
+                page_texts[page_index] = future.result(timeout=self._time_left(deadline))
+            except FutureTimeoutError:
+                future.cancel()
+                truncation.skip(TRUNCATED_DEADLINE, [page_index])
+            except Exception as e:
+                if self._time_left(deadline) == 0:
+                    truncation.skip(TRUNCATED_DEADLINE, [page_index])
+                else:
+                    print(f"❌ OCR failed on page {page_index + 1}: {str(e)}")
+        
+        return page_texts
+    
+    def extract_text_with_ocr(self, pdf):
         """
-        Extract text from image-based PDF using OCR
+        Extract text from image-based PDF using OCR on every page
         
         Args:
-            pdf_bytes: Binary content of PDF file
+            pdf: PDFDocument or binary content of PDF file
             
         Returns:
             str: Extracted text using OCR
@@ -37,35 +389,19 @@ class PDFParser:
             return ""
         
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text = ""
+            deadline = self.start_deadline()
+            truncation = _Truncation()
             
-            print("🔍 Using OCR to extract text from image-based PDF...")
+            with self._document(pdf) as document:
+                print(f"🔍 Using OCR to extract text from image-based PDF ({self.ocr_workers} workers)...")
+                page_indexes = range(self._page_count(document, truncation))
+                page_texts = self._ocr_pages(document, page_indexes, truncation, deadline)
             
-            for page_num, page in enumerate(doc, start=1):
-                print(f"  📄 Processing page {page_num}/{len(doc)} with OCR...")
-                
-                # Render page to image (higher resolution for better OCR)
-                mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better quality
-                pix = page.get_pixmap(matrix=mat)
-                
-                # Convert to PIL Image
-                img_data = pix.tobytes("png")
-                image = Image.open(io.BytesIO(img_data))
-                
-                # Perform OCR
-                page_text = pytesseract.image_to_string(image, lang='eng')
-                text += page_text
-                
-                # Add page separator
-                if page_num < len(doc):
-                    text += "\n\n--- Page Break ---\n\n"
-                
-                # Close image resources
-                image.close()
-                pix = None
-            
-            doc.close()
+            # Reassemble in page order with page separators
+            text = PAGE_SEPARATOR.join(
+                page_texts.get(page_index, "") for page_index in page_indexes
+            )
+            truncation.report()
             print("✅ OCR extraction completed")
             
             return text.strip()
@@ -74,91 +410,145 @@ class PDFParser:
             print(f"❌ OCR extraction failed: {str(e)}")
             return ""
     
-    def extract_text(self, pdf_bytes):
+    def extract_text_details(self, pdf, deadline=None):
         """
-        Extract text from PDF bytes with automatic OCR fallback
+        Extract text page by page, OCR'ing only pages without usable text
+        
+        Pages whose embedded text layer has fewer than
+        settings.OCR_MIN_PAGE_CHARS characters are OCR'd; every other page
+        keeps its embedded text. This handles hybrid documents (text pages
+        plus scanned certificates) without OCR'ing the whole file.
+        
+        Only the first max_pages pages are read, pages are rendered within
+        max_render_pixels, and when the deadline passes the parser stops
+        and returns the text it has, including page text already extracted
+        by earlier steps; the pages left out are reported in 'truncation'.
         
         Args:
-            pdf_bytes: Binary content of PDF file
+            pdf: PDFDocument or binary content of PDF file
+            deadline: time.monotonic() value to stop at (default: now +
+                      time_budget; see start_deadline)
             
         Returns:
-            str: Extracted text from all pages
+            dict: {
+                'text': str, extracted text from all pages,
+                'page_count': int,
+                'ocr_pages': list of 1-based page numbers that were OCR'd,
+                'ocr_texts': list of the OCR text of those pages,
+                'truncation': None, or dict of reasons ('max_pages',
+                              'max_pixels', 'deadline') and 1-based
+                              skipped_pages
+            }
             
         Raises:
             Exception: If PDF extraction fails
         """
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            text = ""
+            deadline = self.start_deadline(deadline)
+            truncation = _Truncation()
             
-            # Extract text from all pages
-            for page_num, page in enumerate(doc, start=1):
-                page_text = page.get_text()
-                text += page_text
+            with self._document(pdf) as document:
+                page_count = document.page_count
                 
-                # Optional: Add page separator
-                if page_num < len(doc):
-                    text += "\n\n--- Page Break ---\n\n"
-            
-            doc.close()
-            
-            # Check if we got sufficient text
-            if len(text.strip()) < 10:
-                print("⚠️ Insufficient text extracted, falling back to OCR...")
-                text = self.extract_text_with_ocr(pdf_bytes)
+                # Extract embedded text from the pages within the limits; past
+                # the deadline only text extracted earlier (e.g. during
+                # validation) is kept, and the other pages are skipped (None)
+                pages_to_read = self._page_count(document, truncation)
+                page_texts = []
+                for page_index in range(pages_to_read):
+                    if self._time_left(deadline) == 0:
+                        page_text = document.cached_page_text(page_index)
+                        if page_text is None:
+                            truncation.skip(TRUNCATED_DEADLINE, [page_index])
+                    else:
+                        page_text = document.page_text(page_index)
+                    page_texts.append(page_text)
+                
+                # Pages with insufficient text fall back to OCR
+                scanned_pages = [
+                    page_index for page_index, page_text in enumerate(page_texts)
+                    if page_text is not None
+                    and len(page_text.strip()) < settings.OCR_MIN_PAGE_CHARS
+                ]
+                
+                ocr_pages = []
+                ocr_page_texts = []
+                if scanned_pages and self.ocr_enabled:
+                    print(f"⚠️ Insufficient text on {len(scanned_pages)}/{page_count} pages, "
+                          f"falling back to OCR for those pages...")
+                    OCR_FALLBACK_DOCUMENTS.inc()
+                    ocr_texts = self._ocr_pages(document, scanned_pages, truncation, deadline)
+                    for page_index, ocr_text in sorted(ocr_texts.items()):
+                        if ocr_text.strip():
+                            page_texts[page_index] = ocr_text
+                            ocr_pages.append(page_index + 1)
+                            ocr_page_texts.append(ocr_text)
             
-            return text.strip()
+            return {
+                'text': PAGE_SEPARATOR.join(
+                    page_text for page_text in page_texts if page_text is not None
+                ).strip(),
+                'page_count': page_count,
+                'ocr_pages': ocr_pages,
+                'ocr_texts': ocr_page_texts,
+                'truncation': truncation.report(),
+            }
             
         except Exception as e:
             raise Exception(f"PDF extraction failed: {str(e)}")
     
-    def get_metadata(self, pdf_bytes):
+    def extract_text(self, pdf):
+        """
+        Extract text from PDF bytes with automatic per-page OCR fallback
+        
+        Args:
+            pdf: PDFDocument or binary content of PDF file
+            
+        Returns:
+            str: Extracted text from all pages
+            
+        Raises:
+            Exception: If PDF extraction fails
+        """
+        return self.extract_text_details(pdf)['text']
+    
+    def get_metadata(self, pdf):
         """
         Extract PDF metadata
         
         Args:
-            pdf_bytes: Binary content of PDF file
+            pdf: PDFDocument or binary content of PDF file
             
         Returns:
             dict: Metadata information
         """
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            metadata = {
-                'page_count': len(doc),
-                'author': doc.metadata.get('author', ''),
-                'title': doc.metadata.get('title', ''),
-                'subject': doc.metadata.get('subject', ''),
-                'keywords': doc.metadata.get('keywords', ''),
-            }
-            doc.close()
-            return metadata
+            with self._document(pdf) as document:
+                return document.metadata()
             
         except Exception as e:
             return {'error': str(e)}
     
-    def validate_pdf(self, pdf_bytes):
+    def validate_pdf(self, pdf):
         """
         Validate if file is a valid PDF
         
         Args:
-            pdf_bytes: Binary content to validate
+            pdf: PDFDocument or binary content to validate
             
         Returns:
             tuple: (is_valid: bool, message: str)
         """
-        if not pdf_bytes or len(pdf_bytes) == 0:
+        if not isinstance(pdf, PDFDocument) and not pdf:
             return False, "Empty file"
         
         try:
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            
-            if len(doc) == 0:
-                return False, "PDF has no pages"
-            
-            # Try to extract text from first page
-            first_page_text = doc[0].get_text()
-            doc.close()
+            with self._document(pdf) as document:
+                if document.page_count == 0:
+                    return False, "PDF has no pages"
+                
+                # Try to extract text from first page (cached for extraction)
+                first_page_text = document.page_text(0)
             
             # If we have text, it's a valid text-based PDF
             if len(first_page_text.strip()) >= 10:
@@ -0,0 +1,26 @@
+"""
+Pipeline Module
+Orchestrates parsing and extraction for single and batch requests
+"""
+
+from .resume_pipeline import (
+    RESUME_FIELDS, InvalidPDFError, build_resume_data, parse_resume_pdf,
+    parse_resume_cached, is_cacheable
+)
+from .batch import BatchParser
+from .uploads import (
+    SpooledUpload, UploadRequest, UploadTooLargeError, upload_bytes, upload_source
+)
+from .responses import FieldSelection, compress_response, configure_json
+from .skill_stream import extract_skills_document, stream_skill_extraction
+from .warmup import Readiness, warm_up
+
+__all__ = [
+    'RESUME_FIELDS', 'InvalidPDFError', 'build_resume_data', 'parse_resume_pdf',
+    'parse_resume_cached', 'is_cacheable',
+    'BatchParser',
+    'SpooledUpload', 'UploadRequest', 'UploadTooLargeError', 'upload_bytes', 'upload_source',
+    'FieldSelection', 'compress_response', 'configure_json',
+    'extract_skills_document', 'stream_skill_extraction',
+    'Readiness', 'warm_up'
+]
@@ -0,0 +1,131 @@
+"""
+Batch Parsing Module
+Fans resume parsing out over a bounded pool of worker processes
+"""
+
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from monitoring import drain_worker_metrics, merge_worker_metrics
+from .resume_pipeline import InvalidPDFError, parse_resume_pdf
+
+
+# Per-process parser and extractor, built once by the pool initializer
+_worker_parser = None
+_worker_extractor = None
+
+
+def _init_worker():
+    """Build the parser and extractor inside a freshly started worker"""
+    global _worker_parser, _worker_extractor
+
+    from parsers import PDFParser
+    from extractors import InformationExtractor
+
+    _worker_parser = PDFParser()
+    _worker_extractor = InformationExtractor()
+    _worker_extractor.skill_registry.ensure_watching()
+
+
+def _parse_in_worker(pdf):
+    """
+    Pool task: parse one PDF (bytes or file path) with the worker's own parser
+
+    Returns:
+        tuple: (parsed data, metrics snapshot of the worker)
+    """
+    data = parse_resume_pdf(pdf, _worker_parser, _worker_extractor)
+    return data, drain_worker_metrics()
+
+
+class BatchParser:
+    """Parse many resumes in parallel across CPU cores"""
+
+    def __init__(self, max_workers, start_method='spawn'):
+        """
+        Args:
+            max_workers: Maximum number of worker processes
+            start_method: multiprocessing start method for the workers
+        """
+        self.max_workers = max(1, max_workers)
+        self.start_method = start_method
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        """Create the process pool on first use"""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker,
+                )
+            return self._executor
+
+    def _reset_executor(self, broken_executor):
+        """Drop a pool whose worker died so the next batch starts a new one"""
+        with self._lock:
+            if self._executor is broken_executor:
+                self._executor = None
+        broken_executor.shutdown(wait=False, cancel_futures=True)
+
+    def parse_many(self, documents):
+        """
+        Parse a batch of PDFs in parallel
+
+        Args:
+            documents: List of (filename, pdf) tuples; pdf is the binary
+                       content or the path of a spooled upload, which
+                       workers open directly instead of receiving a copy
+
+        Returns:
+            list: One result per document, in input order:
+                  {'filename', 'success', 'data'} or {'filename', 'success', 'error'}
+        """
+        executor = self._get_executor()
+        futures = [
+            (filename, executor.submit(_parse_in_worker, pdf))
+            for filename, pdf in documents
+        ]
+
+        results = []
+        for filename, future in futures:
+            try:
+                data, metrics = future.result()
+                merge_worker_metrics(metrics)
+                results.append({
+                    'filename': filename,
+                    'success': True,
+                    'data': data,
+                })
+            except InvalidPDFError as e:
+                results.append({
+                    'filename': filename,
+                    'success': False,
+                    'error': f'PDF validation failed: {str(e)}',
+                })
+            except BrokenProcessPool:
+                self._reset_executor(executor)
+                results.append({
+                    'filename': filename,
+                    'success': False,
+                    'error': 'Worker process crashed while parsing this file',
+                })
+            except Exception as e:
+                results.append({
+                    'filename': filename,
+                    'success': False,
+                    'error': f'Failed to parse resume: {str(e)}',
+                })
+
+        return results
+
+    def shutdown(self):
+        """Stop the worker processes"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
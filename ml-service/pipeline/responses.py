@@ -0,0 +1,178 @@
+"""
+Responses Module
+Field projection, fast JSON encoding and compression of API responses
+"""
+
+import gzip
+
+from flask.json.provider import DefaultJSONProvider
+
+from config import settings
+from .resume_pipeline import RESUME_FIELDS
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard json module
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional: gzip is used when zstd is unavailable
+    zstandard = None
+
+
+# Resume fields holding the extracted text bodies
+TEXT_FIELDS = ('raw_text', 'full_text')
+
+_TRUE_VALUES = ('1', 'true', 'yes')
+
+
+class FieldSelection:
+    """Which resume fields a caller asked for"""
+
+    def __init__(self, fields=None, include_text=True):
+        """
+        Args:
+            fields: Field names to return (None returns every field)
+            include_text: Whether raw_text/full_text are returned
+        """
+        self.fields = fields
+        self.include_text = include_text
+
+    @classmethod
+    def from_args(cls, args):
+        """
+        Read the selection from request query parameters
+
+        Args:
+            args: request.args (fields=a,b,c and include_text=true/false)
+
+        Returns:
+            FieldSelection: Requested selection
+
+        Raises:
+            ValueError: If an unknown field is requested
+        """
+        fields = args.get('fields')
+        if fields is not None:
+            fields = [name.strip() for name in fields.split(',') if name.strip()]
+            unknown = [name for name in fields if name not in RESUME_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+        include_text = args.get('include_text', 'true').lower() in _TRUE_VALUES
+        return cls(fields, include_text)
+
+    @property
+    def is_full(self):
+        """True when the full resume payload is requested"""
+        return self.fields is None and self.include_text
+
+    def apply(self, data):
+        """
+        Project resume data onto the selected fields
+
+        Args:
+            data: Resume data (see build_resume_data)
+
+        Returns:
+            dict: Selected fields (data itself when nothing is filtered)
+        """
+        if self.is_full:
+            return data
+
+        names = data.keys() if self.fields is None else self.fields
+
+        if not self.include_text:
+            names = [name for name in names if name not in TEXT_FIELDS]
+
+        return {name: data[name] for name in names if name in data}
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson (compact, unsorted output)"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj, default=self.default, option=orjson.OPT_NON_STR_KEYS
+        ).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+
+
+def configure_json(app):
+    """
+    Use orjson for JSON responses when it is installed
+
+    Args:
+        app: Flask application
+
+    Returns:
+        str: Name of the JSON encoder in use
+    """
+    if orjson is None:
+        app.json.compact = True
+        app.json.sort_keys = False
+        return 'json'
+
+    app.json = ORJSONProvider(app)
+    return 'orjson'
+
+
+def _choose_encoding(accept_encodings):
+    """Pick zstd or gzip from the client's Accept-Encoding preferences"""
+    zstd_quality = accept_encodings.quality('zstd') if zstandard is not None else 0
+    gzip_quality = accept_encodings.quality('gzip')
+
+    if zstd_quality and zstd_quality >= gzip_quality:
+        return 'zstd'
+    if gzip_quality:
+        return 'gzip'
+    return None
+
+
+def compress_response(response, accept_encodings):
+    """
+    Compress a JSON response with the best encoding the client accepts
+
+    Args:
+        response: Flask response
+        accept_encodings: request.accept_encodings
+
+    Returns:
+        Response: The same response, compressed in place when worthwhile
+    """
+    if (not settings.RESPONSE_COMPRESSION_ENABLED
+            or response.direct_passthrough
+            or response.is_streamed
+            or response.status_code < 200
+            or response.status_code in (204, 304)
+            or 'Content-Encoding' in response.headers
+            or response.mimetype != 'application/json'):
+        return response
+
+    response.vary.add('Accept-Encoding')
+
+    body = response.get_data()
+    if len(body) < settings.RESPONSE_COMPRESSION_MIN_BYTES:
+        return response
+
+    encoding = _choose_encoding(accept_encodings)
+    if encoding == 'zstd':
+        body = zstandard.ZstdCompressor(level=settings.RESPONSE_ZSTD_LEVEL).compress(body)
+    elif encoding == 'gzip':
+        body = gzip.compress(body, compresslevel=settings.RESPONSE_GZIP_LEVEL)
+    else:
+        return response
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    return response
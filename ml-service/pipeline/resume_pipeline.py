@@ -0,0 +1,188 @@
+"""
+Resume Pipeline Module
+Runs the full PDF -> text -> structured information pipeline for one resume
+"""
+
+from monitoring import time_stage
+
+
+class InvalidPDFError(Exception):
+    """Raised when an uploaded file fails PDF validation"""
+
+
+# Top-level fields of the resume data returned by /parse-resume
+RESUME_FIELDS = (
+    'raw_text', 'full_text', 'text_length', 'word_count', 'ocr_pages',
+    'truncated', 'truncation',
+    'name', 'email', 'phone', 'location',
+    'skills', 'skill_categories', 'fuzzy_skills', 'total_skills',
+    'education',
+    'experience', 'years_of_experience',
+    'certifications',
+    'urls',
+    'skills_version',
+)
+
+
+def build_resume_data(full_text, extracted_info, ocr_pages=None, truncation=None):
+    """
+    Assemble the response payload for a parsed resume
+
+    Args:
+        full_text: Text extracted from the PDF
+        extracted_info: Output of InformationExtractor.extract_all
+        ocr_pages: 1-based page numbers whose text came from OCR
+        truncation: Pages the parser left out and why (None if complete)
+
+    Returns:
+        dict: Resume data as returned by /parse-resume
+    """
+    return {
+        'raw_text': full_text[:2000],  # First 2000 chars for preview
+        'full_text': full_text,  # Complete text
+        'text_length': len(full_text),
+        'word_count': len(full_text.split()),
+        'ocr_pages': ocr_pages or [],
+        'truncated': truncation is not None,
+        'truncation': truncation,
+
+        # Personal Information
+        'name': extracted_info['name'],
+        'email': extracted_info['email'],
+        'phone': extracted_info['phone'],
+        'location': extracted_info['location'],
+
+        # Skills
+        'skills': extracted_info['skills'],
+        'skill_categories': extracted_info['skill_categories'],
+        'fuzzy_skills': extracted_info['fuzzy_skills'],
+        'total_skills': len(extracted_info['skills']),
+
+        # Education
+        'education': extracted_info['education'],
+
+        # Experience
+        'experience': extracted_info['experience'],
+        'years_of_experience': extracted_info['years_of_experience'],
+
+        # Certifications
+        'certifications': extracted_info['certifications'],
+
+        # URLs/Links
+        'urls': extracted_info['urls'],
+        
+        # Skills vocabulary the resume was matched against
+        'skills_version': extracted_info['skills_version'],
+    }
+
+
+def parse_resume_pdf(pdf, pdf_parser, info_extractor):
+    """
+    Validate a PDF, extract its text and structured information
+
+    Args:
+        pdf: Binary content of PDF file, or path to a (spooled) PDF file
+        pdf_parser: PDFParser instance
+        info_extractor: InformationExtractor instance
+
+    Returns:
+        dict: Resume data (see build_resume_data)
+
+    Raises:
+        InvalidPDFError: If the file is not a usable PDF
+        Exception: If text extraction fails
+    """
+    # The parse deadline covers opening and validation too
+    deadline = pdf_parser.start_deadline()
+
+    # Open the PDF once; validation, extraction and OCR share the handle
+    print("🔍 Validating PDF...")
+    if not pdf or (not isinstance(pdf, str) and len(pdf) == 0):
+        print("❌ PDF validation failed: Empty file")
+        raise InvalidPDFError("Empty file")
+
+    try:
+        with time_stage('pdf_open'):
+            document = pdf_parser.open(pdf)
+    except Exception as e:
+        print(f"❌ PDF validation failed: {str(e)}")
+        raise InvalidPDFError(f"Invalid PDF: {str(e)}")
+
+    with document:
+        with time_stage('validate_pdf'):
+            is_valid, validation_message = pdf_parser.validate_pdf(document)
+        if not is_valid:
+            print(f"❌ PDF validation failed: {validation_message}")
+            raise InvalidPDFError(validation_message)
+
+        print("✅ PDF validation passed")
+
+        # Extract text from PDF
+        print("📝 Extracting text from PDF...")
+        with time_stage('text_extraction'):
+            extraction = pdf_parser.extract_text_details(document, deadline=deadline)
+
+    full_text = extraction['text']
+    print(f"📄 Extracted text length: {len(full_text)} characters "
+          f"(OCR pages: {extraction['ocr_pages'] or 'none'})")
+
+    # Extract structured information
+    extracted_info = info_extractor.extract_all(full_text, extraction['ocr_texts'])
+
+    return build_resume_data(
+        full_text, extracted_info, extraction['ocr_pages'], extraction['truncation']
+    )
+
+
+def is_cacheable(resume_data, skills_version):
+    """
+    Whether a parse result may be stored under a cache key
+
+    Args:
+        resume_data: Output of parse_resume_pdf
+        skills_version: Skills version the cache key was built for
+
+    Returns:
+        bool: False if a skills reload happened during the parse, or the
+              parse ran out of time (a retry under less load may finish)
+    """
+    truncation = resume_data.get('truncation') or {}
+    return (resume_data['skills_version'] == skills_version
+            and 'deadline' not in truncation.get('reasons', ()))
+
+
+def parse_resume_cached(pdf, pdf_parser, info_extractor, parse_cache, digest=None):
+    """
+    Parse a resume, serving byte-identical repeats from the parse cache
+
+    The active skills version is part of the cache key, so results cached
+    before a skills reload are not served afterwards.
+
+    Args:
+        pdf: Binary content of PDF file, or path to a (spooled) PDF file
+        pdf_parser: PDFParser instance
+        info_extractor: InformationExtractor instance
+        parse_cache: ParseCache instance, or None to always parse
+        digest: SHA-256 hex digest of the content (required when pdf is a path)
+
+    Returns:
+        tuple: (resume data: dict, cache hit: bool)
+    """
+    if parse_cache is None:
+        return parse_resume_pdf(pdf, pdf_parser, info_extractor), False
+
+    skills_version = info_extractor.skills_version
+    if digest is None:
+        cache_key = parse_cache.make_key(pdf, skills_version)
+    else:
+        cache_key = parse_cache.key_for_digest(digest, skills_version)
+    response_data = parse_cache.get(cache_key)
+    if response_data is not None:
+        print("⚡ Parse cache hit")
+        return response_data, True
+
+    response_data = parse_resume_pdf(pdf, pdf_parser, info_extractor)
+
+    if is_cacheable(response_data, skills_version):
+        parse_cache.put(cache_key, response_data)
+    return response_data, False
@@ -0,0 +1,150 @@
+"""
+Skill Stream Module
+Chunked skill extraction over NDJSON request and response streams
+"""
+
+import io
+import json
+
+
+# Read-ahead for request bodies; WSGI input streams are unbuffered, and
+# readline() on them would otherwise pull one byte per call. Kept small
+# because a read blocks until the buffer fills, delaying the first chunk.
+READ_BUFFER_BYTES = 64 * 1024
+
+
+def _read_lines(stream, max_line_bytes):
+    """
+    Read raw lines from a binary stream without buffering the whole body
+
+    Yields:
+        tuple: (line number, line bytes, or None if it exceeded max_line_bytes)
+    """
+    if isinstance(stream, io.RawIOBase):
+        stream = io.BufferedReader(stream, READ_BUFFER_BYTES)
+
+    number = 0
+    while True:
+        line = stream.readline(max_line_bytes + 1)
+        if not line:
+            return
+        number += 1
+
+        if len(line) > max_line_bytes and not line.endswith(b'\n'):
+            # Drop the rest of the oversized line, one bounded read at a time
+            while line and not line.endswith(b'\n'):
+                line = stream.readline(max_line_bytes + 1)
+            yield number, None
+        else:
+            yield number, line
+
+
+def extract_skills_document(info_extractor, text, fuzzy=False, vocabulary=None):
+    """
+    Skills of one text, as returned by /extract-skills
+
+    Args:
+        info_extractor: InformationExtractor instance
+        text: Document text
+        fuzzy: Also match OCR-style misspellings
+        vocabulary: SkillVocabulary to use (default: the active one)
+
+    Returns:
+        dict: skills, count, categories (and fuzzy_skills when fuzzy)
+    """
+    vocabulary = vocabulary or info_extractor.vocabulary
+    skills = info_extractor.extract_skills(text, vocabulary)
+    result = {'skills': skills, 'count': len(skills)}
+
+    if fuzzy:
+        fuzzy_skills = info_extractor.extract_fuzzy_skills(
+            text, exclude=skills, vocabulary=vocabulary
+        )
+        skills = sorted(set(skills) | set(fuzzy_skills))
+        result.update({'skills': skills, 'fuzzy_skills': fuzzy_skills, 'count': len(skills)})
+
+    result['categories'] = info_extractor.extract_skill_categories(text, skills, vocabulary)
+    return result
+
+
+def stream_skill_extraction(stream, info_extractor, chunk_size=256, max_line_bytes=1024 * 1024,
+                            fuzzy=False, loads=json.loads, dumps=json.dumps):
+    """
+    Extract skills from an NDJSON stream, yielding NDJSON results per chunk
+
+    Each input line is {"text": ..., "id": ..., "fuzzy": ...} (id and fuzzy
+    optional) or a bare JSON string. Each output line carries the input's
+    line number and id with the /extract-skills fields, or an error for a
+    line that could not be read. Lines are read, extracted and written one
+    chunk at a time, so neither body is ever held in full, and the whole
+    stream uses the skills vocabulary active when it started.
+
+    Args:
+        stream: Binary request body stream
+        info_extractor: InformationExtractor instance
+        chunk_size: Documents per chunk
+        max_line_bytes: Longest accepted line
+        fuzzy: Default for documents without a fuzzy field
+        loads: JSON decoder (bytes or str -> object)
+        dumps: JSON encoder (object -> str)
+
+    Yields:
+        bytes: Result lines of one chunk
+    """
+    vocabulary = info_extractor.vocabulary
+    options = (info_extractor, vocabulary, fuzzy, loads, dumps, max_line_bytes)
+    chunk = []
+
+    try:
+        for number, line in _read_lines(stream, max_line_bytes):
+            if line is not None and not line.strip():
+                continue
+            chunk.append((number, line))
+            if len(chunk) >= chunk_size:
+                yield _extract_chunk(chunk, *options)
+                chunk = []
+    except Exception as e:
+        # The response is already under way, so a broken request body
+        # ends the stream with an error line instead of a status code
+        if chunk:
+            yield _extract_chunk(chunk, *options)
+        yield (dumps({'error': f'Failed to read request body: {str(e)}'}) + '\n').encode('utf-8')
+        return
+
+    if chunk:
+        yield _extract_chunk(chunk, *options)
+
+
+def _extract_chunk(chunk, info_extractor, vocabulary, fuzzy, loads, dumps, max_line_bytes):
+    """Encoded result lines of one chunk of (line number, line) pairs"""
+    output = [
+        dumps(_extract_line(info_extractor, vocabulary, number, line, fuzzy, loads, max_line_bytes))
+        for number, line in chunk
+    ]
+    return ('\n'.join(output) + '\n').encode('utf-8')
+
+
+def _extract_line(info_extractor, vocabulary, number, line, fuzzy, loads, max_line_bytes):
+    """Result record of one NDJSON input line"""
+    if line is None:
+        return {'line': number, 'error': f'Line exceeds {max_line_bytes} bytes'}
+
+    try:
+        document = loads(line)
+    except ValueError:
+        return {'line': number, 'error': 'Invalid JSON'}
+
+    if isinstance(document, str):
+        document = {'text': document}
+    if not isinstance(document, dict) or not isinstance(document.get('text'), str):
+        return {'line': number, 'error': 'No text provided'}
+
+    result = {'line': number}
+    if 'id' in document:
+        result['id'] = document['id']
+
+    result.update(extract_skills_document(
+        info_extractor, document['text'],
+        fuzzy=bool(document.get('fuzzy', fuzzy)), vocabulary=vocabulary
+    ))
+    return result
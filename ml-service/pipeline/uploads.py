@@ -0,0 +1,186 @@
+"""
+Uploads Module
+Streams uploaded files to memory or a temp file with a hard size limit
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+
+from flask import Request
+from werkzeug.exceptions import RequestEntityTooLarge
+
+from config import settings
+
+
+class UploadTooLargeError(RequestEntityTooLarge):
+    """Raised while streaming an upload that exceeds the size limit"""
+
+
+class SpooledUpload(io.RawIOBase):
+    """
+    Writable/readable upload container used as the multipart file stream
+
+    Data is kept in memory until it passes spool_bytes, then moved to a
+    named temp file so PyMuPDF can open it by path instead of from one big
+    bytes object. The SHA-256 of the content is computed while streaming,
+    and writing past max_bytes aborts the upload immediately.
+    """
+
+    def __init__(self, max_bytes, spool_bytes, temp_dir=None):
+        """
+        Args:
+            max_bytes: Largest accepted upload
+            spool_bytes: Size above which the upload moves to a temp file
+            temp_dir: Directory for temp files (system default if None)
+        """
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.spool_bytes = spool_bytes
+        self.temp_dir = temp_dir
+
+        self.size = 0
+        self.path = None
+        self._file = io.BytesIO()
+        self._sha256 = hashlib.sha256()
+
+    # ---- io interface used by the multipart parser and FileStorage ----
+
+    def readable(self):
+        return True
+
+    def writable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def write(self, data):
+        self.size += len(data)
+        if self.size > self.max_bytes:
+            self.close()
+            raise UploadTooLargeError(
+                f'Upload exceeds the maximum size of {self.max_bytes} bytes'
+            )
+
+        self._sha256.update(data)
+
+        if self.path is None and self.size > self.spool_bytes:
+            self._rollover()
+
+        return self._file.write(data)
+
+    def _rollover(self):
+        """Move the in-memory content to a named temp file"""
+        handle = tempfile.NamedTemporaryFile(
+            prefix='upload-', suffix='.pdf', dir=self.temp_dir, delete=False
+        )
+        handle.write(self._file.getbuffer())
+        self._file = handle
+        self.path = handle.name
+
+    def read(self, size=-1):
+        return self._file.read(size)
+
+    def readinto(self, buffer):
+        return self._file.readinto(buffer)
+
+    def readline(self, size=-1):
+        return self._file.readline(size)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        return self._file.seek(offset, whence)
+
+    def tell(self):
+        return self._file.tell()
+
+    def flush(self):
+        if not self._file.closed:
+            self._file.flush()
+
+    def close(self):
+        """Release the buffer and delete the temp file"""
+        if self.closed:
+            return
+        self._file.close()
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        super().close()
+
+    # ---- pipeline helpers ----
+
+    @property
+    def digest(self):
+        """SHA-256 hex digest of the content"""
+        return self._sha256.hexdigest()
+
+    @property
+    def source(self):
+        """
+        Content in the form PDFParser.open accepts
+
+        Returns:
+            str or bytes: Temp file path for spooled uploads, bytes otherwise
+        """
+        if self.path is not None:
+            self._file.flush()
+            return self.path
+        return self._file.getvalue()
+
+    def read_bytes(self):
+        """Read the whole content (for consumers that need a copy)"""
+        if self.path is None:
+            return self._file.getvalue()
+        self._file.flush()
+        with open(self.path, 'rb') as handle:
+            return handle.read()
+
+
+class UploadRequest(Request):
+    """Flask request that streams file uploads into SpooledUpload containers"""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None,
+                         content_length=None):
+        return SpooledUpload(
+            max_bytes=settings.UPLOAD_MAX_BYTES,
+            spool_bytes=settings.UPLOAD_SPOOL_BYTES,
+            temp_dir=settings.UPLOAD_TEMP_DIR
+        )
+
+
+def upload_source(file_storage):
+    """
+    Get the parseable content of an uploaded file
+
+    Args:
+        file_storage: werkzeug FileStorage from request.files
+
+    Returns:
+        tuple: (source: path or bytes, size: int, digest: str or None)
+    """
+    stream = file_storage.stream
+    if isinstance(stream, SpooledUpload):
+        return stream.source, stream.size, stream.digest
+
+    pdf_bytes = file_storage.read()
+    return pdf_bytes, len(pdf_bytes), None
+
+
+def upload_bytes(file_storage):
+    """
+    Read the whole content of an uploaded file
+
+    Args:
+        file_storage: werkzeug FileStorage from request.files
+
+    Returns:
+        bytes: File content
+    """
+    stream = file_storage.stream
+    if isinstance(stream, SpooledUpload):
+        return stream.read_bytes()
+    return file_storage.read()
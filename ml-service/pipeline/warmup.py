@@ -0,0 +1,168 @@
+"""
+Warmup Module
+Exercises the parse pipeline once so serving processes start hot, and
+tracks when that has happened for readiness checks
+"""
+
+import os
+import threading
+import time
+
+from .resume_pipeline import parse_resume_pdf
+
+
+WARMUP_TEXT = """Jane Doe
+jane.doe@example.com | +91 9876543210 | Pune, Maharashtra
+linkedin.com/in/janedoe github.com/janedoe
+
+Experience
+Software Engineer at Example Technologies Ltd
+Jan 2019 - Present
+Built services with Python, Django, React, Docker and AWS.
+3 years of experience
+
+Education
+B.Tech in Computer Science
+Example Institute Of Technology
+2014 - 2018
+
+Certifications
+AWS Certified Developer
+
+Skills
+Python, JavaScript, SQL, Git, Kubernetes
+"""
+
+
+def build_warmup_pdf(text=WARMUP_TEXT):
+    """
+    Render a one-page text PDF in memory
+
+    Args:
+        text: Text to place on the page
+
+    Returns:
+        bytes: PDF content
+    """
+    import fitz
+
+    document = fitz.open()
+    try:
+        page = document.new_page()
+        page.insert_text((72, 72), text, fontsize=10)
+        return document.tobytes()
+    finally:
+        document.close()
+
+
+def warm_up(pdf_parser, info_extractor):
+    """
+    Run a synthetic resume through the full pipeline
+
+    Loads PyMuPDF, probes Tesseract (loading the OCR modules), and runs
+    every compiled extractor pattern and the skill matcher once, so the
+    first real request in each worker does not pay for it.
+
+    Args:
+        pdf_parser: PDFParser instance
+        info_extractor: InformationExtractor instance
+
+    Returns:
+        float: Warmup duration in seconds
+    """
+    start = time.perf_counter()
+
+    info_extractor.extract_all(WARMUP_TEXT)
+    parse_resume_pdf(build_warmup_pdf(), pdf_parser, info_extractor)
+    ocr = 'available' if pdf_parser.ocr_enabled else 'unavailable'
+
+    elapsed = time.perf_counter() - start
+    print(f"🔥 Warmed up parse pipeline in {elapsed * 1000:.0f} ms (OCR {ocr}, pid {os.getpid()})")
+    return elapsed
+
+
+class Readiness:
+    """
+    Background warm-up of one serving process, and whether it has finished
+
+    The server starts answering (liveness) as soon as the app is imported;
+    a background thread loads the job index from the job store and runs
+    the warm-up, and the process reports ready once both are done, so load
+    balancers only send traffic to warm workers with every stored posting
+    searchable. A failed step is reported but still counts as done:
+    requests then pay the cold-start costs themselves instead of the
+    worker never taking load.
+    """
+
+    def __init__(self, enabled=True):
+        """
+        Args:
+            enabled: Run the pipeline warm-up (when False only the job
+                     index is loaded before the process is ready)
+        """
+        self.enabled = enabled
+        self.ready = False
+        self.seconds = None
+        self.error = None
+
+        self._started_pid = None
+        self._lock = threading.Lock()
+
+    def ensure_started(self, pdf_parser, info_extractor, job_index_sync=None):
+        """
+        Start the warm-up once per process (threads don't survive fork)
+
+        Args:
+            pdf_parser: PDFParser instance
+            info_extractor: InformationExtractor instance
+            job_index_sync: JobIndexSync whose index is loaded first, or None
+        """
+        if self.ready or self._started_pid == os.getpid():
+            return
+
+        with self._lock:
+            if self.ready or self._started_pid == os.getpid():
+                return
+
+            threading.Thread(
+                target=self._run, args=(pdf_parser, info_extractor, job_index_sync),
+                name='warmup', daemon=True
+            ).start()
+            self._started_pid = os.getpid()
+
+    def _run(self, pdf_parser, info_extractor, job_index_sync):
+        """Warm-up thread"""
+        errors = []
+
+        if job_index_sync is not None:
+            try:
+                job_index_sync.sync(force=True)
+                print(f"🗂️ Loaded {len(job_index_sync.job_index)} job postings (pid {os.getpid()})")
+            except Exception as e:
+                errors.append(f'Job index: {str(e)}')
+                print(f"❌ Loading job postings failed: {str(e)}")
+
+        if self.enabled:
+            try:
+                self.seconds = warm_up(pdf_parser, info_extractor)
+            except Exception as e:
+                errors.append(str(e))
+                print(f"❌ Warmup failed: {str(e)}")
+
+        self.error = '; '.join(errors) or None
+        self.ready = True
+
+    def status(self):
+        """
+        Readiness report
+
+        Returns:
+            dict: ready, warmup_seconds and error (if the warm-up failed)
+        """
+        status = {
+            'ready': self.ready,
+            'warmup_seconds': round(self.seconds, 3) if self.seconds is not None else None,
+        }
+        if self.error:
+            status['error'] = self.error
+        return status
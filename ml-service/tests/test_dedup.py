@@ -0,0 +1,66 @@
+"""
+Tests for content hashes, SimHash fingerprints and listing keys
+"""
+
+from matching.dedup import (
+    content_hash, fingerprint_text, hamming_distance, listing_key, simhash, simhash_bands
+)
+
+
+DESCRIPTION = (
+    'We are hiring a backend engineer to build Python services with PostgreSQL '
+    'and Kafka for our payments platform, owning APIs from design to production.'
+)
+
+
+def posting(**fields):
+    base = {
+        'id': 'job-1', 'title': 'Backend Engineer', 'company': 'Acme',
+        'location': 'Pune', 'description': DESCRIPTION,
+    }
+    base.update(fields)
+    return base
+
+
+def test_content_hash_ignores_formatting():
+    reformatted = posting(
+        title='  BACKEND engineer ', description=DESCRIPTION.replace(', ', ' , ').upper()
+    )
+    assert content_hash(reformatted) == content_hash(posting())
+
+
+def test_content_hash_includes_location():
+    assert content_hash(posting(location='Delhi')) != content_hash(posting())
+
+
+def test_simhash_is_close_for_small_edits():
+    first = simhash(fingerprint_text(posting()))
+    second = simhash(fingerprint_text(posting(description=DESCRIPTION + ' Remote friendly.')))
+    assert hamming_distance(first, second) <= 10
+
+
+def test_simhash_covers_title_and_company():
+    assert simhash(fingerprint_text(posting(company='Globex'))) != simhash(
+        fingerprint_text(posting())
+    )
+
+
+def test_simhash_of_empty_text_is_zero():
+    assert simhash('') == 0
+
+
+def test_simhash_fits_sqlite_integer_and_splits_into_bands():
+    fingerprint = simhash(fingerprint_text(posting()))
+    assert -(1 << 63) <= fingerprint < 1 << 63
+
+    bands = simhash_bands(fingerprint)
+    assert len(bands) == 4
+    assert sum(band << (16 * position) for position, band in enumerate(bands)) == (
+        fingerprint & ((1 << 64) - 1)
+    )
+
+
+def test_listing_key_normalizes_title_company_and_location():
+    assert listing_key(posting(title='backend  ENGINEER!')) == listing_key(posting())
+    assert listing_key(posting(location='Delhi')) != listing_key(posting())
+    assert listing_key({}) == ('', '', '')
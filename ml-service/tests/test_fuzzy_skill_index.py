@@ -0,0 +1,49 @@
+"""
+Tests for OCR-tolerant skill lookup
+"""
+
+import pytest
+
+from extractors.fuzzy_skill_index import FuzzySkillIndex, ocr_distance
+
+
+SURFACES = {
+    'python': 'python', 'docker': 'docker', 'windows': 'windows', 'flutter': 'flutter',
+    'postman': 'postman', 'solidity': 'solidity', 'kubernetes': 'kubernetes',
+    'javascript': 'javascript', 'spring boot': 'spring boot', 'go': 'go',
+}
+
+
+@pytest.fixture(scope='module')
+def index():
+    return FuzzySkillIndex(SURFACES)
+
+
+@pytest.mark.parametrize('token, skill', [
+    ('pyth0n', 'python'),
+    ('d0cker', 'docker'),
+    ('kubemetes', 'kubernetes'),
+    ('kubernets', 'kubernetes'),
+    ('javascrlpt', 'javascript'),
+    ('spr1ng boot', 'spring boot'),
+])
+def test_ocr_misreads_match(index, token, skill):
+    assert index.lookup(token)[0] == skill
+
+
+@pytest.mark.parametrize('token', ['window', 'clutter', 'postmen', 'solidify', 'g0', 'pythons'])
+def test_ordinary_words_do_not_match(index, token):
+    assert index.lookup(token) is None
+
+
+def test_find_counts_hits(index):
+    hits = index.find('Pyth0n developer; pyth0n and D0cker on Kubemetes, Windows laptop')
+    assert hits['python']['count'] == 2
+    assert hits['kubernetes']['matched'] == 'kubemetes'
+    assert set(hits) == {'python', 'docker', 'kubernetes', 'windows'}
+
+
+def test_ocr_distance_discounts_confusions():
+    assert ocr_distance('pyth0n', 'python') == 0.5
+    assert ocr_distance('kubemetes', 'kubernetes') == 0.5
+    assert ocr_distance('clutter', 'flutter') == 1.0
@@ -0,0 +1,43 @@
+"""
+Tests for contact, education and location extraction priorities
+"""
+
+import pytest
+
+from extractors import InformationExtractor
+
+
+@pytest.fixture(scope='module')
+def extractor():
+    return InformationExtractor()
+
+
+@pytest.mark.parametrize('text, phone', [
+    # The international format also matches these spans; the Indian ones win
+    ('Call +1 9876543210', '9876543210'),
+    ('Phone: +91 9876543210', '+91 9876543210'),
+    ('+44 123 456 7890 or 9876543210', '9876543210'),
+    # Priority holds across the text, not just at the same position
+    ('(555) 123-4567 / 555-123-4567', '(555) 123-4567'),
+    ('Office 555-123-4567, mobile (555) 123-4567', '(555) 123-4567'),
+    ('+44 123 456 7890', '123 456 7890'),
+    ('no number here', None),
+])
+def test_phone_formats_keep_priority_order(extractor, text, phone):
+    assert extractor.extract_phone(text) == phone
+
+
+def test_degrees_open_entries_in_list_order(extractor):
+    text = 'Education\nMBA and B.Tech in Computer Science, 2016\n'
+    degrees = [entry['degree'] for entry in extractor.extract_education(text)]
+    # Every degree on the line opens an entry in DEGREE_FORMATS order,
+    # whatever their order on the line
+    assert degrees == ['B.Tech', 'MBA']
+
+
+def test_location_is_the_leftmost_city(extractor):
+    # Documented change from the per-city loop, which returned Mumbai
+    # (earlier in the city list) for this text
+    assert extractor.extract_location('Based in Pune; previously Mumbai') == 'Pune'
+    assert extractor.extract_location('Bengaluru, Karnataka') == 'Bengaluru, Karnataka'
+    assert extractor.extract_location('remote') is None
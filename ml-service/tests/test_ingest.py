@@ -0,0 +1,160 @@
+"""
+Tests for NDJSON feed ingestion: record building, invalid lines and resuming
+"""
+
+import io
+import json
+
+import pytest
+
+from matching.ingest import JobIngestor, build_record, prepare_lines
+from matching.job_store import COMPLETED, FAILED, JobStore
+
+
+class FakeExtractor:
+    """Extractor stand-in that finds the listed skills by substring"""
+
+    SKILLS = ('python', 'kafka', 'docker', 'react')
+
+    def extract_skill_hits(self, text):
+        text = text.lower()
+        return {
+            skill: {'count': text.count(skill)} for skill in self.SKILLS if skill in text
+        }
+
+
+class Interrupted(Exception):
+    pass
+
+
+class FlakyStream(io.BytesIO):
+    """Feed that fails after a number of lines, like a dropped connection"""
+
+    def __init__(self, data, fail_after):
+        super().__init__(data)
+        self.remaining = fail_after
+
+    def readline(self, *args):
+        if self.remaining == 0:
+            raise Interrupted('connection reset')
+        self.remaining -= 1
+        return super().readline(*args)
+
+
+class UnseekableStream(io.BytesIO):
+    def seekable(self):
+        return False
+
+
+def feed(count):
+    lines = [
+        json.dumps({
+            'id': f'job-{n}', 'title': f'Engineer {n}', 'company': f'Company {n}',
+            'location': 'Pune',
+            'description': f'Posting {n}: python and kafka services, opening number {n} '
+                           f'of {count} with its own unique team charter {n * 7919}.',
+        })
+        for n in range(count)
+    ]
+    return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / 'jobs.db'))
+
+
+@pytest.fixture(autouse=True)
+def fake_extractor(monkeypatch):
+    import extractors
+    monkeypatch.setattr(extractors, 'InformationExtractor', FakeExtractor)
+
+
+def test_build_record():
+    record = build_record(
+        {'id': 7, 'title': 'Dev', 'description': 'Python and Docker'}, FakeExtractor()
+    )
+    assert record['id'] == '7'
+    assert record['metadata'] == {'id': 7, 'title': 'Dev'}
+    assert record['skills'] == {'python': 1, 'docker': 1}
+    assert record['text'] == 'Dev\nPython and Docker'
+
+
+@pytest.mark.parametrize('posting', [
+    {'description': 'no id'},
+    {'id': '', 'description': 'empty id'},
+    {'id': 'job-1'},
+    {'id': 'job\n1', 'description': 'newline in id'},
+    {'id': 'job\r1', 'description': 'carriage return in id'},
+    ['not', 'a', 'dict'],
+])
+def test_build_record_rejects_invalid_postings(posting):
+    with pytest.raises(ValueError):
+        build_record(posting, FakeExtractor())
+
+
+def test_prepare_lines_reports_invalid_lines():
+    lines = [
+        (1, b'{"id": "a", "description": "python"}\n'),
+        (2, b'\n'),
+        (3, b'{not json}\n'),
+        (4, json.dumps({'id': 'b\nc', 'description': 'x'}).encode('utf-8') + b'\n'),
+    ]
+    records, vectors, invalid = prepare_lines(lines, FakeExtractor())
+    assert [record['id'] for record in records] == ['a']
+    assert vectors is None
+    assert [message.split(':')[0] for message in invalid] == ['line 3', 'line 4']
+
+
+def test_run_ingests_feed(store):
+    run = JobIngestor(store, batch_size=4).run(io.BytesIO(feed(10)), 'feed')
+    assert run['status'] == COMPLETED
+    assert run['lines'] == 10
+    assert run['stats']['inserted'] == 10
+    assert store.count() == 10
+
+
+def test_completed_feed_is_not_ingested_again(store):
+    ingestor = JobIngestor(store, batch_size=4)
+    ingestor.run(io.BytesIO(feed(6)), 'feed')
+    run = ingestor.run(io.BytesIO(feed(6)), 'feed')
+    assert run['status'] == COMPLETED
+    assert run['stats'].get('unchanged', 0) == 0
+
+
+@pytest.mark.parametrize('stream_type', [io.BytesIO, UnseekableStream])
+def test_interrupted_run_resumes_after_last_batch(store, stream_type):
+    data = feed(10)
+    ingestor = JobIngestor(store, batch_size=3)
+
+    with pytest.raises(Interrupted):
+        ingestor.run(FlakyStream(data, fail_after=7), 'feed')
+
+    run = store.get_run('feed')
+    assert run['status'] == FAILED
+    assert run['lines'] == 6
+    assert run['offset'] == sum(len(line) for line in data.splitlines(True)[:6])
+    assert store.count() == 6
+
+    run = ingestor.run(stream_type(data), 'feed')
+    assert run['status'] == COMPLETED
+    assert run['lines'] == 10
+    assert run['stats']['inserted'] == 10
+    assert run['stats'].get('unchanged', 0) == 0
+    assert store.count() == 10
+
+
+def test_restart_reads_feed_again(store):
+    ingestor = JobIngestor(store, batch_size=4)
+    ingestor.run(io.BytesIO(feed(5)), 'feed')
+    run = ingestor.run(io.BytesIO(feed(5)), 'feed', restart=True)
+    assert run['status'] == COMPLETED
+    assert run['stats']['unchanged'] == 5
+
+
+def test_invalid_lines_are_counted(store):
+    data = feed(3) + b'{"id": "x"}\n' + b'garbage\n'
+    run = JobIngestor(store).run(io.BytesIO(data), 'feed')
+    assert run['stats']['inserted'] == 3
+    assert run['stats']['invalid'] == 2
+    assert len(run['stats']['errors']) == 2
@@ -0,0 +1,73 @@
+"""
+Tests for the parse job queue leases and the worker loop
+"""
+
+import threading
+
+import pytest
+
+from jobs.job_queue import FAILED, RUNNING, SUCCEEDED, JobQueue
+from jobs.worker import JobWorkerPool
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / 'jobs.db'), lease_seconds=0, max_attempts=3)
+
+
+def test_complete_records_result(queue):
+    job_id = queue.submit('cv.pdf', b'%PDF')
+    claimed_id, filename, payload, lease = queue.claim()
+    assert (claimed_id, filename, payload) == (job_id, 'cv.pdf', b'%PDF')
+
+    assert queue.complete(job_id, {'name': 'A'}, lease) is True
+    job = queue.get(job_id)
+    assert job['status'] == SUCCEEDED
+    assert job['result'] == {'name': 'A'}
+
+
+def test_expired_lease_cannot_overwrite_new_claim(queue):
+    job_id = queue.submit('cv.pdf', b'%PDF')
+    first_lease = queue.claim()[3]
+    second_lease = queue.claim()[3]
+    assert second_lease != first_lease
+
+    assert queue.fail(job_id, 'too slow', first_lease) is False
+    assert queue.get(job_id)['status'] == RUNNING
+
+    assert queue.complete(job_id, {}, second_lease) is True
+    assert queue.complete(job_id, {}, second_lease) is False
+    assert queue.get(job_id)['status'] == SUCCEEDED
+
+
+def test_finished_job_is_not_finished_again(queue):
+    job_id = queue.submit('cv.pdf', b'%PDF')
+    queue.claim()
+    assert queue.fail(job_id, 'broken') is True
+    assert queue.complete(job_id, {}) is False
+    assert queue.get(job_id)['status'] == FAILED
+
+
+def test_worker_survives_queue_errors():
+    class FlakyQueue:
+        def __init__(self):
+            self.claims = 0
+            self.recovered = threading.Event()
+
+        def purge_finished(self, older_than_seconds):
+            return 0
+
+        def claim(self):
+            self.claims += 1
+            if self.claims <= 2:
+                raise RuntimeError('database is locked')
+            self.recovered.set()
+            return None
+
+    flaky = FlakyQueue()
+    pool = JobWorkerPool(flaky, handler=None, workers=1, poll_interval=0.01, max_backoff=0.05)
+    pool.ensure_started()
+    try:
+        assert flaky.recovered.wait(2)
+    finally:
+        pool.stop(timeout=2)
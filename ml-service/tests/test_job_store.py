@@ -0,0 +1,167 @@
+"""
+Tests for the job store: upserts, duplicate detection, tombstones and sync
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from matching.dedup import content_hash, fingerprint_text, simhash, simhash_bands
+from matching.job_index import JobIndex
+from matching.job_store import COMPLETED, JobIndexSync, JobStore
+
+
+DESCRIPTION = (
+    'We are hiring a backend engineer to build Python services with PostgreSQL '
+    'and Kafka for our payments platform, owning APIs from design to production '
+    'and mentoring a small team of engineers across two time zones.'
+)
+
+
+def record(job_id='job-1', skills=None, **fields):
+    posting = {
+        'id': job_id, 'title': 'Backend Engineer', 'company': 'Acme',
+        'location': 'Pune', 'description': DESCRIPTION,
+    }
+    posting.update(fields)
+    return {
+        'id': job_id,
+        'metadata': {key: value for key, value in posting.items() if key != 'description'},
+        'skills': skills if skills is not None else {'python': 1, 'kafka': 1},
+        'content_hash': content_hash(posting),
+        'simhash': simhash(fingerprint_text(posting)),
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return JobStore(str(tmp_path / 'jobs.db'))
+
+
+def test_insert_then_update(store):
+    assert store.write_batch([record()])['inserted'] == 1
+    assert store.write_batch([record(url='https://example.com/1')])['updated'] == 1
+    assert store.count() == 1
+
+
+def test_resent_posting_is_unchanged(store):
+    store.write_batch([record()], near_duplicate_distance=3)
+    counts = store.write_batch([record()], near_duplicate_distance=3)
+    assert counts['unchanged'] == 1
+    assert counts['updated'] == 0
+
+
+def test_resent_posting_with_new_metadata_is_updated(store):
+    job_index = JobIndex()
+    sync = JobIndexSync(store, job_index)
+    store.write_batch([record()], near_duplicate_distance=3)
+
+    counts = store.write_batch([record(salary='20 LPA')], near_duplicate_distance=3)
+    assert counts['updated'] == 1
+
+    sync.sync(force=True)
+    assert job_index.get('job-1')['salary'] == '20 LPA'
+
+
+def test_exact_duplicate_under_another_id(store):
+    store.write_batch([record()], near_duplicate_distance=3)
+    counts = store.write_batch([record('job-2')], near_duplicate_distance=3)
+    assert counts['duplicate'] == 1
+    assert store.count() == 1
+
+
+def test_near_duplicate_needs_same_listing(store):
+    store.write_batch([record()], near_duplicate_distance=3)
+
+    edited = record('job-2', description=DESCRIPTION + ' Apply soon.')
+    assert store.write_batch([edited], near_duplicate_distance=3)['near_duplicate'] == 1
+
+    other_city = record('job-3', location='Delhi')
+    assert store.write_batch([other_city], near_duplicate_distance=3)['inserted'] == 1
+
+    other_company = record('job-4', company='Globex', description=DESCRIPTION + ' Apply soon.')
+    assert store.write_batch([other_company], near_duplicate_distance=3)['inserted'] == 1
+
+
+def test_resent_posting_with_reordered_metadata_is_unchanged(store):
+    store.write_batch([record()], near_duplicate_distance=3)
+    resent = record()
+    resent['metadata'] = dict(reversed(list(resent['metadata'].items())))
+    assert store.write_batch([resent], near_duplicate_distance=3)['unchanged'] == 1
+
+
+def test_listing_key_is_added_to_an_existing_store(tmp_path):
+    path = str(tmp_path / 'jobs.db')
+    old = record()
+    with sqlite3.connect(path) as db:
+        db.execute(
+            'CREATE TABLE job_postings (id TEXT PRIMARY KEY, seq INTEGER NOT NULL,'
+            ' deleted INTEGER NOT NULL DEFAULT 0, metadata TEXT, skills TEXT,'
+            ' content_hash TEXT, simhash INTEGER, band0 INTEGER, band1 INTEGER,'
+            ' band2 INTEGER, band3 INTEGER, updated_at REAL NOT NULL)'
+        )
+        db.execute(
+            'INSERT INTO job_postings VALUES (?, 1, 0, ?, ?, ?, ?, ?, ?, ?, ?, 0)',
+            (old['id'], json.dumps(old['metadata']), json.dumps(old['skills']),
+             old['content_hash'], old['simhash'], *simhash_bands(old['simhash']))
+        )
+
+    store = JobStore(path)
+    edited = record('job-2', description=DESCRIPTION + ' Apply soon.')
+    assert store.write_batch([edited], near_duplicate_distance=3)['near_duplicate'] == 1
+
+    # Reopening does not migrate again
+    assert JobStore(path).count() == 1
+
+
+def test_dedup_disabled_stores_everything(store):
+    counts = store.write_batch([record(), record('job-2')])
+    assert counts['inserted'] == 2
+
+
+def test_remove_tombstones_and_syncs(store):
+    job_index = JobIndex()
+    sync = JobIndexSync(store, job_index)
+    store.write_batch([record(), record('job-2', location='Delhi')])
+    sync.sync(force=True)
+    assert len(job_index) == 2
+
+    assert store.remove('job-1') is True
+    assert store.remove('job-1') is False
+    sync.sync(force=True)
+    assert len(job_index) == 1
+    assert store.count() == 1
+
+
+def test_apply_changes_pages_through_rows(store):
+    store.write_batch([record(f'job-{n}', location=f'City {n}') for n in range(7)])
+    job_index = JobIndex()
+    assert store.apply_changes(job_index, page_size=3) == 7
+    assert len(job_index) == 7
+
+
+def test_failed_batch_rolls_back(store):
+    def fail(accepted):
+        raise RuntimeError('vector store unavailable')
+
+    with pytest.raises(RuntimeError):
+        store.write_batch([record()], before_commit=fail)
+    assert store.count() == 0
+
+
+def test_checkpoint_is_written_with_the_batch(store):
+    store.start_run('feed')
+    store.write_batch(
+        [record()],
+        checkpoint={'source': 'feed', 'offset': 120, 'lines': 3, 'stats': {'inserted': 2}}
+    )
+    run = store.get_run('feed')
+    assert (run['offset'], run['lines'], run['stats']['inserted']) == (120, 3, 3)
+
+
+def test_completed_run_is_not_restarted(store):
+    store.start_run('feed')
+    store.finish_run('feed', COMPLETED, {'inserted': 1})
+    assert store.start_run('feed')['status'] == COMPLETED
+    assert store.start_run('feed', restart=True)['lines'] == 0
@@ -0,0 +1,48 @@
+"""
+Tests for metrics recorded in pool workers and merged into the parent
+"""
+
+import io
+
+from matching.ingest import JobIngestor
+from matching.job_store import JobStore
+from monitoring import STAGE_SECONDS, MetricsRegistry
+from tests.test_ingest import feed
+
+
+def test_drained_snapshot_merges_into_another_registry():
+    worker, parent = MetricsRegistry(), MetricsRegistry()
+    for registry in (worker, parent):
+        registry.histogram('stage_seconds', 'Stages', labelnames=('stage',))
+        registry.counter('pages_total', 'Pages')
+
+    worker.histogram('stage_seconds', 'Stages').observe(0.002, stage='ocr')
+    worker.histogram('stage_seconds', 'Stages').observe(3.0, stage='ocr')
+    worker.counter('pages_total', 'Pages').inc(2)
+    parent.counter('pages_total', 'Pages').inc()
+
+    snapshot = worker.drain()
+    parent.merge(snapshot)
+    parent.merge(worker.drain())
+
+    assert worker.counter('pages_total', 'Pages').value() == 0
+    assert parent.counter('pages_total', 'Pages').value() == 3
+    rendered = parent.render()
+    assert 'stage_seconds_count{stage="ocr"} 2' in rendered
+    assert 'stage_seconds_bucket{stage="ocr",le="0.0025"} 1' in rendered
+    assert 'stage_seconds_sum{stage="ocr"} 3.002' in rendered
+
+
+def test_ingest_worker_stages_reach_the_parent(tmp_path):
+    def skill_hit_calls():
+        series = STAGE_SECONDS.drain()
+        STAGE_SECONDS.merge(series)
+        data = series.get(('extract_skill_hits',))
+        return data['count'] if data else 0
+
+    before = skill_hit_calls()
+    store = JobStore(str(tmp_path / 'jobs.db'))
+    run = JobIngestor(store, workers=2, batch_size=4).run(io.BytesIO(feed(10)), 'feed')
+
+    assert run['lines'] == 10
+    assert skill_hit_calls() - before == 10
@@ -0,0 +1,104 @@
+"""
+Tests for OCR under the parse deadline with slow pages
+"""
+
+import threading
+import time
+
+import fitz
+import pytest
+
+from parsers import pdf_parser as pdf_parser_module
+from parsers import PDFParser
+
+
+class SlowBackend:
+    """OCR backend that takes a fixed time per page and honours its timeout"""
+
+    name = 'slow'
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+        self.running = 0
+        self.lock = threading.Lock()
+
+    def recognize(self, page, timeout=None):
+        with self.lock:
+            self.running += 1
+        try:
+            if timeout is not None and timeout < self.seconds:
+                time.sleep(timeout)
+                raise TimeoutError('OCR timed out')
+            time.sleep(self.seconds)
+            return 'Recognized page with Python and Docker experience'
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+def scanned_pdf(pages):
+    document = fitz.open()
+    for _ in range(pages):
+        document.new_page()
+    try:
+        return document.tobytes()
+    finally:
+        document.close()
+
+
+def use_backend(monkeypatch, backend):
+    monkeypatch.setattr(pdf_parser_module, '_ocr_backend', backend)
+    monkeypatch.setattr(pdf_parser_module, '_tesseract_probe', (True, backend.name))
+
+
+def make_parser(seconds_per_page, time_budget):
+    parser = PDFParser(ocr_workers=1, max_pages=0, max_render_pixels=0, time_budget=time_budget)
+    parser.ocr_enabled = True
+    # A blank A4 page renders at about 2 megapixels at the default DPI
+    parser._ocr_seconds_per_megapixel = seconds_per_page / 2.0
+    return parser
+
+
+def test_pages_that_cannot_fit_are_not_submitted(monkeypatch):
+    backend = SlowBackend(0.3)
+    use_backend(monkeypatch, backend)
+    parser = make_parser(0.3, time_budget=1.0)
+
+    start = time.monotonic()
+    details = parser.extract_text_details(scanned_pdf(8))
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 1.5
+    assert len(details['ocr_pages']) >= 2
+    assert details['truncation']['reasons'] == ['deadline']
+    assert 8 in details['truncation']['skipped_pages']
+
+    # Skipped pages never reached the pool, so it drains right away
+    time.sleep(0.35)
+    assert backend.running == 0
+    assert parser._ocr_backlog == pytest.approx(0.0, abs=1e-6)
+
+
+def test_slow_page_releases_the_pool_at_the_deadline(monkeypatch):
+    backend = SlowBackend(5.0)
+    use_backend(monkeypatch, backend)
+    # The estimate is far too low, so the page is submitted and must be cut off
+    parser = make_parser(0.01, time_budget=0.5)
+
+    start = time.monotonic()
+    details = parser.extract_text_details(scanned_pdf(1))
+    assert time.monotonic() - start < 1.5
+    assert details['truncation'] == {'reasons': ['deadline'], 'skipped_pages': [1]}
+
+    follow_up = parser._get_ocr_executor().submit(lambda: 'free')
+    assert follow_up.result(timeout=1.0) == 'free'
+
+
+def test_cost_estimate_learns_from_recognized_pages(monkeypatch):
+    use_backend(monkeypatch, SlowBackend(0.05))
+    parser = make_parser(1.0, time_budget=0)
+
+    details = parser.extract_text_details(scanned_pdf(3))
+    assert details['ocr_pages'] == [1, 2, 3]
+    assert details['truncation'] is None
+    assert parser._ocr_seconds_per_megapixel < 0.5
@@ -0,0 +1,136 @@
+"""
+Tests for the OCR backends' handling of raw page samples
+"""
+
+import sys
+import threading
+import types
+
+import fitz
+import pytest
+
+from parsers.ocr_engine import PytesseractBackend, TesserocrBackend
+
+
+class FakeEngine:
+    """Stand-in for tesserocr.PyTessBaseAPI"""
+
+    instances = []
+
+    def __init__(self, lang='eng', bytes_only=False, recognize_ok=True):
+        self.bytes_only = bytes_only
+        self.recognize_ok = recognize_ok
+        self.ended = False
+        self.images = []
+        self.timeouts = []
+        FakeEngine.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.End()
+
+    def End(self):
+        self.ended = True
+
+    def SetImageBytes(self, samples, width, height, channels, stride):
+        if self.bytes_only and not isinstance(samples, bytes):
+            raise TypeError('expected bytes')
+        self.images.append(samples)
+
+    def SetSourceResolution(self, dpi):
+        pass
+
+    def Recognize(self, timeout=0):
+        self.timeouts.append(timeout)
+        return self.recognize_ok
+
+    def GetUTF8Text(self):
+        return 'text'
+
+    def Clear(self):
+        pass
+
+
+@pytest.fixture
+def fake_tesserocr(monkeypatch):
+    FakeEngine.instances = []
+    module = types.SimpleNamespace(
+        PyTessBaseAPI=FakeEngine, tesseract_version=lambda: 'tesseract 5.3.0\n leptonica'
+    )
+    monkeypatch.setitem(sys.modules, 'tesserocr', module)
+    return module
+
+
+def rendered_page():
+    document = fitz.open()
+    document.new_page(width=100, height=50)
+    pix = document[0].get_pixmap(dpi=72, colorspace=fitz.csGRAY, alpha=False)
+    document.close()
+    return {
+        'samples': pix.samples_mv, 'width': pix.width, 'height': pix.height,
+        'channels': pix.n, 'stride': pix.stride, 'dpi': 72, 'pixmap': pix,
+    }
+
+
+def test_version_probe_releases_its_engine(fake_tesserocr):
+    backend = TesserocrBackend()
+    assert backend.version() == 'tesseract 5.3.0'
+    assert [engine.ended for engine in FakeEngine.instances] == [True]
+
+
+def test_samples_are_passed_without_a_copy(fake_tesserocr):
+    backend = TesserocrBackend()
+    page = rendered_page()
+    assert backend.recognize(page, timeout=2.5) == 'text'
+
+    engine = FakeEngine.instances[-1]
+    assert engine.images[0] is page['samples']
+    assert engine.timeouts == [2500]
+
+
+def test_bytes_only_engine_gets_a_copy(fake_tesserocr, monkeypatch):
+    monkeypatch.setattr(
+        fake_tesserocr, 'PyTessBaseAPI', lambda lang: FakeEngine(lang, bytes_only=True)
+    )
+    backend = TesserocrBackend()
+    page = rendered_page()
+    backend.recognize(page)
+    backend.recognize(page)
+
+    engine = FakeEngine.instances[-1]
+    assert [type(samples) for samples in engine.images] == [bytes, bytes]
+    assert engine.timeouts == [0, 0]
+
+
+def test_recognize_timeout_raises(fake_tesserocr, monkeypatch):
+    monkeypatch.setattr(
+        fake_tesserocr, 'PyTessBaseAPI', lambda lang: FakeEngine(lang, recognize_ok=False)
+    )
+    with pytest.raises(TimeoutError):
+        TesserocrBackend().recognize(rendered_page(), timeout=0.2)
+
+
+def test_engines_are_per_thread(fake_tesserocr):
+    backend = TesserocrBackend()
+    page = rendered_page()
+    backend.recognize(page)
+    thread = threading.Thread(target=backend.recognize, args=(page,))
+    thread.start()
+    thread.join()
+    assert len(FakeEngine.instances) == 2
+
+
+def test_pytesseract_reads_the_buffer(monkeypatch):
+    backend = PytesseractBackend()
+    seen = {}
+
+    def image_to_string(image, lang, config, timeout):
+        seen['size'] = image.size
+        return 'text'
+
+    monkeypatch.setattr(backend._pytesseract, 'image_to_string', image_to_string)
+    page = rendered_page()
+    assert backend.recognize(page) == 'text'
+    assert seen['size'] == (page['width'], page['height'])
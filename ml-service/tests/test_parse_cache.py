@@ -0,0 +1,50 @@
+"""
+Tests for the disk tier of the parse cache and its running size total
+"""
+
+import sqlite3
+
+from cache.parse_cache import ParseCache
+
+
+def disk_sum(path):
+    with sqlite3.connect(path) as db:
+        return db.execute('SELECT COALESCE(SUM(size), 0) FROM parse_cache').fetchone()[0]
+
+
+def test_size_total_follows_puts_replacements_and_evictions(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    cache = ParseCache(memory_items=0, disk_path=path, disk_max_bytes=10_000)
+
+    for n in range(5):
+        cache.put(f'key-{n}', {'text': f'resume {n}'})
+    cache.put('key-0', {'text': 'resume 0 parsed again with a longer result'})
+    assert cache.stats()['disk_bytes'] == disk_sum(path)
+    assert cache.stats()['disk_entries'] == 5
+
+    cache.disk_max_bytes = disk_sum(path) // 2
+    cache.put('key-5', {'text': 'resume 5'})
+    stats = cache.stats()
+    assert stats['evictions'] > 0
+    assert stats['disk_bytes'] == disk_sum(path) <= cache.disk_max_bytes
+    assert cache.get('key-5') == {'text': 'resume 5'}
+
+
+def test_size_total_is_initialised_from_an_existing_cache(tmp_path):
+    path = str(tmp_path / 'cache.db')
+    with sqlite3.connect(path) as db:
+        db.execute(
+            'CREATE TABLE parse_cache (key TEXT PRIMARY KEY, value BLOB NOT NULL,'
+            ' size INTEGER NOT NULL, last_access REAL NOT NULL)'
+        )
+        db.executemany(
+            'INSERT INTO parse_cache VALUES (?, ?, ?, ?)',
+            [('old-1', b'x' * 300, 300, 1.0), ('old-2', b'y' * 200, 200, 2.0)]
+        )
+
+    cache = ParseCache(memory_items=0, disk_path=path)
+    assert cache.stats()['disk_bytes'] == 500
+
+    # A second process opening the same file does not recount
+    ParseCache(memory_items=0, disk_path=path).put('new', {'a': 1})
+    assert cache.stats()['disk_bytes'] == disk_sum(path)
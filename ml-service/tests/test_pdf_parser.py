@@ -0,0 +1,53 @@
+"""
+Tests for PDF text extraction budgets
+"""
+
+import time
+
+import fitz
+import pytest
+
+from parsers import PDFParser
+
+
+def make_pdf(pages):
+    document = fitz.open()
+    for number in range(pages):
+        page = document.new_page()
+        page.insert_text(
+            (72, 72), f'Page {number + 1} of the resume with Python, Docker and Kafka ' * 2,
+            fontsize=8
+        )
+    try:
+        return document.tobytes()
+    finally:
+        document.close()
+
+
+@pytest.fixture
+def parser():
+    pdf_parser = PDFParser(ocr_workers=1, max_pages=3, max_render_pixels=0, time_budget=0)
+    pdf_parser.ocr_enabled = False
+    return pdf_parser
+
+
+def test_max_pages_truncates(parser):
+    details = parser.extract_text_details(make_pdf(5))
+    assert 'Page 3' in details['text'] and 'Page 4' not in details['text']
+    assert details['truncation'] == {'reasons': ['max_pages'], 'skipped_pages': [4, 5]}
+
+
+def test_within_limits_is_not_truncated(parser):
+    details = parser.extract_text_details(make_pdf(2))
+    assert details['truncation'] is None
+    assert details['page_count'] == 2
+
+
+def test_deadline_keeps_already_extracted_text(parser):
+    with parser.open(make_pdf(3)) as document:
+        document.page_text(0)
+        details = parser.extract_text_details(document, deadline=time.monotonic() - 1)
+
+    assert 'Page 1' in details['text']
+    assert 'Page 2' not in details['text']
+    assert details['truncation'] == {'reasons': ['deadline'], 'skipped_pages': [2, 3]}
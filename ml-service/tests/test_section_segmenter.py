@@ -0,0 +1,112 @@
+"""
+Tests for resume section segmentation
+"""
+
+from extractors.section_segmenter import SectionSegmenter
+
+
+RESUME = """Asha Rao
+Backend developer with 6 years of experience in Python and a degree in physics.
+
+Work Experience
+Senior Developer at Acme Corp
+Jan 2019 - Dec 2022
+Achievements
+Won the internal hackathon
+Education
+B.Tech in Computer Science
+Degree
+2014 - 2018
+Certifications & Licenses
+AWS Certified Solutions Architect
+Technical Skills
+Python, Kafka
+"""
+
+
+def section_lines(text, section):
+    return [line for line, _ in SectionSegmenter().segment(text).lines(section)]
+
+
+def test_sections_follow_headings():
+    assert section_lines(RESUME, 'experience') == [
+        'Senior Developer at Acme Corp', 'Jan 2019 - Dec 2022'
+    ]
+    assert section_lines(RESUME, 'education') == ['B.Tech in Computer Science', '2014 - 2018']
+    assert section_lines(RESUME, 'certifications') == ['AWS Certified Solutions Architect']
+
+
+def test_keywords_in_long_or_unanchored_lines_are_not_headings():
+    segmenter = SectionSegmenter()
+    assert segmenter.heading_keywords('5 years of experience') == set()
+    assert segmenter.heading_keywords(
+        'experience building distributed systems for payments at scale across teams'
+    ) == set()
+    assert segmenter.heading_keywords('• education:') == {'education'}
+    assert segmenter.heading_keywords('professional experience') == {'experience'}
+
+
+def test_sections_are_tracked_independently():
+    text = 'Education\nB.Sc Physics\nAchievements\nDean\'s list\nProjects\nParser'
+    # Achievements ends Experience but not Education, as before segmentation
+    assert section_lines(text, 'education') == ['B.Sc Physics', 'Achievements', "Dean's list"]
+
+
+def test_empty_text():
+    assert SectionSegmenter().segment('').spans == {}
+
+
+def tagged_sections(text):
+    return [tag for _, _, tag in SectionSegmenter().segment(text).tagged]
+
+
+def test_every_line_is_tagged():
+    segmenter = SectionSegmenter()
+    sections = segmenter.segment(RESUME)
+    assert len(sections.tagged) == len(RESUME.split('\n'))
+    assert [line for line, _ in sections.tagged_lines('header')] == [
+        'Asha Rao',
+        'Backend developer with 6 years of experience in Python and a degree in physics.',
+        '',
+    ]
+    assert [line for line, _ in sections.tagged_lines('skills')] == [
+        'Technical Skills', 'Python, Kafka', ''
+    ]
+    assert [line for line, _ in sections.tagged_lines('achievements')] == [
+        'Achievements', 'Won the internal hackathon'
+    ]
+    assert [line for line, _ in sections.tagged_lines('certifications')] == [
+        'Certifications & Licenses', 'AWS Certified Solutions Architect'
+    ]
+
+
+def test_tag_follows_first_keyword_of_heading():
+    text = 'Summary\nBuilds APIs\nProjects & Achievements\nParser\nWork History\nAcme'
+    assert tagged_sections(text) == [
+        'summary', 'summary', 'projects', 'projects', 'experience', 'experience'
+    ]
+
+
+def test_keyword_lines_that_used_to_switch_sections_do_not():
+    # Before segmentation, any line containing a keyword opened or closed a
+    # section; now only short lines starting with one are headings
+    text = (
+        'My Education\n'
+        'B.Sc Physics\n'
+        'Experience\n'
+        'Developer at Acme\n'
+        'Summary of skills and education gained on the job\n'
+        'Led the migration\n'
+        'Shipped two projects: parser, crawler\n'
+        'Skills\n'
+        'Python'
+    )
+    assert section_lines(text, 'education') == []
+    assert section_lines(text, 'experience') == [
+        'Developer at Acme',
+        'Summary of skills and education gained on the job',
+        'Led the migration',
+        'Shipped two projects: parser, crawler',
+    ]
+    assert tagged_sections(text)[:2] == ['header', 'header']
+    assert tagged_sections(text)[-1] == 'skills'
@@ -0,0 +1,47 @@
+"""
+Tests for word hashing and the hashing text encoder
+"""
+
+import threading
+
+import numpy as np
+
+from matching import text_encoder
+from matching.text_encoder import HashingTextEncoder, hash_words
+
+
+def test_hash_words_is_stable_and_cache_independent():
+    words = ['python', 'kafka', 'python']
+    first = hash_words(words)
+    text_encoder._word_hash_cache.clear()
+    assert np.array_equal(hash_words(words), first)
+    assert first[0] == first[2] != first[1]
+
+
+def test_hash_words_survives_concurrent_cache_clears(monkeypatch):
+    monkeypatch.setattr(text_encoder, '_WORD_HASH_CACHE_SIZE', 50)
+    expected = hash_words([f'word{n}' for n in range(200)])
+    errors = []
+
+    def worker(offset):
+        try:
+            for round_ in range(200):
+                words = [f'word{(offset + round_ + n) % 200}' for n in range(60)]
+                hashes = hash_words(words)
+                indexes = [(offset + round_ + n) % 200 for n in range(60)]
+                assert np.array_equal(hashes, expected[indexes])
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+
+def test_encoder_rows_are_normalized():
+    vectors = HashingTextEncoder(dim=64).encode(['python kafka services', ''])
+    assert vectors.shape == (2, 64)
+    assert np.isclose(np.linalg.norm(vectors[0]), 1.0)
@@ -0,0 +1,16 @@
+"""
+WSGI Entry Point
+Production entry for the ML service:
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+
+With preload_app the parser, extractor and compiled patterns are built
+once in the gunicorn master, and every worker inherits them on fork. Heavy
+modules (PyMuPDF, OCR) and the stored job postings are loaded by each
+worker's background warm-up, so workers answer /livez right away and
+/readyz once they are warm.
+"""
+
+from app import app
+
+__all__ = ['app']